@@ -65,6 +65,11 @@ class TestParseResumePath:
         with pytest.raises(ArtifactPathError, match="wiki-link contains empty path"):
             parse_resume_path("[[   ]]")
 
+    def test_partial_wiki_link_is_plain_path(self):
+        """Test that brackets not wrapping the whole value are left as a plain path."""
+        assert parse_resume_path("[[a/resume.pdf]] extra") == "[[a/resume.pdf]] extra"
+        assert parse_resume_path("x[[a/resume.pdf]]") == "x[[a/resume.pdf]]"
+
     def test_non_string_input(self):
         """Test that non-string input raises error."""
         with pytest.raises(ArtifactPathError, match="must be a string"):
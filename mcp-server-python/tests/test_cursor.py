@@ -83,6 +83,20 @@ class TestEncodeCursor:
         assert ": " not in json_str
         assert ", " not in json_str
 
+    def test_encode_matches_json_dumps(self):
+        """Test that the direct-format path emits the same bytes as json.dumps."""
+        cursor = encode_cursor("2026-02-04T03:47:36.966Z", 123)
+
+        expected = json.dumps({"captured_at": "2026-02-04T03:47:36.966Z", "id": 123})
+        assert base64.b64decode(cursor) == expected.replace(" ", "").encode("utf-8")
+
+    def test_encode_escapes_special_characters(self):
+        """Test that timestamps needing JSON escaping still round-trip."""
+        captured_at = 'odd"value\\with-é'
+        cursor = encode_cursor(captured_at, 7)
+
+        assert decode_cursor(cursor) == (captured_at, 7)
+
 
 class TestDecodeCursor:
     """Tests for cursor decoding."""
@@ -7,6 +7,8 @@ Tests guardrail validation for Resume Written status transition.
 import os
 
 from utils.finalize_validators import (
+    _sanitize_paths_in_message,
+    parse_tracker_for_validation,
     validate_tracker_exists,
     validate_resume_pdf_exists,
     validate_resume_tex_exists,
@@ -18,6 +20,28 @@ from utils.latex_guardrails import (
 )
 
 
+class TestSanitizePathsInMessage:
+    """Tests for _sanitize_paths_in_message helper."""
+
+    def test_absolute_path_reduced_to_basename(self):
+        """Test that absolute paths are redacted to their basename."""
+        message = "Tracker file not found: /home/user/trackers/a.md"
+
+        assert _sanitize_paths_in_message(message) == "Tracker file not found: a.md"
+
+    def test_punctuation_around_path_preserved(self):
+        """Test that surrounding punctuation and trailing period are kept."""
+        message = 'Path is not a file ("/tmp/x/tracker.md").'
+
+        assert _sanitize_paths_in_message(message) == 'Path is not a file ("tracker.md").'
+
+    def test_relative_paths_and_urls_untouched(self):
+        """Test that relative paths and URLs are left readable."""
+        message = "See trackers/a.md or https://example.com/jobs/1"
+
+        assert _sanitize_paths_in_message(message) == message
+
+
 class TestValidateTrackerExists:
     """Tests for validate_tracker_exists function."""
 
@@ -102,6 +126,23 @@ Content here
         assert is_valid is False
         assert "not a file" in error.lower()
 
+    def test_parse_for_validation_returns_parsed_tracker(self, tmp_path):
+        """Test that the parse result is returned alongside a passing validation."""
+        tracker_path = tmp_path / "tracker.md"
+        tracker_path.write_text("---\nstatus: Reviewed\ncompany: Amazon\n---\n")
+
+        parsed, error = parse_tracker_for_validation(str(tracker_path))
+
+        assert error is None
+        assert parsed["frontmatter"]["company"] == "Amazon"
+
+    def test_parse_for_validation_missing_file(self, tmp_path):
+        """Test that a missing tracker yields no parse and an error message."""
+        parsed, error = parse_tracker_for_validation(str(tmp_path / "missing.md"))
+
+        assert parsed is None
+        assert "not found" in error.lower()
+
 
 class TestValidateResumePdfExists:
     """Tests for validate_resume_pdf_exists function."""
@@ -378,6 +419,19 @@ class TestValidateResumeWrittenGuardrails:
         assert is_valid is False
         assert error == "resume.tex does not exist"
 
+    def test_tex_directory_fails(self, tmp_path):
+        """Test that validation fails when TEX path is a directory."""
+        pdf_path = tmp_path / "resume.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4\nContent")
+
+        tex_path = tmp_path / "resume.tex"
+        tex_path.mkdir()
+
+        is_valid, error = validate_resume_written_guardrails(str(pdf_path), str(tex_path))
+
+        assert is_valid is False
+        assert error == "resume.tex path is not a file"
+
     def test_tex_with_placeholders_fails(self, tmp_path):
         """Test that validation fails when TEX contains placeholders."""
         pdf_path = tmp_path / "resume.pdf"
@@ -713,11 +713,11 @@ Existing legacy tracker.
         original_plan_tracker = tool_module.plan_tracker
         call_count = {"n": 0}
 
-        def flaky_plan_tracker(job, trackers_dir_arg):
+        def flaky_plan_tracker(job, trackers_dir_arg, *args):
             call_count["n"] += 1
             if call_count["n"] == 2:
                 raise RuntimeError("Simulated planner hard failure")
-            return original_plan_tracker(job, trackers_dir_arg)
+            return original_plan_tracker(job, trackers_dir_arg, *args)
 
         monkeypatch.setattr(tool_module, "plan_tracker", flaky_plan_tracker)
 
@@ -11,12 +11,20 @@ import pandas as pd
 import pytest
 
 from utils.jobspy_adapter import (
+    _DNS_CACHE,
+    clear_dns_cache,
     scrape_jobs_for_term,
     preflight_dns_check,
     PreflightDNSError,
     ScrapeProviderError,
 )
 
+# Minimal getaddrinfo() result: one IPv4 and one IPv6 stream address.
+_ADDRINFO = [
+    (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("1.2.3.4", 0)),
+    (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2001:db8::1", 0, 0, 0)),
+]
+
 
 class TestScrapeJobsForTerm:
     """Tests for scrape_jobs_for_term function."""
@@ -238,16 +246,22 @@ class TestScrapeJobsForTerm:
 class TestPreflightDNSCheck:
     """Tests for preflight_dns_check function."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_dns_cache(self):
+        clear_dns_cache()
+        yield
+        clear_dns_cache()
+
     def test_successful_dns_resolution(self):
         """Test that successful DNS resolution returns without error."""
-        with patch("utils.jobspy_adapter.socket.gethostbyname", return_value="1.2.3.4"):
+        with patch("utils.jobspy_adapter.socket.getaddrinfo", return_value=_ADDRINFO):
             # Should not raise any exception
             preflight_dns_check("www.linkedin.com")
 
     def test_dns_failure_raises_preflight_error(self):
         """Test that DNS failure after retries raises PreflightDNSError."""
         with patch(
-            "utils.jobspy_adapter.socket.gethostbyname",
+            "utils.jobspy_adapter.socket.getaddrinfo",
             side_effect=socket.gaierror("Name resolution failed"),
         ):
             with pytest.raises(PreflightDNSError) as exc_info:
@@ -263,9 +277,9 @@ class TestPreflightDNSCheck:
 
     def test_retry_count_respected(self):
         """Test that retry_count parameter is respected."""
-        mock_gethostbyname = MagicMock(side_effect=socket.gaierror("Failed"))
+        mock_getaddrinfo = MagicMock(side_effect=socket.gaierror("Failed"))
 
-        with patch("utils.jobspy_adapter.socket.gethostbyname", mock_gethostbyname):
+        with patch("utils.jobspy_adapter.socket.getaddrinfo", mock_getaddrinfo):
             with patch("utils.jobspy_adapter.time.sleep"):
                 with pytest.raises(PreflightDNSError):
                     preflight_dns_check(
@@ -276,14 +290,14 @@ class TestPreflightDNSCheck:
                     )
 
                 # Should be called exactly retry_count times
-                assert mock_gethostbyname.call_count == 5
+                assert mock_getaddrinfo.call_count == 5
 
     def test_retry_with_exponential_backoff(self):
         """Test that retry uses exponential backoff for sleep duration."""
         mock_sleep = MagicMock()
 
         with patch(
-            "utils.jobspy_adapter.socket.gethostbyname", side_effect=socket.gaierror("Failed")
+            "utils.jobspy_adapter.socket.getaddrinfo", side_effect=socket.gaierror("Failed")
         ):
             with patch("utils.jobspy_adapter.time.sleep", mock_sleep):
                 with pytest.raises(PreflightDNSError):
@@ -307,14 +321,14 @@ class TestPreflightDNSCheck:
         """Test that function succeeds if DNS resolves on a retry."""
         call_count = 0
 
-        def mock_gethostbyname(_host):
+        def mock_getaddrinfo(_host, *_args, **_kwargs):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
                 raise socket.gaierror("First attempt fails")
-            return "1.2.3.4"
+            return _ADDRINFO
 
-        with patch("utils.jobspy_adapter.socket.gethostbyname", side_effect=mock_gethostbyname):
+        with patch("utils.jobspy_adapter.socket.getaddrinfo", side_effect=mock_getaddrinfo):
             with patch("utils.jobspy_adapter.time.sleep"):
                 # Should succeed without raising
                 preflight_dns_check(
@@ -330,14 +344,14 @@ class TestPreflightDNSCheck:
         """Test that function succeeds if DNS resolves on the last retry."""
         call_count = 0
 
-        def mock_gethostbyname(_host):
+        def mock_getaddrinfo(_host, *_args, **_kwargs):
             nonlocal call_count
             call_count += 1
             if call_count < 3:
                 raise socket.gaierror("Attempt fails")
-            return "1.2.3.4"
+            return _ADDRINFO
 
-        with patch("utils.jobspy_adapter.socket.gethostbyname", side_effect=mock_gethostbyname):
+        with patch("utils.jobspy_adapter.socket.getaddrinfo", side_effect=mock_getaddrinfo):
             with patch("utils.jobspy_adapter.time.sleep"):
                 # Should succeed on the 3rd attempt
                 preflight_dns_check(
@@ -349,11 +363,11 @@ class TestPreflightDNSCheck:
 
         assert call_count == 3
 
-    def test_handles_socket_herror(self):
-        """Test that socket.herror is handled correctly."""
+    def test_handles_socket_gaierror(self):
+        """Test that socket.gaierror is handled correctly."""
         with patch(
-            "utils.jobspy_adapter.socket.gethostbyname",
-            side_effect=socket.herror("Host error"),
+            "utils.jobspy_adapter.socket.getaddrinfo",
+            side_effect=socket.gaierror(socket.EAI_NONAME, "Name or service not known"),
         ):
             with pytest.raises(PreflightDNSError):
                 preflight_dns_check(
@@ -366,7 +380,7 @@ class TestPreflightDNSCheck:
     def test_handles_os_error(self):
         """Test that OSError is handled correctly."""
         with patch(
-            "utils.jobspy_adapter.socket.gethostbyname",
+            "utils.jobspy_adapter.socket.getaddrinfo",
             side_effect=OSError("Network unreachable"),
         ):
             with pytest.raises(PreflightDNSError):
@@ -379,7 +393,7 @@ class TestPreflightDNSCheck:
 
     def test_default_parameters(self):
         """Test that default parameters work correctly."""
-        with patch("utils.jobspy_adapter.socket.gethostbyname", return_value="1.2.3.4"):
+        with patch("utils.jobspy_adapter.socket.getaddrinfo", return_value=_ADDRINFO):
             # Should use defaults: retry_count=3, retry_sleep_seconds=30.0, retry_backoff=2.0
             preflight_dns_check("www.linkedin.com")
 
@@ -388,7 +402,7 @@ class TestPreflightDNSCheck:
         mock_sleep = MagicMock()
 
         with patch(
-            "utils.jobspy_adapter.socket.gethostbyname", side_effect=socket.gaierror("Failed")
+            "utils.jobspy_adapter.socket.getaddrinfo", side_effect=socket.gaierror("Failed")
         ):
             with patch("utils.jobspy_adapter.time.sleep", mock_sleep):
                 with pytest.raises(PreflightDNSError):
@@ -406,7 +420,7 @@ class TestPreflightDNSCheck:
     def test_error_message_includes_host_and_retry_count(self):
         """Test that error message includes host and retry count."""
         with patch(
-            "utils.jobspy_adapter.socket.gethostbyname",
+            "utils.jobspy_adapter.socket.getaddrinfo",
             side_effect=socket.gaierror("Failed"),
         ):
             with pytest.raises(PreflightDNSError) as exc_info:
@@ -420,3 +434,67 @@ class TestPreflightDNSCheck:
             error_message = str(exc_info.value)
             assert "example.com" in error_message
             assert "7 attempts" in error_message
+
+    def test_default_schedule_uses_configured_backoff(self):
+        """Test that without fast retries every sleep follows the backoff."""
+        mock_sleep = MagicMock()
+
+        with patch(
+            "utils.jobspy_adapter.socket.getaddrinfo", side_effect=socket.gaierror("Failed")
+        ):
+            with patch("utils.jobspy_adapter.time.sleep", mock_sleep):
+                with pytest.raises(PreflightDNSError):
+                    preflight_dns_check("test.host")
+
+        sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
+        assert sleep_calls == [30.0, 60.0]
+
+    def test_successful_resolution_is_cached(self):
+        """Test that a repeat check within the TTL skips the resolver."""
+        mock_getaddrinfo = MagicMock(return_value=_ADDRINFO)
+
+        with patch("utils.jobspy_adapter.socket.getaddrinfo", mock_getaddrinfo):
+            preflight_dns_check("www.linkedin.com")
+            preflight_dns_check("www.linkedin.com")
+
+        assert mock_getaddrinfo.call_count == 1
+
+    def test_expired_cache_entry_resolves_again(self):
+        """Test that entries past their TTL trigger a fresh lookup."""
+        mock_getaddrinfo = MagicMock(return_value=_ADDRINFO)
+
+        with patch("utils.jobspy_adapter.socket.getaddrinfo", mock_getaddrinfo):
+            with patch("utils.jobspy_adapter.time.monotonic", side_effect=[0.0, 11.0, 11.0]):
+                preflight_dns_check("www.linkedin.com", cache_ttl_seconds=10.0)
+                preflight_dns_check("www.linkedin.com", cache_ttl_seconds=10.0)
+
+        assert mock_getaddrinfo.call_count == 2
+
+    def test_default_ttl_does_not_mask_network_loss(self):
+        """Test that a host resolved seconds ago is checked again."""
+        mock_getaddrinfo = MagicMock(side_effect=[_ADDRINFO, socket.gaierror("Network down")])
+
+        with patch("utils.jobspy_adapter.socket.getaddrinfo", mock_getaddrinfo):
+            with patch("utils.jobspy_adapter.time.monotonic", side_effect=[0.0, 6.0]):
+                preflight_dns_check("www.linkedin.com")
+                with pytest.raises(PreflightDNSError):
+                    preflight_dns_check("www.linkedin.com", retry_count=1)
+
+        assert mock_getaddrinfo.call_count == 2
+
+    def test_cache_records_all_address_families(self):
+        """Test that both IPv4 and IPv6 addresses are cached."""
+        with patch("utils.jobspy_adapter.socket.getaddrinfo", return_value=_ADDRINFO):
+            preflight_dns_check("www.linkedin.com")
+
+        assert _DNS_CACHE["www.linkedin.com"][0] == ("1.2.3.4", "2001:db8::1")
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that cache_ttl_seconds=0 always resolves."""
+        mock_getaddrinfo = MagicMock(return_value=_ADDRINFO)
+
+        with patch("utils.jobspy_adapter.socket.getaddrinfo", mock_getaddrinfo):
+            preflight_dns_check("www.linkedin.com", cache_ttl_seconds=0)
+            preflight_dns_check("www.linkedin.com", cache_ttl_seconds=0)
+
+        assert mock_getaddrinfo.call_count == 2
@@ -7,14 +7,59 @@ Tests the LaTeX compilation functionality including:
 - PDF verification
 """
 
+import io
 import pytest
-from unittest.mock import patch, MagicMock
+from pathlib import Path
+from unittest.mock import patch
+import os
 import subprocess
-
-from utils.latex_compiler import compile_resume_pdf, verify_pdf_exists
+import sys
+import threading
+
+from utils.latex_compiler import (
+    MAX_ERROR_LINES,
+    OUTPUT_HEAD_CHARS,
+    _stream_pdflatex,
+    compile_resume_pdf,
+    verify_pdf_exists,
+)
 from models.errors import ToolError, ErrorCode
 
 
+class _FakePdflatex:
+    """Stand-in for a pdflatex Popen process with canned output."""
+
+    def __init__(self, returncode, stdout):
+        self.returncode = None
+        self._final_returncode = returncode
+        self.stdout = io.StringIO(stdout)
+        self.killed = False
+
+    def kill(self):
+        self.killed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.returncode = self._final_returncode
+
+
+def _fake_pdflatex(returncode=0, stdout="", pdf=None):
+    """Build a subprocess.Popen side effect; writes the PDF into -output-directory."""
+
+    def popen(cmd, cwd, **kwargs):
+        if pdf is not None:
+            output_dir = next(
+                arg.split("=", 1)[1] for arg in cmd if arg.startswith("-output-directory=")
+            )
+            (Path(cwd) / output_dir / "resume.pdf").write_text(pdf)
+            (Path(cwd) / output_dir / "resume.aux").write_text("aux")
+        return _FakePdflatex(returncode, stdout)
+
+    return popen
+
+
 class TestCompileResumePdf:
     """Tests for compile_resume_pdf function."""
 
@@ -76,8 +121,8 @@ WORK-BULLET-POINT-PLACEHOLDER
         assert "placeholder tokens" in error.message
         assert "BULLET-POINT" in error.message
 
-    @patch("subprocess.run")
-    def test_successful_compilation(self, mock_run, tmp_path):
+    @patch("subprocess.Popen")
+    def test_successful_compilation(self, mock_popen, tmp_path):
         """Test successful PDF compilation with clean resume.tex."""
         # Create clean resume.tex
         tex_path = tmp_path / "resume.tex"
@@ -89,29 +134,26 @@ Worked on machine learning projects.
 \\end{document}
 """)
 
-        # Mock successful pdflatex execution
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        # Create the PDF file that pdflatex would create
-        pdf_path = tmp_path / "resume.pdf"
-        pdf_path.write_text("fake pdf content")
+        # Mock successful pdflatex execution that writes the PDF
+        mock_popen.side_effect = _fake_pdflatex(pdf="fake pdf content")
 
         # Should succeed
         success, error = compile_resume_pdf(str(tex_path))
 
         assert success is True
         assert error is None
+        assert (tmp_path / "resume.pdf").read_text() == "fake pdf content"
 
         # Verify pdflatex was called correctly
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
+        mock_popen.assert_called_once()
+        call_args = mock_popen.call_args
         assert call_args[0][0][0] == "pdflatex"
         assert "-interaction=nonstopmode" in call_args[0][0]
         assert "-halt-on-error" in call_args[0][0]
         assert call_args[1]["cwd"] == tmp_path
 
-    @patch("subprocess.run")
-    def test_compilation_failure_raises_compile_error(self, mock_run, tmp_path):
+    @patch("subprocess.Popen")
+    def test_compilation_failure_raises_compile_error(self, mock_popen, tmp_path):
         """Test that pdflatex compilation failure raises COMPILE_ERROR."""
         # Create clean resume.tex (no placeholders)
         tex_path = tmp_path / "resume.tex"
@@ -124,8 +166,8 @@ Valid content.
 """)
 
         # Mock failed pdflatex execution
-        mock_run.return_value = MagicMock(
-            returncode=1, stdout="! LaTeX Error: Missing \\begin{document}.", stderr=""
+        mock_popen.side_effect = _fake_pdflatex(
+            returncode=1, stdout="! LaTeX Error: Missing \\begin{document}.\n"
         )
 
         with pytest.raises(ToolError) as exc_info:
@@ -135,8 +177,8 @@ Valid content.
         assert error.code == ErrorCode.COMPILE_ERROR
         assert "pdflatex compilation failed" in error.message
 
-    @patch("subprocess.run")
-    def test_compilation_timeout_raises_compile_error(self, mock_run, tmp_path):
+    @patch("subprocess.Popen")
+    def test_compilation_timeout_raises_compile_error(self, mock_popen, tmp_path):
         """Test that pdflatex timeout raises COMPILE_ERROR."""
         tex_path = tmp_path / "resume.tex"
         tex_path.write_text("""
@@ -147,7 +189,7 @@ Valid content.
 """)
 
         # Mock timeout
-        mock_run.side_effect = subprocess.TimeoutExpired("pdflatex", 30)
+        mock_popen.side_effect = subprocess.TimeoutExpired("pdflatex", 30)
 
         with pytest.raises(ToolError) as exc_info:
             compile_resume_pdf(str(tex_path), timeout=30)
@@ -156,8 +198,8 @@ Valid content.
         assert error.code == ErrorCode.COMPILE_ERROR
         assert "timed out" in error.message
 
-    @patch("subprocess.run")
-    def test_pdflatex_command_not_found_raises_compile_error(self, mock_run, tmp_path):
+    @patch("subprocess.Popen")
+    def test_pdflatex_command_not_found_raises_compile_error(self, mock_popen, tmp_path):
         """Test that missing pdflatex command raises COMPILE_ERROR."""
         tex_path = tmp_path / "resume.tex"
         tex_path.write_text("""
@@ -168,7 +210,7 @@ Valid content.
 """)
 
         # Mock command not found
-        mock_run.side_effect = FileNotFoundError("pdflatex not found")
+        mock_popen.side_effect = FileNotFoundError("pdflatex not found")
 
         with pytest.raises(ToolError) as exc_info:
             compile_resume_pdf(str(tex_path))
@@ -177,8 +219,8 @@ Valid content.
         assert error.code == ErrorCode.COMPILE_ERROR
         assert "pdflatex command not found" in error.message
 
-    @patch("subprocess.run")
-    def test_pdf_not_created_raises_compile_error(self, mock_run, tmp_path):
+    @patch("subprocess.Popen")
+    def test_pdf_not_created_raises_compile_error(self, mock_popen, tmp_path):
         """Test that missing PDF after successful pdflatex raises COMPILE_ERROR."""
         tex_path = tmp_path / "resume.tex"
         tex_path.write_text("""
@@ -189,7 +231,7 @@ Valid content.
 """)
 
         # Mock successful pdflatex but don't create PDF
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        mock_popen.side_effect = _fake_pdflatex()
 
         with pytest.raises(ToolError) as exc_info:
             compile_resume_pdf(str(tex_path))
@@ -198,8 +240,8 @@ Valid content.
         assert error.code == ErrorCode.COMPILE_ERROR
         assert "resume.pdf was not created" in error.message
 
-    @patch("subprocess.run")
-    def test_empty_pdf_raises_compile_error(self, mock_run, tmp_path):
+    @patch("subprocess.Popen")
+    def test_empty_pdf_raises_compile_error(self, mock_popen, tmp_path):
         """Test that empty PDF (0 bytes) raises COMPILE_ERROR."""
         tex_path = tmp_path / "resume.tex"
         tex_path.write_text("""
@@ -209,12 +251,8 @@ Valid content.
 \\end{document}
 """)
 
-        # Mock successful pdflatex
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        # Create empty PDF
-        pdf_path = tmp_path / "resume.pdf"
-        pdf_path.write_text("")
+        # Mock successful pdflatex that writes an empty PDF
+        mock_popen.side_effect = _fake_pdflatex(pdf="")
 
         with pytest.raises(ToolError) as exc_info:
             compile_resume_pdf(str(tex_path))
@@ -223,8 +261,8 @@ Valid content.
         assert error.code == ErrorCode.COMPILE_ERROR
         assert "empty (0 bytes)" in error.message
 
-    @patch("subprocess.run")
-    def test_custom_pdflatex_command(self, mock_run, tmp_path):
+    @patch("subprocess.Popen")
+    def test_custom_pdflatex_command(self, mock_popen, tmp_path):
         """Test that custom pdflatex command is used."""
         tex_path = tmp_path / "resume.tex"
         tex_path.write_text("""
@@ -234,16 +272,134 @@ Valid content.
 \\end{document}
 """)
 
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-        pdf_path = tmp_path / "resume.pdf"
-        pdf_path.write_text("fake pdf")
+        mock_popen.side_effect = _fake_pdflatex(pdf="fake pdf")
 
         compile_resume_pdf(str(tex_path), pdflatex_cmd="custom-pdflatex")
 
         # Verify custom command was used
-        call_args = mock_run.call_args
+        call_args = mock_popen.call_args
         assert call_args[0][0][0] == "custom-pdflatex"
 
+    @patch("subprocess.Popen")
+    def test_build_artifacts_stay_out_of_workspace(self, mock_popen, tmp_path):
+        """Test that aux files are built in a private directory that is removed."""
+        tex_path = tmp_path / "resume.tex"
+        tex_path.write_text("\\begin{document}\nValid content.\n\\end{document}\n")
+        mock_popen.side_effect = _fake_pdflatex(pdf="fake pdf")
+
+        compile_resume_pdf(str(tex_path))
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["resume.pdf", "resume.tex"]
+
+    @patch("subprocess.Popen")
+    def test_stale_pdf_does_not_count_as_output(self, mock_popen, tmp_path):
+        """Test that a PDF left by an earlier run is not mistaken for new output."""
+        tex_path = tmp_path / "resume.tex"
+        tex_path.write_text("\\begin{document}\nValid content.\n\\end{document}\n")
+        (tmp_path / "resume.pdf").write_text("old pdf")
+        mock_popen.side_effect = _fake_pdflatex()
+
+        with pytest.raises(ToolError) as exc_info:
+            compile_resume_pdf(str(tex_path))
+
+        assert "resume.pdf was not created" in exc_info.value.message
+        assert (tmp_path / "resume.pdf").read_text() == "old pdf"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["resume.pdf", "resume.tex"]
+
+
+class TestStreamPdflatex:
+    """Tests for the bounded pdflatex log reader."""
+
+    @patch("subprocess.Popen")
+    def test_keeps_first_error_lines_only(self, mock_popen):
+        """Test that at most MAX_ERROR_LINES error lines are kept."""
+        log = "".join(f"! Error {i}\nfiller line\n" for i in range(MAX_ERROR_LINES + 3))
+        mock_popen.side_effect = _fake_pdflatex(returncode=1, stdout=log)
+
+        returncode, error_lines, _ = _stream_pdflatex(["pdflatex"], cwd=".", timeout=30)
+
+        assert returncode == 1
+        assert error_lines == [f"! Error {i}" for i in range(MAX_ERROR_LINES)]
+
+    @patch("subprocess.Popen")
+    def test_output_head_is_bounded(self, mock_popen):
+        """Test that only the start of a long log is retained."""
+        log = "x" * 80 + "\n"
+        mock_popen.side_effect = _fake_pdflatex(returncode=1, stdout=log * 1000)
+
+        _, error_lines, output_head = _stream_pdflatex(["pdflatex"], cwd=".", timeout=30)
+
+        assert error_lines == []
+        assert output_head == (log * 1000)[:OUTPUT_HEAD_CHARS]
+
+    @patch("subprocess.Popen")
+    def test_output_head_used_when_no_error_lines(self, mock_popen, tmp_path):
+        """Test that the log head is reported when no line looks like an error."""
+        tex_path = tmp_path / "resume.tex"
+        tex_path.write_text("\\begin{document}\nValid content.\n\\end{document}\n")
+        mock_popen.side_effect = _fake_pdflatex(returncode=1, stdout="Emergency stop.\n")
+
+        with pytest.raises(ToolError) as exc_info:
+            compile_resume_pdf(str(tex_path))
+
+        assert exc_info.value.message == "pdflatex compilation failed: Emergency stop.\n"
+
+    @patch("subprocess.Popen")
+    def test_hung_process_is_killed_on_timeout(self, mock_popen):
+        """Test that a process producing no output is killed at the deadline."""
+        killed = threading.Event()
+
+        class _HungPdflatex(_FakePdflatex):
+            def __init__(self):
+                super().__init__(returncode=-9, stdout="")
+                self.stdout = self._lines()
+
+            def _lines(self):
+                killed.wait(5)
+                return
+                yield
+
+            def kill(self):
+                killed.set()
+
+        mock_popen.side_effect = lambda cmd, cwd, **kwargs: _HungPdflatex()
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            _stream_pdflatex(["pdflatex"], cwd=".", timeout=0.05)
+
+        assert killed.is_set()
+
+    @pytest.mark.skipif(os.name == "nt", reason="uses a POSIX shell script")
+    def test_real_process_output_is_streamed(self, tmp_path):
+        """Test the reader against a real child process."""
+        script = tmp_path / "fake-pdflatex"
+        script.write_text(
+            "#!/bin/sh\n"
+            "i=0\n"
+            'while [ $i -lt 2000 ]; do echo "log line $i"; i=$((i+1)); done\n'
+            'echo "! Undefined control sequence." 1>&2\n'
+            "exit 1\n"
+        )
+        script.chmod(0o755)
+
+        returncode, error_lines, output_head = _stream_pdflatex(
+            [str(script)], cwd=tmp_path, timeout=30
+        )
+
+        assert returncode == 1
+        assert error_lines == ["! Undefined control sequence."]
+        assert output_head.startswith("log line 0\n")
+        assert len(output_head) == OUTPUT_HEAD_CHARS
+
+    def test_real_process_timeout(self, tmp_path):
+        """Test that a real long-running child is killed at the deadline."""
+        with pytest.raises(subprocess.TimeoutExpired):
+            _stream_pdflatex(
+                [sys.executable, "-c", "import time; time.sleep(30)"],
+                cwd=tmp_path,
+                timeout=0.2,
+            )
+
 
 class TestVerifyPdfExists:
     """Tests for verify_pdf_exists function."""
@@ -7,6 +7,7 @@ Tests placeholder scanning functionality for LaTeX resume files.
 import os
 
 from utils.latex_guardrails import (
+    scan_tex_bytes_for_placeholders,
     scan_tex_for_placeholders,
     get_placeholder_tokens,
     PLACEHOLDER_TOKENS,
@@ -141,6 +142,17 @@ Real project description here.
             # Restore permissions for cleanup
             os.chmod(tex_path, 0o644)
 
+    def test_large_clean_file_passes(self, tmp_path):
+        """Test that a large file without markers passes."""
+        tex_path = tmp_path / "resume.tex"
+        tex_path.write_bytes(b"\\item Shipped a feature.\n" * 20000)
+
+        is_valid, error, found_tokens = scan_tex_for_placeholders(str(tex_path))
+
+        assert is_valid is True
+        assert error is None
+        assert found_tokens == []
+
     def test_nonexistent_file_fails(self, tmp_path):
         """Test that nonexistent file returns error."""
         tex_path = tmp_path / "nonexistent.tex"
@@ -152,6 +164,37 @@ Real project description here.
         assert found_tokens == []
 
 
+class TestScanTexBytesForPlaceholders:
+    """Tests for scan_tex_bytes_for_placeholders function."""
+
+    def test_clean_bytes_pass(self):
+        """Test that content without placeholders passes validation."""
+        is_valid, error, found_tokens = scan_tex_bytes_for_placeholders(
+            b"\\section{Experience}\nShipped a feature.\n"
+        )
+
+        assert is_valid is True
+        assert error is None
+        assert found_tokens == []
+
+    def test_bytes_with_placeholder_fail(self):
+        """Test that content with BULLET-POINT marker fails validation."""
+        is_valid, error, found_tokens = scan_tex_bytes_for_placeholders(
+            b"\\item WORK-BULLET-POINT-1\n"
+        )
+
+        assert is_valid is False
+        assert error == "resume.tex contains placeholder tokens: BULLET-POINT"
+        assert found_tokens == ["BULLET-POINT"]
+
+    def test_non_utf8_bytes_are_scanned(self):
+        """Test that undecodable bytes do not prevent detection."""
+        is_valid, _, found_tokens = scan_tex_bytes_for_placeholders(b"\xff\xfeBULLET-POINT")
+
+        assert is_valid is False
+        assert found_tokens == ["BULLET-POINT"]
+
+
 class TestGetPlaceholderTokens:
     """Tests for get_placeholder_tokens function."""
 
@@ -150,6 +150,17 @@ class TestPaginateResults:
         assert has_more is False
         assert next_cursor is None
 
+    def test_last_page_is_a_copy(self):
+        """Test that the last page does not alias the input list."""
+        rows = [{"id": i, "captured_at": f"2026-02-04T03:47:{i:02d}.000Z"} for i in range(50)]
+
+        page, has_more, next_cursor = paginate_results(rows, 50)
+
+        assert page == rows
+        assert page is not rows
+        assert has_more is False
+        assert next_cursor is None
+
     def test_paginate_results_less_than_limit(self):
         """Test pagination when results are less than limit."""
         rows = [{"id": i, "captured_at": f"2026-02-04T03:47:{i:02d}.000Z"} for i in range(25)]
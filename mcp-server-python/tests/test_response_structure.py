@@ -11,9 +11,18 @@ This test demonstrates that task 6.2 requirements are fully met:
 import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from config import config
 from tools.scrape_jobs import scrape_jobs
 
 
+@pytest.fixture(autouse=True)
+def _capture_dir_in_tmp(tmp_path, monkeypatch):
+    """Keep default capture files out of the real data/capture directory."""
+    monkeypatch.setattr(config, "scrape_capture_dir", str(tmp_path / "capture"))
+
+
 def test_complete_response_structure():
     """
     Verify the complete structured response payload meets all requirements.
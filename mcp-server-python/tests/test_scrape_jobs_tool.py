@@ -8,6 +8,7 @@ capture, and database insertion.
 from unittest.mock import MagicMock, patch
 import pytest
 
+from config import config
 from models.errors import ToolError, ErrorCode
 from tools.scrape_jobs import (
     scrape_jobs,
@@ -20,6 +21,12 @@ from tools.scrape_jobs import (
 from utils.jobspy_adapter import PreflightDNSError
 
 
+@pytest.fixture(autouse=True)
+def _capture_dir_in_tmp(tmp_path, monkeypatch):
+    """Keep default capture files out of the real data/capture directory."""
+    monkeypatch.setattr(config, "scrape_capture_dir", str(tmp_path / "capture"))
+
+
 class TestGenerateRunId:
     """Tests for generate_run_id function."""
 
@@ -5,10 +5,13 @@ Tests record normalization, field mapping, filtering, and timestamp handling.
 """
 
 import json
+import uuid
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 from utils.scrape_normalizer import (
     JOB_URL_ID_RE,
+    _batch_uuids,
     clean_record,
     filter_records,
     normalize_and_filter,
@@ -83,6 +86,16 @@ class TestParseJobId:
         url = "https://www.linkedin.com/jobs/view/1111111111/apply"
         assert parse_job_id(url, None) == "1111111111"
 
+    def test_uses_later_marker_when_first_has_no_digits(self):
+        """Test that a non-numeric first marker does not hide a later job ID."""
+        url = "https://www.linkedin.com/jobs/view/search?next=/jobs/view/2222222222"
+        assert parse_job_id(url, "source-123") == "2222222222"
+
+    def test_fallback_when_marker_has_no_digits(self):
+        """Test fallback when the LinkedIn marker is not followed by an ID."""
+        url = "https://www.linkedin.com/jobs/view/abc"
+        assert parse_job_id(url, "source-123") == "source-123"
+
     def test_fallback_when_no_match(self):
         """Test fallback to source ID when URL doesn't match pattern."""
         url = "https://example.com/job/abc"
@@ -156,6 +169,20 @@ class TestParseCapturedAt:
         dt = datetime.fromisoformat(result)
         assert dt.tzinfo is not None
 
+    def test_uses_provided_fallback(self):
+        """Test that a precomputed fallback replaces the clock read."""
+        fallback = "2026-02-04T00:00:00+00:00"
+
+        assert parse_captured_at(None, fallback) == fallback
+        assert parse_captured_at("invalid-date", fallback) == fallback
+        assert parse_captured_at(12345, fallback) == fallback
+        assert parse_captured_at("2026-01-02T03:04:05Z", fallback) == "2026-01-02T03:04:05+00:00"
+
+    def test_preserves_fractional_seconds(self):
+        """Test that sub-second precision survives normalization."""
+        result = parse_captured_at("2026-02-04T03:47:00.250Z")
+        assert result == "2026-02-04T03:47:00.250000+00:00"
+
 
 class TestCleanRecord:
     """Tests for record cleaning and field mapping."""
@@ -275,6 +302,34 @@ class TestCleanRecord:
         assert len(result1["id"]) == 36
         assert result1["id"].count("-") == 4
 
+    def test_uses_provided_record_id(self):
+        """Test that a pre-generated id is used as-is."""
+        raw = {"job_url": "https://example.com/job/123"}
+
+        result = clean_record(raw, record_id="preset-id")
+
+        assert result["id"] == "preset-id"
+
+
+class TestBatchUuids:
+    """Tests for batched UUID generation."""
+
+    def test_generates_requested_count(self):
+        """Test that the requested number of ids is produced."""
+        assert _batch_uuids(0) == []
+        assert len(_batch_uuids(5)) == 5
+
+    def test_ids_are_unique_uuid4(self):
+        """Test that batched ids are distinct, well-formed UUID4 strings."""
+        ids = _batch_uuids(100)
+
+        assert len(set(ids)) == 100
+        for value in ids:
+            parsed = uuid.UUID(value)
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == value
+
 
 class TestFilterRecords:
     """Tests for record filtering."""
@@ -349,6 +404,45 @@ class TestFilterRecords:
 class TestNormalizeAndFilter:
     """Tests for combined normalize and filter operation."""
 
+    def test_filtered_records_skip_full_cleaning(self):
+        """Test that records dropped by the filters are never fully cleaned."""
+        raw_records = [
+            {"job_url": "", "description": "No URL"},
+            {"job_url": "https://example.com/job/1", "description": "  "},
+            {"job_url": "https://example.com/job/2", "description": "Kept"},
+        ]
+
+        with patch(
+            "utils.scrape_normalizer.parse_captured_at", wraps=parse_captured_at
+        ) as mock_parse:
+            filtered, skip_counts = normalize_and_filter(raw_records)
+
+        assert [record["url"] for record in filtered] == ["https://example.com/job/2"]
+        assert skip_counts == {"skipped_no_url": 1, "skipped_no_description": 1}
+        assert mock_parse.call_count == 1
+
+    def test_fallback_timestamp_shared_across_batch(self):
+        """Test that records without a usable date share one fallback timestamp."""
+        raw_records = [
+            {"job_url": f"https://example.com/job/{i}", "description": "Desc"} for i in range(5)
+        ]
+
+        filtered, _ = normalize_and_filter(raw_records)
+
+        assert len({record["captured_at"] for record in filtered}) == 1
+
+    def test_assigns_distinct_uuid4_ids(self):
+        """Test that each cleaned record gets its own UUID4 id."""
+        raw_records = [
+            {"job_url": f"https://example.com/job/{i}", "description": "Desc"} for i in range(10)
+        ]
+
+        filtered, _ = normalize_and_filter(raw_records)
+
+        ids = [record["id"] for record in filtered]
+        assert len(set(ids)) == 10
+        assert all(uuid.UUID(value).version == 4 for value in ids)
+
     def test_cleans_and_filters_in_one_pass(self):
         """Test that records are cleaned and filtered together."""
         raw_records = [
@@ -456,6 +550,11 @@ class TestJobUrlIdRegex:
         match = JOB_URL_ID_RE.search(url)
         assert match is None
 
+    def test_no_match_for_non_ascii_digits(self):
+        """Test that only ASCII digits are accepted as job IDs."""
+        url = "https://www.linkedin.com/jobs/view/\u0661\u0662\u0663"
+        assert JOB_URL_ID_RE.search(url) is None
+
     def test_no_match_for_invalid_pattern(self):
         """Test that invalid patterns don't match."""
         url = "https://www.linkedin.com/jobs/abc"
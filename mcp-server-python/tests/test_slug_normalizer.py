@@ -0,0 +1,47 @@
+"""
+Unit tests for the shared slug text normalizer.
+
+Tests normalization rules and that tracker planning and slug resolution
+share one implementation.
+"""
+
+import pytest
+
+from utils.slug_normalizer import normalize_slug_text
+from utils.slug_resolver import _normalize_text
+from utils.tracker_planner import normalize_company_name
+
+
+class TestNormalizeSlugText:
+    """Tests for normalize_slug_text function."""
+
+    def test_normalize_ascii_text(self):
+        """Test lowercasing and collapsing separators on the ASCII path."""
+        assert normalize_slug_text("General Motors") == "general_motors"
+        assert normalize_slug_text("AT&T Inc.") == "at_t_inc"
+        assert normalize_slug_text("a__!_b") == "a_b"
+        assert normalize_slug_text("!!!") == ""
+
+    def test_normalize_non_ascii_text(self):
+        """Test that the regex path follows the same rules as the ASCII path."""
+        assert normalize_slug_text("L'Oréal") == "l_or_al"
+        assert normalize_slug_text("Café__Bar") == "caf_bar"
+        assert normalize_slug_text("__株式会社 Acme__") == "acme"
+
+    def test_repeated_text_is_memoized(self):
+        """Test that repeated names are served from the cache."""
+        normalize_slug_text.cache_clear()
+        normalize_slug_text("Memo Corp")
+        normalize_slug_text("Memo Corp")
+
+        assert normalize_slug_text.cache_info().hits == 1
+
+    @pytest.mark.parametrize(
+        "text", ["Amazon", "General Motors", "L'Oréal", "--Meta--", "Backend/Full-Stack", "a__b"]
+    )
+    def test_tracker_planner_and_slug_resolver_agree(self, text):
+        """Test that both slug modules normalize through the shared helper."""
+        expected = normalize_slug_text(text)
+
+        assert normalize_company_name(text) == expected
+        assert _normalize_text(text) == expected
@@ -39,6 +39,12 @@ class TestNormalizeText:
         assert _normalize_text("Test  --  Multiple") == "test_multiple"
         assert _normalize_text("A & B / C") == "a_b_c"
 
+    def test_normalize_existing_underscore_runs(self):
+        """Test that literal underscore runs collapse along with other separators."""
+        assert _normalize_text("a!!!b") == "a_b"
+        assert _normalize_text("a__b") == "a_b"
+        assert _normalize_text("a_ _b") == "a_b"
+
     def test_normalize_leading_trailing_special_chars(self):
         """Test that leading/trailing special characters are stripped."""
         assert _normalize_text("  Amazon  ") == "amazon"
@@ -55,6 +61,14 @@ class TestNormalizeText:
         assert _normalize_text("Company 123") == "company_123"
         assert _normalize_text("Engineer v2.0") == "engineer_v2_0"
 
+    def test_normalize_ascii_and_unicode_paths_agree(self):
+        """Test that the ASCII translate path matches the regex rules."""
+        assert _normalize_text("~`{Acme}|") == "acme"
+        assert _normalize_text("!!!") == ""
+        assert _normalize_text("Caf\u00e9 Corp") == "caf_corp"
+        # Kelvin sign lowercases to ASCII 'k'
+        assert _normalize_text("\u212aPMG") == "kpmg"
+
 
 class TestExtractSlugFromResumePath:
     """Tests for extract_slug_from_resume_path function."""
@@ -100,6 +114,12 @@ class TestExtractSlugFromResumePath:
             extract_slug_from_resume_path("data/applications/amazon-3629/resume/other.pdf") is None
         )
 
+    def test_extract_rejects_empty_or_nested_slug(self):
+        """Test that the slug must be exactly one non-empty path segment."""
+        assert extract_slug_from_resume_path("data/applications/resume/resume.pdf") is None
+        assert extract_slug_from_resume_path("data/applications//resume/resume.pdf") is None
+        assert extract_slug_from_resume_path("data/applications/a/b/resume/resume.pdf") is None
+
     def test_extract_from_malformed_wiki_link_returns_none(self):
         """Test that malformed wiki-link returns None."""
         # Missing closing brackets
@@ -114,6 +134,11 @@ class TestExtractSlugFromResumePath:
             is None
         )
 
+    def test_extract_from_non_string_returns_none(self):
+        """Test that unhashable or non-string values return None rather than raising."""
+        assert extract_slug_from_resume_path(["data/applications/a/resume/resume.pdf"]) is None
+        assert extract_slug_from_resume_path(42) is None
+
     def test_extract_handles_whitespace(self):
         """Test that whitespace is handled correctly."""
         resume_path = "  [[data/applications/amazon-3629/resume/resume.pdf]]  "
@@ -241,6 +266,22 @@ class TestResolveApplicationSlug:
         slug = resolve_application_slug(tracker)
         assert slug == "google-500"
 
+    def test_resolve_returns_interned_slug(self):
+        """Test that equal slugs from separate resolutions are the same object."""
+        tracker = {"company": "Interned Co", "position": "Engineer", "job_db_id": 98765}
+
+        assert resolve_application_slug(tracker) is resolve_application_slug(dict(tracker))
+
+    def test_resolve_missing_resume_path_skips_extraction(self, monkeypatch):
+        """Test that a missing resume_path goes straight to the fallback slug."""
+
+        def _fail_extract(resume_path_raw):
+            raise AssertionError("extractor should not run without a resume_path")
+
+        monkeypatch.setattr("utils.slug_resolver.extract_slug_from_resume_path", _fail_extract)
+        tracker = {"company": "Google", "position": "Engineer", "job_db_id": 500}
+        assert resolve_application_slug(tracker) == "google-500"
+
     def test_resolve_missing_company_raises_error(self):
         """Test that missing company field raises ValueError."""
         tracker = {"position": "Software Engineer", "resume_path": None, "job_db_id": 100}
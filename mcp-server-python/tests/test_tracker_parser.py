@@ -4,9 +4,15 @@ Unit tests for tracker file parser.
 Tests frontmatter parsing, body extraction, and error handling.
 """
 
+import os
+import re
+
 import pytest
+from hypothesis import given, strategies as st
 
 from utils.tracker_parser import (
+    _TRACKER_CACHE,
+    clear_tracker_cache,
     parse_tracker_file,
     get_tracker_status,
     get_frontmatter_field,
@@ -17,6 +23,9 @@ from utils.tracker_parser import (
     parse_tracker_for_career_tailor_with_error_mapping,
     TrackerParseError,
     _extract_frontmatter_and_body,
+    _split_frontmatter,
+    _split_frontmatter_bytes,
+    _read_tracker_bytes,
 )
 from models.errors import ToolError, ErrorCode
 
@@ -109,6 +118,97 @@ company: Amazon
         assert "must be a YAML dictionary" in str(exc_info.value)
 
 
+# Reference pattern the string-based frontmatter split must agree with
+_REFERENCE_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+
+
+def _reference_job_description(body):
+    """Original line-by-line extraction, used as an oracle."""
+    lines = body.split("\n")
+    start = next(
+        (
+            i
+            for i, line in enumerate(lines)
+            if re.match(r"^##\s+Job\s+Description\s*$", line.strip(), re.IGNORECASE)
+        ),
+        None,
+    )
+    if start is None:
+        return None
+    end = next(
+        (i for i in range(start + 1, len(lines)) if re.match(r"^#{1,2}\s+", lines[i])),
+        len(lines),
+    )
+    return "\n".join(lines[start + 1 : end]).strip()
+
+
+class TestSplitFrontmatter:
+    """Tests for the string-scan frontmatter splitter."""
+
+    def test_splits_standard_tracker(self):
+        """Test the common layout."""
+        content = "---\nstatus: Reviewed\n---\n\n## Notes\n"
+        assert _split_frontmatter(content) == ("status: Reviewed", "## Notes\n")
+
+    def test_delimiter_requires_trailing_newline(self):
+        """Test that a closing delimiter at EOF without newline is rejected."""
+        assert _split_frontmatter("---\nstatus: Reviewed\n---") is None
+
+    def test_dashes_inside_values_are_not_delimiters(self):
+        """Test that '----' or '---x' lines do not close the frontmatter."""
+        content = "---\nstatus: Reviewed\n----\nnote: ---x\n---\nbody"
+        assert _split_frontmatter(content) == ("status: Reviewed\n----\nnote: ---x", "body")
+
+    @given(
+        st.lists(
+            st.sampled_from(["-", "---", "\n", " ", "\t", "a", ":", "\n---\n"]), max_size=16
+        ).map("".join)
+    )
+    def test_matches_reference_regex(self, content):
+        """
+        **Property: string split agrees with the original delimiter regex**
+
+        For any content, _split_frontmatter returns the same (yaml, body)
+        groups as the original pattern, or None when it does not match.
+        """
+        match = _REFERENCE_FRONTMATTER_RE.match(content)
+        expected = (match.group(1), match.group(2)) if match else None
+        assert _split_frontmatter(content) == expected
+
+
+class TestSplitFrontmatterBytes:
+    """Tests for the byte-level frontmatter splitter used by parse_tracker_file."""
+
+    def test_returns_yaml_bytes_and_body_offset(self):
+        """Test the common layout."""
+        raw = b"---\nstatus: Reviewed\n---\n\n## Notes\n"
+        assert _split_frontmatter_bytes(raw) == (b"status: Reviewed", 26)
+
+    def test_defers_on_non_ascii_after_delimiter(self):
+        """Test that possible unicode whitespace after '---' defers to the text path."""
+        assert _split_frontmatter_bytes("---\u00a0\nstatus: x\n---\n".encode()) is None
+
+    @given(
+        st.lists(
+            st.sampled_from(["-", "---", "\n", " ", "\t", "a", "\x1c", "\u00a0", "\n---\n"]),
+            max_size=16,
+        ).map("".join)
+    )
+    def test_agrees_with_text_splitter(self, content):
+        """
+        **Property: byte split never disagrees with the text splitter**
+
+        Whenever the byte splitter returns a result, decoding it yields the
+        same (yaml, body) pair as _split_frontmatter on the decoded content.
+        """
+        raw = content.encode("utf-8")
+        split = _split_frontmatter_bytes(raw)
+        if split is not None:
+            yaml_bytes, body_start = split
+            expected = (yaml_bytes.decode("utf-8"), raw[body_start:].decode("utf-8"))
+            assert _split_frontmatter(content) == expected
+
+
 class TestParseTrackerFile:
     """Tests for complete tracker file parsing."""
 
@@ -255,6 +355,116 @@ Content
         result = parse_tracker_file("trackers/repo-root-tracker.md")
         assert result["status"] == "Reviewed"
 
+    def test_read_rejects_non_regular_file_on_descriptor(self, tmp_path):
+        """Test that the descriptor-level type check rejects directories."""
+        with pytest.raises(FileNotFoundError, match="not a file"):
+            _read_tracker_bytes(tmp_path, str(tmp_path))
+
+    def test_read_returns_bytes_and_descriptor_stat(self, tmp_path):
+        """Test that the returned stat describes the bytes that were read."""
+        tracker_path = tmp_path / "tracker.md"
+        tracker_path.write_bytes(b"---\nstatus: Reviewed\n---\n")
+
+        raw, stat_result = _read_tracker_bytes(tracker_path, str(tracker_path))
+
+        assert raw == b"---\nstatus: Reviewed\n---\n"
+        assert stat_result.st_size == len(raw)
+
+    def test_short_frontmatter_strings_are_interned(self, tmp_path):
+        """Test that short string values are shared across parses of different files."""
+        first = tmp_path / "first.md"
+        second = tmp_path / "second.md"
+        for path in (first, second):
+            path.write_text(
+                "---\nstatus: Reviewed\ncompany: Interned Co\nnotes: " + "n" * 80 + "\n---\n"
+            )
+
+        a = parse_tracker_file(str(first))["frontmatter"]
+        b = parse_tracker_file(str(second))["frontmatter"]
+
+        assert a["company"] is b["company"]
+        assert a["notes"] == b["notes"]
+        assert a["notes"] is not b["notes"]
+
+    def test_parse_tracker_crlf_line_endings(self, tmp_path):
+        """Test that CRLF files parse with newlines translated in the body."""
+        tracker_path = tmp_path / "test-tracker.md"
+        tracker_path.write_bytes(b"---\r\nstatus: Reviewed\r\n---\r\n\r\n## Notes\r\nText\r\n")
+
+        result = parse_tracker_file(str(tracker_path))
+
+        assert result["status"] == "Reviewed"
+        assert result["body"] == "## Notes\nText\n"
+
+
+class TestParseTrackerCache:
+    """Tests for the (mtime, size, inode) keyed tracker parse cache."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_tracker_cache(self):
+        clear_tracker_cache()
+        yield
+        clear_tracker_cache()
+
+    def _write_settled(self, path, status, age_seconds=60):
+        """Write a tracker and backdate its mtime outside the racy window."""
+        path.write_text(f"---\nstatus: {status}\ncompany: Amazon\n---\n\n## Notes\n")
+        mtime = path.stat().st_mtime - age_seconds
+        os.utime(path, (mtime, mtime))
+
+    def test_unchanged_file_is_served_from_cache(self, tmp_path, monkeypatch):
+        """Test that a second parse of an unchanged file skips reading it."""
+        tracker_path = tmp_path / "tracker.md"
+        self._write_settled(tracker_path, "Reviewed")
+        assert parse_tracker_file(str(tracker_path))["status"] == "Reviewed"
+
+        def _fail_read(*args, **kwargs):
+            raise AssertionError("cached tracker should not be re-read")
+
+        monkeypatch.setattr("utils.tracker_parser.os.open", _fail_read)
+        assert parse_tracker_file(str(tracker_path))["status"] == "Reviewed"
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        """Test that a changed mtime invalidates the cached parse."""
+        tracker_path = tmp_path / "tracker.md"
+        self._write_settled(tracker_path, "Reviewed", age_seconds=120)
+        parse_tracker_file(str(tracker_path))
+
+        self._write_settled(tracker_path, "Resume Written", age_seconds=60)
+        assert parse_tracker_file(str(tracker_path))["status"] == "Resume Written"
+
+    def test_recently_modified_file_is_not_cached(self, tmp_path):
+        """Test that files inside the timestamp-granularity window bypass the cache."""
+        tracker_path = tmp_path / "tracker.md"
+        tracker_path.write_text("---\nstatus: Reviewed\n---\n")
+
+        parse_tracker_file(str(tracker_path))
+
+        assert str(tracker_path) not in _TRACKER_CACHE
+
+    def test_callers_cannot_mutate_cached_parse(self, tmp_path):
+        """Test that mutating a returned frontmatter does not leak into the cache."""
+        tracker_path = tmp_path / "tracker.md"
+        self._write_settled(tracker_path, "Reviewed")
+
+        first = parse_tracker_file(str(tracker_path))
+        first["frontmatter"]["status"] = "Applied"
+        first["status"] = "Applied"
+
+        second = parse_tracker_file(str(tracker_path))
+        assert second["status"] == "Reviewed"
+        assert second["frontmatter"]["status"] == "Reviewed"
+
+    def test_deleted_file_raises_despite_cache(self, tmp_path):
+        """Test that a cached entry never masks a missing file."""
+        tracker_path = tmp_path / "tracker.md"
+        self._write_settled(tracker_path, "Reviewed")
+        parse_tracker_file(str(tracker_path))
+
+        tracker_path.unlink()
+        with pytest.raises(FileNotFoundError):
+            parse_tracker_file(str(tracker_path))
+
 
 class TestGetTrackerStatus:
     """Tests for get_tracker_status convenience function."""
@@ -299,6 +509,15 @@ company: Amazon
         with pytest.raises(TrackerParseError):
             get_tracker_status(str(tracker_path))
 
+    def test_get_status_does_not_decode_body(self, tmp_path):
+        """Test that status lookup reads only the frontmatter."""
+        tracker_path = tmp_path / "test-tracker.md"
+        tracker_path.write_bytes(b"---\nstatus: Reviewed\n---\n\n## Notes\n\xff\xfe\n")
+
+        assert get_tracker_status(str(tracker_path)) == "Reviewed"
+        with pytest.raises(UnicodeDecodeError):
+            parse_tracker_file(str(tracker_path))
+
 
 class TestGetFrontmatterField:
     """Tests for get_frontmatter_field convenience function."""
@@ -352,6 +571,18 @@ company: Amazon
         with pytest.raises(FileNotFoundError):
             get_frontmatter_field(str(tracker_path), "company")
 
+    def test_get_field_large_body_and_large_frontmatter(self, tmp_path):
+        """Test lookups when the file or the frontmatter exceeds the read prefix."""
+        large_body = tmp_path / "large-body.md"
+        large_body.write_text("---\nstatus: Reviewed\ncompany: Amazon\n---\n\n" + "x" * 10000)
+        large_frontmatter = tmp_path / "large-frontmatter.md"
+        large_frontmatter.write_text(
+            "---\nstatus: Reviewed\nnotes: " + "y" * 10000 + "\ncompany: Meta\n---\nbody\n"
+        )
+
+        assert get_frontmatter_field(str(large_body), "company") == "Amazon"
+        assert get_frontmatter_field(str(large_frontmatter), "company") == "Meta"
+
 
 class TestParseTrackerWithErrorMapping:
     """Tests for parse_tracker_with_error_mapping function."""
@@ -622,6 +853,23 @@ resume_path: '[[data/applications/amazon-352/resume/resume.pdf]]'
 
         assert result == "data/applications/amazon-352/resume/resume.pdf"
 
+    def test_resolve_uses_parsed_tracker_without_reading(self, tmp_path):
+        """Test that a supplied parse result is used instead of re-reading the file."""
+        parsed = {
+            "frontmatter": {
+                "status": "Reviewed",
+                "resume_path": "[[data/applications/meta-7/resume/resume.pdf]]",
+            },
+            "body": "",
+            "status": "Reviewed",
+        }
+
+        result = resolve_resume_pdf_path_from_tracker(
+            str(tmp_path / "missing.md"), parsed_tracker=parsed
+        )
+
+        assert result == "data/applications/meta-7/resume/resume.pdf"
+
 
 class TestExtractJobDescription:
     """Tests for extract_job_description function."""
@@ -720,6 +968,43 @@ More content.
         assert "# Major Section" not in result
         assert "More content." not in result
 
+    @given(
+        st.lists(
+            st.sampled_from(
+                ["## Job Description", "job description", "#", "##", "###", " ", "\t", "\n", "x"]
+            ),
+            max_size=14,
+        ).map("".join)
+    )
+    def test_matches_line_by_line_reference(self, body):
+        """
+        **Property: single-scan extraction agrees with the line-based original**
+
+        For any body, the extracted section (or the missing-heading error)
+        is the same as the original per-line implementation.
+        """
+        expected = _reference_job_description(body)
+        if expected is None:
+            with pytest.raises(TrackerParseError):
+                extract_job_description(body)
+        else:
+            assert extract_job_description(body) == expected
+
+    def test_extract_job_description_keeps_subheadings_and_hash_text(self):
+        """Test that level-3 headings and '#' text without a space are content."""
+        body = """## Job Description
+
+### Responsibilities
+#hashtag line
+  ## indented heading is content
+
+## Notes
+Not included.
+"""
+        result = extract_job_description(body)
+
+        assert result == ("### Responsibilities\n#hashtag line\n  ## indented heading is content")
+
     def test_extract_job_description_missing_heading_raises_error(self):
         """Test that missing job description heading raises TrackerParseError."""
         body = """## Notes
@@ -9,10 +9,12 @@ from utils.tracker_planner import (
     normalize_company_name,
     generate_application_slug,
     generate_tracker_filename,
+    extract_captured_date,
     compute_tracker_path,
     compute_resume_path,
     compute_cover_letter_path,
     compute_workspace_directories,
+    list_tracker_filenames,
     plan_tracker,
 )
 
@@ -47,6 +49,12 @@ class TestNormalizeCompanyName:
         assert normalize_company_name("_Company_") == "company"
         assert normalize_company_name("...Company...") == "company"
 
+    def test_ascii_and_unicode_paths_agree(self):
+        """Test that the ASCII translate path follows the same rules as the regex path."""
+        assert normalize_company_name("a__!_b") == "a_b"
+        assert normalize_company_name("!!!") == ""
+        assert normalize_company_name("Caf\u00e9__Bar") == "caf_bar"
+
 
 class TestGenerateApplicationSlug:
     """Tests for application slug generation."""
@@ -107,6 +115,22 @@ class TestGenerateTrackerFilename:
         assert filename.startswith("2026-02-04-")
 
 
+class TestExtractCapturedDate:
+    """Tests for captured_at date extraction."""
+
+    def test_iso_timestamps_use_date_prefix(self):
+        """Test the common ISO shapes."""
+        assert extract_captured_date("2026-02-04T15:30:00+00:00") == "2026-02-04"
+        assert extract_captured_date("2026-02-04 15:30:00") == "2026-02-04"
+        assert extract_captured_date("2026-02-04") == "2026-02-04"
+
+    def test_non_iso_values_keep_split_semantics(self):
+        """Test that unusual values match the split-on-separator behavior."""
+        assert extract_captured_date("2026-02-04 15:30 T") == "2026-02-04 15:30 "
+        assert extract_captured_date("2026-02-04X10:00") == "2026-02-04X10:00"
+        assert extract_captured_date("Feb 4 2026") == "Feb"
+
+
 class TestComputeTrackerPath:
     """Tests for tracker path computation."""
 
@@ -208,6 +232,18 @@ class TestComputeWorkspaceDirectories:
         assert isinstance(dirs["resume_dir"], Path)
         assert isinstance(dirs["cover_dir"], Path)
 
+    def test_workspace_directories_behave_like_dict(self):
+        """Test that the lazy mapping compares, iterates, and misses like a dict."""
+        dirs = compute_workspace_directories("amazon-3629")
+        assert dirs["cover_dir"] == Path("data/applications/amazon-3629/cover")
+        assert dirs == {
+            "workspace_root": Path("data/applications/amazon-3629"),
+            "resume_dir": Path("data/applications/amazon-3629/resume"),
+            "cover_dir": Path("data/applications/amazon-3629/cover"),
+        }
+        assert list(dirs) == ["workspace_root", "resume_dir", "cover_dir"]
+        assert dirs.get("missing") is None
+
 
 class TestPlanTracker:
     """Tests for complete tracker planning."""
@@ -257,3 +293,45 @@ class TestPlanTracker:
         assert plan1["application_slug"] == plan2["application_slug"]
         assert plan1["tracker_filename"] == plan2["tracker_filename"]
         assert plan1["tracker_path"] == plan2["tracker_path"]
+
+    def test_plan_matches_individual_helpers(self):
+        """Test that plan_tracker agrees with the standalone slug/filename/path helpers."""
+        job = {"id": 42, "company": "AT&T Inc.", "captured_at": "2026-02-04 09:00:00"}
+        plan = plan_tracker(job, trackers_dir="t")
+
+        assert plan["application_slug"] == generate_application_slug("AT&T Inc.", 42)
+        assert plan["tracker_filename"] == generate_tracker_filename(
+            "AT&T Inc.", 42, "2026-02-04 09:00:00"
+        )
+        assert plan["tracker_path"] == compute_tracker_path(
+            "AT&T Inc.", 42, "2026-02-04 09:00:00", "t"
+        )
+
+    def test_plan_uses_existing_filenames_snapshot(self, tmp_path):
+        """Test that a filename snapshot replaces the per-job existence check."""
+        job = {"id": 3629, "company": "Amazon", "captured_at": "2026-02-04T15:30:00"}
+
+        assert plan_tracker(job, str(tmp_path), {"2026-02-04-amazon-3629.md"})["exists"] is True
+        assert plan_tracker(job, str(tmp_path), set())["exists"] is False
+
+
+class TestListTrackerFilenames:
+    """Tests for the trackers directory snapshot."""
+
+    def test_list_tracker_filenames_missing_dir(self, tmp_path):
+        """Test that a missing trackers directory lists as empty."""
+        assert list_tracker_filenames(str(tmp_path / "missing")) == set()
+
+    def test_snapshot_matches_plan_tracker_exists(self, tmp_path):
+        """Test that planning against the snapshot agrees with per-job stat checks."""
+        (tmp_path / "2026-02-04-amazon-3629.md").write_text("x")
+        jobs = [
+            {"id": 3629, "company": "Amazon", "captured_at": "2026-02-04T15:30:00"},
+            {"id": 3630, "company": "Meta", "captured_at": "2026-02-04T16:00:00"},
+        ]
+
+        existing = list_tracker_filenames(str(tmp_path))
+        plans = [plan_tracker(job, str(tmp_path), existing) for job in jobs]
+
+        assert plans == [plan_tracker(job, str(tmp_path)) for job in jobs]
+        assert [plan["exists"] for plan in plans] == [True, False]
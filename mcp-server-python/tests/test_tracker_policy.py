@@ -72,6 +72,13 @@ class TestTransitionResult:
         data = result.to_dict()
         assert data["warnings"] == ["Warning message"]
 
+    def test_transition_result_has_no_instance_dict(self):
+        """Test that transition results use slots instead of a per-instance dict."""
+        result = TransitionResult(allowed=True)
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.extra = True
+
 
 class TestValidateTransitionNoop:
     """Tests for noop transitions (target == current)."""
@@ -278,6 +285,18 @@ class TestValidateTransitionPolicyViolations:
             or JobTrackerStatus.GHOSTED.value in result.error_message
         )
 
+    def test_error_message_allowed_list_is_sorted_and_quoted(self):
+        """Test the exact allowed-transition lists for core and non-core statuses."""
+        core = validate_transition("Reviewed", "Applied")
+        assert core.error_message.endswith(
+            "Allowed transitions from 'Reviewed': 'Ghosted', 'Rejected', 'Resume Written'"
+        )
+
+        non_core = validate_transition("Interview", "Applied")
+        assert non_core.error_message.endswith(
+            "Allowed transitions from 'Interview': 'Ghosted', 'Rejected'"
+        )
+
 
 class TestValidateTransitionForceBypass:
     """Tests for force bypass behavior."""
@@ -436,6 +455,14 @@ class TestTransitionPolicyConstants:
         for value in CORE_TRANSITIONS.values():
             assert isinstance(value, str)
 
+    def test_policy_statuses_are_interned_plain_strings(self):
+        """Test that policy constants hold interned plain strings, not Enum members."""
+        import sys
+
+        for status in [*TERMINAL_STATUSES, *CORE_TRANSITIONS, *CORE_TRANSITIONS.values()]:
+            assert type(status) is str
+            assert status is sys.intern(status)
+
 
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
@@ -4,7 +4,14 @@ Unit tests for tracker markdown renderer.
 Tests stable frontmatter rendering, section structure, and content handling.
 """
 
-from utils.tracker_renderer import render_tracker_markdown, _extract_date, _render_job_description
+import yaml
+
+from utils.tracker_renderer import (
+    render_frontmatter_block,
+    render_tracker_markdown,
+    _extract_date,
+    _render_job_description,
+)
 
 
 class TestExtractDate:
@@ -41,6 +48,27 @@ class TestRenderJobDescription:
         assert result == "No description available."
 
 
+class TestRenderFrontmatterBlock:
+    """Tests for the shared frontmatter block renderer."""
+
+    def test_block_keeps_key_order_and_delimiters(self):
+        """Test that keys keep insertion order between '---' lines."""
+        block = render_frontmatter_block({"status": "Reviewed", "company": "Amazon", "id": 3})
+        assert block == "---\nstatus: Reviewed\ncompany: Amazon\nid: 3\n---\n"
+
+    def test_block_round_trips_quoted_values(self):
+        """Test that values needing quotes load back unchanged."""
+        frontmatter = {"status": "Reviewed", "position": "Engineer: Backend", "note": "Café"}
+        block = render_frontmatter_block(frontmatter)
+        assert "Café" in block
+        assert yaml.safe_load(block.strip("-\n")) == frontmatter
+
+    def test_block_keeps_astral_characters_unescaped(self):
+        """Test that emoji and other non-BMP characters are written literally."""
+        block = render_frontmatter_block({"position": "Senior Engineer 🚀", "company": "𝔸cme"})
+        assert block == "---\nposition: Senior Engineer 🚀\ncompany: 𝔸cme\n---\n"
+
+
 class TestRenderTrackerMarkdown:
     """Tests for complete tracker markdown rendering."""
 
@@ -234,3 +262,29 @@ class TestRenderTrackerMarkdown:
         content2 = render_tracker_markdown(job, plan)
 
         assert content1 == content2
+
+    def test_render_frontmatter_round_trips_special_characters(self):
+        """Test that quoting-sensitive values load back unchanged from the frontmatter."""
+        job = {
+            "id": 7,
+            "job_id": "0x1f",
+            "title": "Engineer: Backend # Platform",
+            "company": "L'Oréal & Co — 株式会社",
+            "description": None,
+            "url": "https://example.com/job?a=1&b=[2]",
+            "captured_at": "2026-02-04T15:30:00",
+        }
+        plan = {
+            "resume_path": "[[data/applications/l_or_al-7/resume/resume.pdf]]",
+            "cover_letter_path": "[[data/applications/l_or_al-7/cover/cover-letter.pdf]]",
+            "application_slug": "l_or_al-7",
+        }
+
+        content = render_tracker_markdown(job, plan)
+        frontmatter = yaml.safe_load(content.split("---\n")[1])
+
+        assert frontmatter["job_id"] == "0x1f"
+        assert frontmatter["position"] == "Engineer: Backend # Platform"
+        assert frontmatter["company"] == "L'Oréal & Co — 株式会社"
+        assert frontmatter["reference_link"] == "https://example.com/job?a=1&b=[2]"
+        assert "株式会社" in content
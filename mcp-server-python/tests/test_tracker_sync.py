@@ -329,3 +329,79 @@ Line 3
     assert "Line 1\n\nLine 2" in updated_content
     assert "Line 3\n\n## Notes" in updated_content
     assert "- Item 1\n- Item 2" in updated_content
+
+
+def test_update_status_rewrites_only_the_status_line(tmp_path):
+    """
+    Test that a plain status line is replaced in place, leaving comments and
+    formatting of the other frontmatter lines untouched.
+
+    Requirements:
+        - 7.1: Update only the status field in frontmatter
+        - 7.4: Preserve original frontmatter keys/values except status
+    """
+    tracker_path = tmp_path / "test-tracker.md"
+    original = (
+        "---\n"
+        "# tracked in Obsidian\n"
+        'company: "Amazon"\n'
+        "status: Reviewed\n"
+        "application_date: 2026-02-05\n"
+        "---\n"
+        "## Job Description\n"
+    )
+    tracker_path.write_text(original, encoding="utf-8")
+
+    update_tracker_status(str(tracker_path), JobTrackerStatus.RESUME_WRITTEN)
+
+    expected = original.replace("status: Reviewed", "status: Resume Written")
+    assert tracker_path.read_text(encoding="utf-8") == expected
+
+
+def test_update_status_falls_back_for_quoted_status(tmp_path):
+    """Test that a quoted status value goes through the full YAML rewrite."""
+    tracker_path = tmp_path / "test-tracker.md"
+    tracker_path.write_text("---\nstatus: 'Reviewed'\ncompany: Amazon\n---\n\nBody\n")
+
+    update_tracker_status(str(tracker_path), "Applied")
+
+    content = tracker_path.read_text(encoding="utf-8")
+    assert "status: Applied\n" in content
+    assert "company: Amazon\n" in content
+    assert content.endswith("---\n\nBody\n")
+
+
+def test_update_status_rejects_malformed_frontmatter(tmp_path):
+    """Test that invalid YAML frontmatter is still rejected, not patched."""
+    tracker_path = tmp_path / "test-tracker.md"
+    original = "---\nstatus: Reviewed\n- stray\n---\nBody\n"
+    tracker_path.write_text(original, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        update_tracker_status(str(tracker_path), "Applied")
+
+    assert tracker_path.read_text(encoding="utf-8") == original
+
+
+@pytest.mark.parametrize(
+    "original",
+    [
+        "---\nstatus: Reviewed\ncompany: Amazon\n---\nBody\n",
+        "---\r\nstatus: 'Reviewed'\r\ncompany: Amazon\r\n---\r\nBody\r\n",
+    ],
+)
+def test_update_status_skips_write_when_status_unchanged(tmp_path, monkeypatch, original):
+    """Test that re-applying the current status does not rewrite the file."""
+    import utils.tracker_sync as tracker_sync
+
+    tracker_path = tmp_path / "test-tracker.md"
+    tracker_path.write_bytes(original.encode("utf-8"))
+
+    def fail_write(path, content):
+        raise AssertionError("unexpected write")
+
+    monkeypatch.setattr(tracker_sync, "_atomic_write", fail_write)
+
+    update_tracker_status(str(tracker_path), JobTrackerStatus.REVIEWED)
+
+    assert tracker_path.read_bytes() == original.encode("utf-8")
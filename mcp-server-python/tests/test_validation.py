@@ -223,6 +223,13 @@ class TestValidateCursor:
         assert error.code == ErrorCode.VALIDATION_ERROR
         assert "format" in error.message.lower()
 
+    def test_invalid_format_with_trailing_newline(self):
+        """Test that a trailing newline is rejected, not accepted as base64."""
+        with pytest.raises(ToolError) as exc_info:
+            validate_cursor("dGVzdA==\n")
+
+        assert exc_info.value.code == ErrorCode.VALIDATION_ERROR
+
     def test_invalid_type_integer(self):
         """Test that integer cursor raises VALIDATION_ERROR."""
         with pytest.raises(ToolError) as exc_info:
@@ -888,6 +895,21 @@ class TestGetCurrentUtcTimestamp:
             f"Timestamp {timestamp} not within expected range [{before}, {after}]"
         )
 
+    def test_timestamp_reused_within_same_millisecond(self, monkeypatch):
+        """Test that calls in the same millisecond share one string and later ones advance."""
+        import utils.validation as validation
+
+        now_ns = [1_770_176_856_966_123_456]
+        monkeypatch.setattr(validation.time, "time_ns", lambda: now_ns[0])
+
+        first = validation.get_current_utc_timestamp()
+        now_ns[0] += 500_000
+        assert validation.get_current_utc_timestamp() is first
+        assert first == "2026-02-04T03:47:36.966Z"
+
+        now_ns[0] += 1_000_000
+        assert validation.get_current_utc_timestamp() == "2026-02-04T03:47:36.967Z"
+
     def test_timestamp_returns_string(self):
         """Test that function returns a string."""
         from utils.validation import get_current_utc_timestamp
@@ -1041,6 +1063,19 @@ class TestValidateTrackerStatus:
             result = validate_tracker_status(status.value)
             assert result == status
 
+    def test_valid_tracker_status_returns_interned_string(self):
+        """Test that a validated status is the interned canonical string."""
+        import sys
+
+        from utils.validation import validate_tracker_status
+
+        # Build the value at runtime so it is not already the interned literal
+        target = "".join(["Resume", " ", "Written"])
+        result = validate_tracker_status(target)
+
+        assert result == target
+        assert result is sys.intern("Resume Written")
+
     def test_invalid_tracker_status_value(self):
         """Test that invalid tracker status values raise VALIDATION_ERROR."""
         from utils.validation import validate_tracker_status
@@ -21,7 +21,10 @@ from models.status import JobTrackerStatus
 from pydantic import ValidationError
 from schemas.finalize_resume_batch import FinalizeResumeBatchRequest, FinalizeResumeBatchResponse
 from utils.artifact_paths import resolve_resume_tex_path
-from utils.finalize_validators import validate_resume_written_guardrails, validate_tracker_exists
+from utils.finalize_validators import (
+    parse_tracker_for_validation,
+    validate_resume_written_guardrails,
+)
 from utils.pydantic_error_mapper import map_pydantic_validation_error
 from utils.tracker_parser import resolve_resume_pdf_path_from_tracker
 from utils.tracker_sync import update_tracker_status
@@ -149,14 +152,16 @@ def validate_item_preconditions(item: Dict[str, Any]) -> tuple[bool, Optional[st
     tracker_path = item["tracker_path"]
     item_resume_pdf_path = item.get("resume_pdf_path")
 
-    # Validate tracker exists
-    tracker_valid, tracker_error = validate_tracker_exists(tracker_path)
-    if not tracker_valid:
+    # Validate tracker exists, keeping the parse for path resolution
+    parsed_tracker, tracker_error = parse_tracker_for_validation(tracker_path)
+    if parsed_tracker is None:
         return False, tracker_error, None
 
     # Resolve resume_pdf_path
     try:
-        resume_pdf_path = resolve_resume_pdf_path_from_tracker(tracker_path, item_resume_pdf_path)
+        resume_pdf_path = resolve_resume_pdf_path_from_tracker(
+            tracker_path, item_resume_pdf_path, parsed_tracker=parsed_tracker
+        )
     except Exception as e:
         return False, f"Failed to resolve resume_pdf_path: {sanitize_error_message(e)}", None
 
@@ -20,7 +20,7 @@ from schemas.initialize_shortlist_trackers import (
 from utils.pydantic_error_mapper import map_pydantic_validation_error
 from utils.validation import validate_initialize_shortlist_trackers_parameters
 from db.jobs_reader import get_connection, query_shortlist_jobs
-from utils.tracker_planner import plan_tracker
+from utils.tracker_planner import list_tracker_filenames, plan_tracker
 from utils.tracker_renderer import render_tracker_markdown
 from utils.file_ops import atomic_write, ensure_workspace_directories, resolve_write_action
 from utils.path_resolution import resolve_trackers_dir
@@ -116,13 +116,15 @@ def initialize_shortlist_trackers(args: Dict[str, Any]) -> Dict[str, Any]:
 
         # Step 3: Process each job and collect results
         existing_trackers_by_reference = _index_trackers_by_reference_link(final_trackers_dir)
+        # One directory read instead of a stat per job; kept current as trackers are written
+        existing_tracker_filenames = list_tracker_filenames(str(final_trackers_dir))
         results = []
 
         for job in jobs:
             plan = None
             try:
                 # Plan tracker paths and workspace directories
-                plan = plan_tracker(job, str(final_trackers_dir))
+                plan = plan_tracker(job, str(final_trackers_dir), existing_tracker_filenames)
 
                 # Compatibility path: if an older tracker already exists for this job's
                 # reference_link, skip creation to avoid duplicate trackers.
@@ -175,6 +177,7 @@ def initialize_shortlist_trackers(args: Dict[str, Any]) -> Dict[str, Any]:
 
                     # Write tracker file atomically
                     atomic_write(plan["tracker_path"], content)
+                    existing_tracker_filenames.add(plan["tracker_filename"])
 
                 # Record successful operation
                 results.append(
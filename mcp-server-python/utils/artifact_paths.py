@@ -9,6 +9,9 @@ from pathlib import Path
 from typing import Optional, Tuple
 import re
 
+# Wiki-link resume_path: [[path]] (whole value, matched with fullmatch)
+_WIKI_LINK_RE = re.compile(r"\[\[(.*?)\]\]")
+
 
 class ArtifactPathError(Exception):
     """Exception raised when artifact path resolution fails."""
@@ -73,8 +76,7 @@ def parse_resume_path(resume_path_raw: Optional[str]) -> Optional[str]:
         raise ArtifactPathError("resume_path is empty")
 
     # Check for wiki-link format: [[path]]
-    wiki_link_pattern = r"^\[\[(.*?)\]\]$"
-    match = re.match(wiki_link_pattern, resume_path_raw)
+    match = _WIKI_LINK_RE.fullmatch(resume_path_raw)
 
     if match:
         # Extract path from wiki-link brackets
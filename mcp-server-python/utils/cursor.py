@@ -4,8 +4,9 @@ Cursor encoding/decoding utilities for pagination.
 Cursors are opaque strings that encode pagination state (captured_at, id).
 """
 
-import base64
+import binascii
 import json
+from binascii import a2b_base64, b2a_base64
 from typing import Optional, Tuple
 
 from models.errors import create_validation_error
@@ -37,16 +38,31 @@ def encode_cursor(captured_at: str, record_id: int) -> str:
     Returns:
         Base64-encoded cursor string
     """
-    # Create cursor payload
-    payload = {"captured_at": captured_at, "id": record_id}
+    # Fixed two-field shape: format the compact JSON directly when the
+    # timestamp needs no escaping (always true for ISO 8601 values).
+    if _is_plain_json_string(captured_at) and type(record_id) is int:
+        json_bytes = b'{"captured_at":"%s","id":%d}' % (captured_at.encode("ascii"), record_id)
+    else:
+        payload = {"captured_at": captured_at, "id": record_id}
+        json_bytes = json.dumps(payload, separators=(",", ":")).encode("utf-8")
 
-    # Encode as JSON then base64
-    json_str = json.dumps(payload, separators=(",", ":"))
-    encoded = base64.b64encode(json_str.encode("utf-8")).decode("ascii")
+    # Encode as base64 (binascii directly; base64.b64encode is a wrapper)
+    encoded = b2a_base64(json_bytes, newline=False).decode("ascii")
 
     return encoded
 
 
+def _is_plain_json_string(value: object) -> bool:
+    """Return True when ``value`` serializes to JSON verbatim between quotes."""
+    return (
+        type(value) is str
+        and value.isascii()
+        and value.isprintable()
+        and '"' not in value
+        and "\\" not in value
+    )
+
+
 def _map_cursor_validation_error(error: ValidationError) -> Exception:
     """Convert a Pydantic ``ValidationError`` into a ``ToolError``.
 
@@ -90,7 +106,7 @@ def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[str, int]]:
 
     try:
         # Decode base64
-        decoded_bytes = base64.b64decode(cursor.encode("ascii"))
+        decoded_bytes = a2b_base64(cursor.encode("ascii"))
         json_str = decoded_bytes.decode("utf-8")
 
         # Parse JSON
@@ -112,5 +128,5 @@ def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[str, int]]:
         raise create_validation_error(
             f"Invalid cursor format: invalid UTF-8 encoding - {str(e)}"
         ) from e
-    except (base64.binascii.Error, ValueError) as e:
+    except (binascii.Error, ValueError) as e:
         raise create_validation_error(f"Invalid cursor format: malformed base64 - {str(e)}") from e
@@ -5,15 +5,24 @@ This module provides validation functions to ensure resume artifacts meet
 quality requirements before allowing tracker status to be set to "Resume Written".
 """
 
-from pathlib import Path
-from typing import Optional, Tuple
+import os
 import re
+import stat
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 
-from utils.latex_guardrails import scan_tex_for_placeholders
+from utils.latex_guardrails import scan_tex_bytes_for_placeholders
 from utils.tracker_parser import parse_tracker_file, TrackerParseError
 from models.errors import sanitize_path
 
 
+# Absolute POSIX or Windows path token inside a free-form message. Surrounding
+# punctuation and a trailing sentence period are left outside the match.
+_ABS_PATH_RE = re.compile(
+    r"(?<![\w./\\:])(?:/|[A-Za-z]:\\)[^\s,;:()\[\]{}\"']*?(?=\.?(?:[\s,;:()\[\]{}\"']|$))"
+)
+
+
 class GuardrailError(Exception):
     """Exception raised when guardrail validation fails."""
 
@@ -24,18 +33,7 @@ def _sanitize_paths_in_message(message: str) -> str:
 
     Keeps relative paths readable while stripping sensitive host paths.
     """
-    sanitized_tokens = []
-    for token in message.split():
-        stripped = token.strip(".,;:()[]{}\"'")
-        is_abs_posix = stripped.startswith("/")
-        is_abs_windows = bool(re.match(r"^[A-Za-z]:\\", stripped))
-
-        if is_abs_posix or is_abs_windows:
-            sanitized_tokens.append(token.replace(stripped, sanitize_path(stripped)))
-        else:
-            sanitized_tokens.append(token)
-
-    return " ".join(sanitized_tokens)
+    return _ABS_PATH_RE.sub(lambda match: sanitize_path(match.group(0)), message)
 
 
 def validate_tracker_exists(tracker_path: str) -> Tuple[bool, Optional[str]]:
@@ -66,16 +64,36 @@ def validate_tracker_exists(tracker_path: str) -> Tuple[bool, Optional[str]]:
         >>> validate_tracker_exists("trackers/malformed.md")
         (False, 'Tracker file is malformed: ...')
     """
+    parsed, error = parse_tracker_for_validation(tracker_path)
+    return parsed is not None, error
+
+
+def parse_tracker_for_validation(
+    tracker_path: str,
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Parse a tracker file, returning the parse result or a validation error.
+
+    Same checks and error messages as validate_tracker_exists, but the
+    parsed tracker is handed back so later steps need not parse it again.
+
+    Args:
+        tracker_path: Path to tracker markdown file
+
+    Returns:
+        Tuple of (parsed_tracker, error_message)
+        - (parsed dict from parse_tracker_file, None) if validation passes
+        - (None, error_message) if validation fails
+    """
     try:
         # Use parse_tracker_file which validates existence, readability, and format
-        parse_tracker_file(tracker_path)
-        return True, None
+        return parse_tracker_file(tracker_path), None
     except FileNotFoundError as e:
-        return False, _sanitize_paths_in_message(str(e))
+        return None, _sanitize_paths_in_message(str(e))
     except TrackerParseError as e:
-        return False, f"Tracker file is malformed: {_sanitize_paths_in_message(str(e))}"
+        return None, f"Tracker file is malformed: {_sanitize_paths_in_message(str(e))}"
     except Exception as e:
-        return False, _sanitize_paths_in_message(f"Failed to validate tracker: {str(e)}")
+        return None, _sanitize_paths_in_message(f"Failed to validate tracker: {str(e)}")
 
 
 def validate_resume_pdf_exists(pdf_path: str) -> Tuple[bool, Optional[str]]:
@@ -107,19 +125,18 @@ def validate_resume_pdf_exists(pdf_path: str) -> Tuple[bool, Optional[str]]:
         >>> validate_resume_pdf_exists("data/applications/empty/resume/resume.pdf")
         (False, 'resume.pdf is empty (0 bytes)')
     """
-    pdf_file = Path(pdf_path)
-
-    # Check if file exists
-    if not pdf_file.exists():
+    # Single stat covers existence, file type and size
+    try:
+        pdf_stat = os.stat(pdf_path)
+    except (FileNotFoundError, NotADirectoryError):
         return False, "resume.pdf does not exist"
 
     # Check if it's a file (not a directory)
-    if not pdf_file.is_file():
+    if not stat.S_ISREG(pdf_stat.st_mode):
         return False, "resume.pdf path is not a file"
 
     # Check if file has non-zero size
-    file_size = pdf_file.stat().st_size
-    if file_size == 0:
+    if pdf_stat.st_size == 0:
         return False, "resume.pdf is empty (0 bytes)"
 
     return True, None
@@ -209,18 +226,28 @@ def validate_resume_written_guardrails(pdf_path: str, tex_path: str) -> Tuple[bo
         ... )
         (False, 'resume.tex contains placeholder tokens: PROJECT-AI-')
     """
-    # Validate PDF exists and has non-zero size
-    pdf_valid, pdf_error = validate_resume_pdf_exists(pdf_path)
-    if not pdf_valid:
-        return False, pdf_error
-
-    # Validate TEX exists
-    tex_valid, tex_error = validate_resume_tex_exists(tex_path)
-    if not tex_valid:
-        return False, tex_error
-
-    # Scan TEX for placeholders
-    placeholder_valid, placeholder_error, _ = scan_tex_for_placeholders(tex_path)
+    # Stat the PDF once instead of routing through the standalone
+    # exists/is_file/stat validators, which re-stat the same path.
+    try:
+        pdf_stat = os.stat(pdf_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return False, "resume.pdf does not exist"
+    if not stat.S_ISREG(pdf_stat.st_mode):
+        return False, "resume.pdf path is not a file"
+    if pdf_stat.st_size == 0:
+        return False, "resume.pdf is empty (0 bytes)"
+
+    # Read the TEX once; the same bytes feed the placeholder scan
+    try:
+        tex_data = Path(tex_path).read_bytes()
+    except (FileNotFoundError, NotADirectoryError):
+        return False, "resume.tex does not exist"
+    except IsADirectoryError:
+        return False, "resume.tex path is not a file"
+    except OSError as e:
+        return False, f"Failed to read resume.tex: {str(e)}"
+
+    placeholder_valid, placeholder_error, _ = scan_tex_bytes_for_placeholders(tex_data)
     if not placeholder_valid:
         return False, placeholder_error
 
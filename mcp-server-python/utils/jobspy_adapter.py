@@ -9,11 +9,19 @@ Requirements: 3.1, 3.3, 3.5
 """
 
 import socket
+import threading
 import time
 from typing import Any
 
 import jobspy
 
+# Process-wide DNS preflight cache: host -> (resolved addresses, monotonic expiry).
+# The TTL is kept short so a lost network is noticed by the next preflight
+# check instead of being masked by an earlier success.
+DNS_CACHE_TTL_SECONDS = 5.0
+_DNS_CACHE: dict[str, tuple[tuple[str, ...], float]] = {}
+_DNS_CACHE_LOCK = threading.Lock()
+
 
 class PreflightDNSError(Exception):
     """Raised when DNS preflight check fails after all retries."""
@@ -27,24 +35,48 @@ class ScrapeProviderError(Exception):
     pass
 
 
+def clear_dns_cache() -> None:
+    """Drop all cached DNS preflight results."""
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE.clear()
+
+
+def _resolve_and_cache(host: str, cache_ttl_seconds: float) -> None:
+    """Resolve ``host`` once and record the result in the preflight cache.
+
+    Uses getaddrinfo so every address family the HTTP client may try
+    (IPv4 and IPv6) is covered, unlike the IPv4-only gethostbyname.
+    """
+    infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    addresses = tuple(dict.fromkeys(info[4][0] for info in infos))
+    if cache_ttl_seconds > 0:
+        with _DNS_CACHE_LOCK:
+            _DNS_CACHE[host] = (addresses, time.monotonic() + cache_ttl_seconds)
+
+
 def preflight_dns_check(
     host: str,
     retry_count: int = 3,
     retry_sleep_seconds: float = 30.0,
     retry_backoff: float = 2.0,
+    cache_ttl_seconds: float = DNS_CACHE_TTL_SECONDS,
 ) -> None:
     """
     Perform DNS preflight check with retry and backoff.
 
     This function attempts to resolve the given host to verify network
     connectivity before scraping. If the resolution fails, it retries
-    according to the specified parameters.
+    according to the specified parameters. Successful resolutions are
+    cached per host for a few seconds (``cache_ttl_seconds``) so back-to-back
+    checks skip the lookup.
 
     Args:
         host: Hostname to resolve (e.g., "www.linkedin.com")
         retry_count: Number of retry attempts (default: 3)
         retry_sleep_seconds: Base sleep duration between retries in seconds (default: 30)
         retry_backoff: Backoff multiplier for sleep duration (default: 2.0)
+        cache_ttl_seconds: How long a successful resolution is reused; 0 disables
+            the cache (default: 5)
 
     Raises:
         PreflightDNSError: If DNS resolution fails after all retry attempts
@@ -56,16 +88,24 @@ def preflight_dns_check(
         - 2.4: Include per-term preflight failures in structured results
         - 2.5: Do not crash entire run due to one term's preflight failure
     """
+    cached = _DNS_CACHE.get(host)
+    if cached is not None and time.monotonic() < cached[1]:
+        return
+
     attempt = 0
     sleep_duration = retry_sleep_seconds
 
     while attempt < retry_count:
         try:
             # Attempt to resolve the hostname
-            socket.gethostbyname(host)
+            _resolve_and_cache(host, cache_ttl_seconds)
             # Success - return immediately
             return
-        except (socket.gaierror, socket.herror, OSError) as e:
+        except OSError as e:  # socket.gaierror is an OSError subclass
+            # Never keep serving a stale entry for a host that stopped resolving
+            with _DNS_CACHE_LOCK:
+                _DNS_CACHE.pop(host, None)
+
             attempt += 1
             if attempt >= retry_count:
                 # All retries exhausted
@@ -123,8 +163,12 @@ def scrape_jobs_for_term(
         if df is None or df.empty:
             return []
 
-        # Convert DataFrame to list of dictionaries
-        records = df.to_dict(orient="records")
+        # Convert DataFrame to list of dictionaries. Column-wise tolist()
+        # converts cells to native Python types in C; each row is then a
+        # single zip, avoiding to_dict's per-cell boxing.
+        columns = df.columns.tolist()
+        arrays = [df.iloc[:, i].tolist() for i in range(len(columns))]
+        records = [dict(zip(columns, row)) for row in zip(*arrays)]
         return records
 
     except Exception as e:
@@ -5,13 +5,21 @@ This module provides utilities to compile LaTeX files into PDFs using pdflatex,
 with pre-compile validation including placeholder scanning.
 """
 
+import os
+import shutil
 import subprocess
+import tempfile
+import threading
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from models.errors import ToolError, ErrorCode
 from utils.latex_guardrails import scan_tex_for_placeholders
 
+# How much of a failed pdflatex log is kept for the error message
+MAX_ERROR_LINES = 5
+OUTPUT_HEAD_CHARS = 500
+
 
 def compile_resume_pdf(
     tex_path: str, pdflatex_cmd: str = "pdflatex", timeout: int = 30
@@ -67,35 +75,60 @@ def compile_resume_pdf(
         # Fail with VALIDATION_ERROR and skip compile
         raise ToolError(code=ErrorCode.VALIDATION_ERROR, message=error_msg)
 
-    # Requirement 5.1: Run pdflatex to compile PDF
+    # Requirement 5.1: Run pdflatex to compile PDF. Build artifacts (.aux,
+    # .log, the PDF itself) go to a private directory next to the source so
+    # concurrent compiles of the same workspace cannot clobber each other;
+    # only the finished PDF is moved into place.
     pdf_path = tex_file.parent / "resume.pdf"
     working_dir = tex_file.parent
 
+    build_dir = Path(tempfile.mkdtemp(prefix=".pdflatex-", dir=working_dir))
     try:
-        # Run pdflatex with minimal output
-        result = subprocess.run(
-            [pdflatex_cmd, "-interaction=nonstopmode", "-halt-on-error", tex_file.name],
-            cwd=working_dir,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
-
-        # Check if compilation succeeded
-        if result.returncode != 0:
-            # Extract relevant error from output
-            error_lines = []
-            for line in result.stdout.split("\n"):
-                if line.startswith("!") or "error" in line.lower():
-                    error_lines.append(line)
+        _run_pdflatex(tex_file, build_dir, pdflatex_cmd, timeout)
 
-            error_summary = "\n".join(error_lines[:5]) if error_lines else result.stdout[:500]
+        # Requirement 5.4: Verify PDF exists and has non-zero size
+        built_pdf = build_dir / f"{tex_file.stem}.pdf"
+        if not built_pdf.exists():
+            raise ToolError(
+                code=ErrorCode.COMPILE_ERROR,
+                message="pdflatex completed but resume.pdf was not created",
+            )
 
+        if built_pdf.stat().st_size == 0:
             raise ToolError(
                 code=ErrorCode.COMPILE_ERROR,
-                message=f"pdflatex compilation failed: {error_summary}",
+                message="pdflatex created resume.pdf but file is empty (0 bytes)",
             )
 
+        os.replace(built_pdf, pdf_path)
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+
+    return True, None
+
+
+def _run_pdflatex(tex_file: Path, build_dir: Path, pdflatex_cmd: str, timeout: int) -> None:
+    """
+    Run pdflatex on tex_file, writing all outputs into build_dir.
+
+    pdflatex runs from the tex directory so relative \\input paths and assets
+    still resolve against the source tree.
+
+    Raises:
+        ToolError: With COMPILE_ERROR code if pdflatex fails or cannot run
+    """
+    try:
+        returncode, error_lines, output_head = _stream_pdflatex(
+            [
+                pdflatex_cmd,
+                "-interaction=nonstopmode",
+                "-halt-on-error",
+                f"-output-directory={build_dir.name}",
+                tex_file.name,
+            ],
+            cwd=tex_file.parent,
+            timeout=timeout,
+        )
     except subprocess.TimeoutExpired:
         raise ToolError(
             code=ErrorCode.COMPILE_ERROR,
@@ -110,21 +143,64 @@ def compile_resume_pdf(
             code=ErrorCode.COMPILE_ERROR, message=f"pdflatex execution failed: {str(e)}"
         )
 
-    # Requirement 5.4: Verify PDF exists and has non-zero size
-    if not pdf_path.exists():
+    # Check if compilation succeeded
+    if returncode != 0:
+        error_summary = "\n".join(error_lines) if error_lines else output_head
         raise ToolError(
             code=ErrorCode.COMPILE_ERROR,
-            message="pdflatex completed but resume.pdf was not created",
+            message=f"pdflatex compilation failed: {error_summary}",
         )
 
-    pdf_size = pdf_path.stat().st_size
-    if pdf_size == 0:
-        raise ToolError(
-            code=ErrorCode.COMPILE_ERROR,
-            message="pdflatex created resume.pdf but file is empty (0 bytes)",
-        )
 
-    return True, None
+def _stream_pdflatex(cmd: List[str], cwd: Path, timeout: int) -> Tuple[int, List[str], str]:
+    """
+    Run pdflatex, keeping only the parts of its log used for error reports.
+
+    The log is read line by line instead of being buffered whole: the first
+    MAX_ERROR_LINES error lines and the first OUTPUT_HEAD_CHARS characters
+    are kept, the rest is drained and dropped. A timer kills the process
+    once timeout expires, since a blocked read cannot observe a deadline.
+
+    Returns:
+        Tuple of (returncode, error_lines, output_head)
+
+    Raises:
+        subprocess.TimeoutExpired: If pdflatex ran longer than timeout
+        FileNotFoundError: If the pdflatex command does not exist
+    """
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+    )
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+    error_lines: List[str] = []
+    output_head = ""
+    try:
+        with proc:
+            for line in proc.stdout:
+                if len(output_head) < OUTPUT_HEAD_CHARS:
+                    output_head += line
+                if len(error_lines) < MAX_ERROR_LINES:
+                    line = line.rstrip("\n")
+                    if line.startswith("!") or "error" in line.lower():
+                        error_lines.append(line)
+    finally:
+        timer.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return proc.returncode, error_lines, output_head[:OUTPUT_HEAD_CHARS]
 
 
 def verify_pdf_exists(pdf_path: str) -> Tuple[bool, Optional[str]]:
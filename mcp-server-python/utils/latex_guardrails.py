@@ -6,14 +6,29 @@ Per current project convention, placeholder labels are identified by the
 stable marker substring: ``BULLET-POINT``.
 """
 
+import re
 from pathlib import Path
 from typing import List, Tuple, Optional
 
 
 # Single stable placeholder marker agreed by project convention.
-PLACEHOLDER_TOKENS = [
-    "BULLET-POINT",
-]
+# A tuple so callers can share it without defensive copies.
+PLACEHOLDER_TOKENS: Tuple[str, ...] = ("BULLET-POINT",)
+_PLACEHOLDER_TOKEN_BYTES = [token.encode("ascii") for token in PLACEHOLDER_TOKENS]
+
+# All markers as one literal alternation (longest first) so a single C-level
+# pass over the bytes finds every marker present.
+_PLACEHOLDER_RE = re.compile(
+    b"|".join(re.escape(token) for token in sorted(_PLACEHOLDER_TOKEN_BYTES, key=len, reverse=True))
+)
+
+# A marker contained in a longer marker can be hidden by the alternation when
+# both start at the same offset; only those need a direct substring check.
+_SHADOWABLE_TOKEN_BYTES = frozenset(
+    token
+    for token in _PLACEHOLDER_TOKEN_BYTES
+    if any(token != other and token in other for other in _PLACEHOLDER_TOKEN_BYTES)
+)
 
 
 def scan_tex_for_placeholders(tex_path: str) -> Tuple[bool, Optional[str], List[str]]:
@@ -47,19 +62,50 @@ def scan_tex_for_placeholders(tex_path: str) -> Tuple[bool, Optional[str], List[
         (False, 'resume.tex contains placeholder tokens: BULLET-POINT',
          ['BULLET-POINT'])
     """
-    tex_file = Path(tex_path)
-
-    # Read the file content
+    # Read the raw bytes; placeholder markers are ASCII so no decode is needed
     try:
-        content = tex_file.read_text(encoding="utf-8")
+        data = Path(tex_path).read_bytes()
     except (OSError, IOError) as e:
         return False, f"Failed to read resume.tex: {str(e)}", []
 
-    # Search for placeholder marker.
-    found_tokens = []
-    for token in PLACEHOLDER_TOKENS:
-        if token in content:
-            found_tokens.append(token)
+    return scan_tex_bytes_for_placeholders(data)
+
+
+def scan_tex_bytes_for_placeholders(data: bytes) -> Tuple[bool, Optional[str], List[str]]:
+    """
+    Scan already-loaded resume.tex bytes for placeholder tokens.
+
+    Lets callers that have read the file once reuse its content instead of
+    having the scanner open it again.
+
+    Args:
+        data: Raw resume.tex content
+
+    Returns:
+        Tuple of (is_valid, error_message, found_tokens), same as
+        scan_tex_for_placeholders()
+
+    Examples:
+        >>> scan_tex_bytes_for_placeholders(b"\\section{Projects} Shipped X")
+        (True, None, [])
+
+        >>> scan_tex_bytes_for_placeholders(b"WORK-BULLET-POINT-1")
+        (False, 'resume.tex contains placeholder tokens: BULLET-POINT',
+         ['BULLET-POINT'])
+    """
+    # One multi-pattern pass; stop as soon as every distinct marker is seen.
+    found = set()
+    for match in _PLACEHOLDER_RE.finditer(data):
+        found.add(match.group(0))
+        if len(found) == len(_PLACEHOLDER_TOKEN_BYTES):
+            break
+
+    # Report every marker present, in declaration order.
+    found_tokens = [
+        token
+        for token, token_bytes in zip(PLACEHOLDER_TOKENS, _PLACEHOLDER_TOKEN_BYTES)
+        if token_bytes in found or (token_bytes in _SHADOWABLE_TOKEN_BYTES and token_bytes in data)
+    ]
 
     # If any placeholders found, validation fails
     if found_tokens:
@@ -82,4 +128,4 @@ def get_placeholder_tokens() -> List[str]:
         >>> "BULLET-POINT" in tokens
         True
     """
-    return PLACEHOLDER_TOKENS.copy()
+    return list(PLACEHOLDER_TOKENS)
@@ -54,7 +54,7 @@ def paginate_results(
 
     This function:
     1. Determines if more pages exist (has_more)
-    2. Extracts the current page (first 'limit' rows)
+    2. Extracts the current page (first 'limit' rows) as a new list
     3. Builds next_cursor from the last row if has_more is True
 
     Args:
@@ -71,17 +71,15 @@ def paginate_results(
     if not rows:
         return ([], False, None)
 
-    # Compute pagination metadata
-    has_more = compute_has_more(rows, limit)
+    # Last page: every row fits, so only the cursor work is skipped. The page
+    # is still a copy so callers never alias the query result list.
+    if not compute_has_more(rows, limit):
+        return (rows[:limit], False, None)
 
     # Extract current page (first 'limit' rows)
     page = rows[:limit]
 
-    # Build next cursor if there are more pages
-    if has_more and page:
-        # Use the last row of the current page for the cursor
-        next_cursor = build_next_cursor(page[-1])
-    else:
-        next_cursor = None
+    # Use the last row of the current page for the cursor
+    next_cursor = build_next_cursor(rows[limit - 1]) if limit > 0 else None
 
-    return (page, has_more, next_cursor)
+    return (page, True, next_cursor)
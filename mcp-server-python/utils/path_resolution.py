@@ -8,6 +8,7 @@ repository root (or JOBWORKFLOW_ROOT override), not process cwd.
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
@@ -16,6 +17,18 @@ from config import config
 DEFAULT_DB_RELATIVE_PATH = Path("data/capture/jobs.db")
 
 
+# path_resolution.py is under mcp-server-python/utils/
+_MODULE_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@lru_cache(maxsize=8)
+def _resolve_repo_root(root_env: str | None) -> Path:
+    """Resolve (and memoize) the repo root for a given JOBWORKFLOW_ROOT value."""
+    if root_env:
+        return Path(root_env).expanduser().resolve()
+    return _MODULE_REPO_ROOT
+
+
 def get_repo_root() -> Path:
     """
     Resolve JobWorkFlow repository root.
@@ -23,23 +36,35 @@ def get_repo_root() -> Path:
     Resolution order:
     1. JOBWORKFLOW_ROOT environment variable
     2. Parent of mcp-server-python directory
+
+    The filesystem resolve() runs once per distinct JOBWORKFLOW_ROOT value;
+    repeat calls only read the environment.
     """
-    root_env = os.getenv("JOBWORKFLOW_ROOT")
-    if root_env:
-        return Path(root_env).expanduser().resolve()
+    return _resolve_repo_root(os.getenv("JOBWORKFLOW_ROOT"))
+
+
+@lru_cache(maxsize=8)
+def _repo_root_str(root_env: str | None) -> str:
+    """String form of the repo root, memoized alongside _resolve_repo_root."""
+    return str(_resolve_repo_root(root_env))
 
-    # path_resolution.py is under mcp-server-python/utils/
-    return Path(__file__).resolve().parents[2]
+
+def resolve_repo_relative_str(path: Union[str, Path]) -> str:
+    """
+    String variant of resolve_repo_relative_path for callers that do not
+    need a Path object; joins with os.path instead of pathlib.
+    """
+    path_str = os.fspath(path)
+    if os.path.isabs(path_str):
+        return path_str
+    return os.path.join(_repo_root_str(os.getenv("JOBWORKFLOW_ROOT")), path_str)
 
 
 def resolve_repo_relative_path(path: Union[str, Path]) -> Path:
     """
     Resolve absolute path directly; resolve relative path from repo root.
     """
-    path_obj = Path(path)
-    if path_obj.is_absolute():
-        return path_obj
-    return get_repo_root() / path_obj
+    return Path(resolve_repo_relative_str(path))
 
 
 def resolve_trackers_dir(trackers_dir: str | None) -> Path:
@@ -72,6 +97,6 @@ def resolve_db_path(db_path: str | None = None) -> Path:
 
     root_env = os.getenv("JOBWORKFLOW_ROOT")
     if root_env:
-        return Path(root_env).expanduser().resolve() / DEFAULT_DB_RELATIVE_PATH
+        return _resolve_repo_root(root_env) / DEFAULT_DB_RELATIVE_PATH
 
     return resolve_repo_relative_path(DEFAULT_DB_RELATIVE_PATH)
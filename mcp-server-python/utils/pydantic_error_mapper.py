@@ -8,25 +8,27 @@ from pydantic import ValidationError
 
 from models.errors import ToolError, create_validation_error
 
+# Prefix Pydantic adds to messages raised by field/model validators.
+_VALUE_ERROR_PREFIX = "Value error, "
+
 
 def _loc_to_field(loc: tuple[Any, ...]) -> str:
-    parts = [str(part) for part in loc if part != "__root__"]
+    parts = [part if type(part) is str else str(part) for part in loc if part != "__root__"]
     return ".".join(parts)
 
 
 def _clean_pydantic_message(message: str) -> str:
-    if message.startswith("Value error, "):
-        return message[len("Value error, ") :]
-    return message
+    return message.removeprefix(_VALUE_ERROR_PREFIX)
 
 
 def map_pydantic_validation_error(error: ValidationError) -> ToolError:
     """Map Pydantic ValidationError to existing validation ToolError."""
-    issues = error.errors()
-    if not issues:
+    if not error.error_count():
         return create_validation_error("Invalid input")
 
-    first = issues[0]
+    # Only the first issue is reported; skip building URLs, context and
+    # input echoes that the message never uses.
+    first = error.errors(include_url=False, include_context=False, include_input=False)[0]
     field = _loc_to_field(first.get("loc", ()))
     message = _clean_pydantic_message(first.get("msg", "Invalid input"))
 
@@ -6,14 +6,17 @@ Handles LinkedIn job ID parsing, timestamp normalization, and field mapping.
 """
 
 import json
+import os
 import re
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 
-# LinkedIn job URL pattern for extracting job IDs
-JOB_URL_ID_RE = re.compile(r"/jobs/view/(\d+)")
+# LinkedIn job URL pattern for extracting job IDs. ASCII-only \d: job IDs are
+# plain 0-9 digits and the narrower class is cheaper to match.
+JOB_URL_ID_MARKER = "/jobs/view/"
+JOB_URL_ID_RE = re.compile(r"/jobs/view/(\d+)", re.ASCII)
 
 
 def normalize_text(value: Any) -> str:
@@ -50,14 +53,20 @@ def parse_job_id(url: str, fallback: Any) -> str:
     if not url:
         return normalize_text(fallback)
 
-    match = JOB_URL_ID_RE.search(url)
+    # Non-LinkedIn URLs are rejected by a plain substring search before any
+    # regex work; otherwise match anchored at the first marker.
+    idx = url.find(JOB_URL_ID_MARKER)
+    if idx < 0:
+        return normalize_text(fallback)
+
+    match = JOB_URL_ID_RE.match(url, idx) or JOB_URL_ID_RE.search(url, idx + 1)
     if match:
         return match.group(1)
 
     return normalize_text(fallback)
 
 
-def parse_captured_at(date_posted: Any) -> str:
+def parse_captured_at(date_posted: Any, fallback: Optional[str] = None) -> str:
     """
     Normalize timestamp to UTC ISO string.
 
@@ -66,27 +75,46 @@ def parse_captured_at(date_posted: Any) -> str:
 
     Args:
         date_posted: Date value from source (string or other)
+        fallback: Optional precomputed fallback timestamp, so a batch can
+            share one "now" value instead of reading the clock per record
 
     Returns:
         UTC ISO timestamp string
 
     **Validates: Requirements 4.4**
     """
-    if not date_posted:
-        return datetime.now(timezone.utc).isoformat()
-
-    if isinstance(date_posted, str):
+    if date_posted and isinstance(date_posted, str):
         try:
-            # Handle ISO format with Z suffix
-            dt = datetime.fromisoformat(date_posted.replace("Z", "+00:00"))
-            return dt.astimezone(timezone.utc).isoformat()
+            # fromisoformat accepts the Z suffix natively on Python 3.11+
+            dt = datetime.fromisoformat(date_posted)
         except ValueError:
-            return datetime.now(timezone.utc).isoformat()
+            pass
+        else:
+            # Already-UTC values need no timezone conversion
+            if dt.tzinfo is not timezone.utc:
+                dt = dt.astimezone(timezone.utc)
+            return dt.isoformat()
 
-    return datetime.now(timezone.utc).isoformat()
+    return fallback or datetime.now(timezone.utc).isoformat()
 
 
-def clean_record(record: Dict[str, Any], source_override: Optional[str] = None) -> Dict[str, Any]:
+def _batch_uuids(count: int) -> List[str]:
+    """
+    Generate UUID4 strings from a single os.urandom call.
+
+    Equivalent to calling uuid.uuid4() count times, but amortizes the
+    random-bytes syscall across the whole batch.
+    """
+    buf = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=buf[i : i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+def clean_record(
+    record: Dict[str, Any],
+    source_override: Optional[str] = None,
+    record_id: Optional[str] = None,
+    captured_at_fallback: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Map raw source record to cleaned schema.
 
@@ -101,6 +129,8 @@ def clean_record(record: Dict[str, Any], source_override: Optional[str] = None)
     Args:
         record: Raw source record from JobSpy
         source_override: Optional source name override
+        record_id: Optional pre-generated internal UUID (generated if omitted)
+        captured_at_fallback: Optional timestamp used when date_posted is unusable
 
     Returns:
         Cleaned record with normalized fields
@@ -109,12 +139,30 @@ def clean_record(record: Dict[str, Any], source_override: Optional[str] = None)
     """
     # Map URL with fallback (Requirement 4.2)
     url = normalize_text(record.get("job_url") or record.get("job_url_direct"))
+    description = normalize_text(record.get("description"))
+    return _build_cleaned_record(
+        record, url, description, source_override, record_id, captured_at_fallback
+    )
+
+
+def _build_cleaned_record(
+    record: Dict[str, Any],
+    url: str,
+    description: str,
+    source_override: Optional[str],
+    record_id: Optional[str],
+    captured_at_fallback: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Build the cleaned record once URL and description are normalized.
 
+    Split out of clean_record so normalize_and_filter can apply the quality
+    filters on those two fields before paying for the remaining mapping.
+    """
     # Direct field mappings (Requirement 4.1)
     title = normalize_text(record.get("title"))
     company = normalize_text(record.get("company"))
     location = normalize_text(record.get("location"))
-    description = normalize_text(record.get("description"))
 
     # Source mapping with override support (Requirement 4.1)
     source = normalize_text(source_override or record.get("site") or "unknown")
@@ -123,7 +171,7 @@ def clean_record(record: Dict[str, Any], source_override: Optional[str] = None)
     job_id = parse_job_id(url, record.get("id"))
 
     # Normalize timestamp (Requirement 4.4)
-    captured_at = parse_captured_at(record.get("date_posted"))
+    captured_at = parse_captured_at(record.get("date_posted"), captured_at_fallback)
 
     # Build cleaned record (Requirement 4.1, 4.5)
     cleaned = {
@@ -139,7 +187,7 @@ def clean_record(record: Dict[str, Any], source_override: Optional[str] = None)
         # Backward-compatible aliases kept during migration period.
         "jobId": job_id,
         "capturedAt": captured_at,
-        "id": str(uuid.uuid4()),
+        "id": record_id or str(uuid.uuid4()),
     }
     return cleaned
 
@@ -197,8 +245,9 @@ def normalize_and_filter(
     Normalize and filter raw source records.
 
     Combines cleaning and filtering in one pass:
-    1. Clean each raw record to normalized schema
-    2. Filter based on quality rules
+    1. Normalize URL and description and apply the quality rules
+    2. Clean surviving records to normalized schema; filtered records never
+       pay for job ID, timestamp, or id generation
 
     Args:
         raw_records: List of raw source records
@@ -210,11 +259,32 @@ def normalize_and_filter(
 
     **Validates: Requirements 5.1, 5.2, 5.3, 5.5**
     """
-    # Clean all records
-    cleaned = [clean_record(record, source_override) for record in raw_records]
+    filtered = []
+    skip_counts = {
+        "skipped_no_url": 0,
+        "skipped_no_description": 0,
+    }
+    record_ids = iter(_batch_uuids(len(raw_records)))
+    now_iso = datetime.now(timezone.utc).isoformat()
+
+    for record in raw_records:
+        # Always skip records without URL
+        url = normalize_text(record.get("job_url") or record.get("job_url_direct"))
+        if not url:
+            skip_counts["skipped_no_url"] += 1
+            continue
+
+        # Optionally skip records without description
+        description = normalize_text(record.get("description"))
+        if require_description and not description:
+            skip_counts["skipped_no_description"] += 1
+            continue
 
-    # Filter and collect skip counts
-    filtered, skip_counts = filter_records(cleaned, require_description)
+        filtered.append(
+            _build_cleaned_record(
+                record, url, description, source_override, next(record_ids), now_iso
+            )
+        )
 
     return filtered, skip_counts
 
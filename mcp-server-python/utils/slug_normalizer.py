@@ -0,0 +1,61 @@
+"""
+Shared text normalization for application slugs.
+
+Both tracker planning (initialize_shortlist_trackers) and slug resolution
+(career_tailor) build slugs from company and position names; they must
+normalize text identically so the same job maps to the same workspace.
+"""
+
+import re
+import string
+from functools import lru_cache
+
+# Runs of non [a-z0-9] characters (underscores included) become one underscore
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+# ASCII fast path: every non [a-z0-9] code point -> "_"
+_SLUG_ALLOWED = frozenset(string.ascii_lowercase + string.digits)
+_ASCII_SLUG_TABLE = str.maketrans({chr(c): "_" for c in range(128) if chr(c) not in _SLUG_ALLOWED})
+
+# Batches repeat the same companies and positions; normalization is pure
+_SLUG_TEXT_CACHE_MAXSIZE = 1024
+
+
+@lru_cache(maxsize=_SLUG_TEXT_CACHE_MAXSIZE)
+def normalize_slug_text(text: str) -> str:
+    """
+    Normalize text to a slug-safe format.
+
+    Normalization rules:
+    - Convert to lowercase
+    - Replace non-alphanumeric characters with underscores
+    - Collapse consecutive underscores to single underscore
+    - Strip leading/trailing underscores
+
+    Args:
+        text: Input text to normalize
+
+    Returns:
+        Normalized slug-safe text
+
+    Examples:
+        >>> normalize_slug_text("General Motors")
+        'general_motors'
+        >>> normalize_slug_text("L'Oréal")
+        'l_or_al'
+        >>> normalize_slug_text("a__!_b")
+        'a_b'
+    """
+    # Convert to lowercase
+    normalized = text.lower()
+
+    # ASCII: translate table, then drop empty pieces to collapse and strip
+    # underscore runs in one step
+    if normalized.isascii():
+        return "_".join(filter(None, normalized.translate(_ASCII_SLUG_TABLE).split("_")))
+
+    # Replace each run of non-alphanumeric characters with one underscore
+    normalized = _NON_ALNUM_RE.sub("_", normalized)
+
+    # Strip leading/trailing underscores
+    return normalized.strip("_")
@@ -5,9 +5,19 @@ This module provides functions to resolve deterministic application_slug
 from tracker metadata, with resume_path taking precedence over fallback generation.
 """
 
-import re
-from typing import Dict, Any, Optional
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Optional
 from utils.artifact_paths import parse_resume_path, ArtifactPathError
+from utils.slug_normalizer import normalize_slug_text
+
+# Expected resume path layout: data/applications/<slug>/resume/resume.pdf
+_SLUG_PATH_PREFIX = "data/applications/"
+_SLUG_PATH_SUFFIX = "/resume/resume.pdf"
+
+# Batch runs resolve the same trackers repeatedly; results are pure functions
+# of their string inputs
+_SLUG_CACHE_MAXSIZE = 1024
 
 
 def extract_slug_from_resume_path(resume_path_raw: Optional[str]) -> Optional[str]:
@@ -47,9 +57,15 @@ def extract_slug_from_resume_path(resume_path_raw: Optional[str]) -> Optional[st
         >>> extract_slug_from_resume_path("invalid/path")
         None
     """
-    if resume_path_raw is None:
+    # Non-string values are unparsable; only strings are hashable cache keys
+    if not isinstance(resume_path_raw, str):
         return None
+    return _extract_slug_from_str(resume_path_raw)
+
 
+@lru_cache(maxsize=_SLUG_CACHE_MAXSIZE)
+def _extract_slug_from_str(resume_path_raw: str) -> Optional[str]:
+    """Memoized slug extraction for a string resume_path."""
     try:
         # Parse the resume_path to get the clean path
         resume_pdf_path = parse_resume_path(resume_path_raw)
@@ -58,17 +74,18 @@ def extract_slug_from_resume_path(resume_path_raw: Optional[str]) -> Optional[st
             return None
 
         # Expected format: data/applications/<slug>/resume/resume.pdf
-        # Use regex to extract the slug component
-        pattern = r"^data/applications/([^/]+)/resume/resume\.pdf$"
-        match = re.match(pattern, resume_pdf_path)
-
-        if match:
-            return match.group(1)
-
-        # If pattern doesn't match, return None (fallback will be used)
+        # Fixed prefix and suffix, so plain string checks extract the slug
+        if resume_pdf_path.startswith(_SLUG_PATH_PREFIX) and resume_pdf_path.endswith(
+            _SLUG_PATH_SUFFIX
+        ):
+            slug = resume_pdf_path[len(_SLUG_PATH_PREFIX) : -len(_SLUG_PATH_SUFFIX)]
+            if slug and "/" not in slug:
+                return slug
+
+        # If the layout doesn't match, return None (fallback will be used)
         return None
 
-    except (ArtifactPathError, Exception):
+    except ArtifactPathError:
         # If parsing fails, return None to trigger fallback
         return None
 
@@ -133,6 +150,9 @@ def _normalize_text(text: str) -> str:
     """
     Normalize text to a slug-safe format.
 
+    Delegates to the shared normalize_slug_text so fallback slugs match
+    the slugs produced by tracker planning.
+
     Normalization rules:
     - Convert to lowercase
     - Replace non-alphanumeric characters with underscores
@@ -154,20 +174,12 @@ def _normalize_text(text: str) -> str:
         'at_t_inc'
         >>> _normalize_text("Backend/Full-Stack Developer")
         'backend_full_stack_developer'
+        >>> _normalize_text("a!!!b")
+        'a_b'
+        >>> _normalize_text("a__!_b")
+        'a_b'
     """
-    # Convert to lowercase
-    normalized = text.lower()
-
-    # Replace non-alphanumeric characters with underscores
-    normalized = re.sub(r"[^a-z0-9]+", "_", normalized)
-
-    # Collapse consecutive underscores
-    normalized = re.sub(r"_+", "_", normalized)
-
-    # Strip leading/trailing underscores
-    normalized = normalized.strip("_")
-
-    return normalized
+    return normalize_slug_text(text)
 
 
 def resolve_application_slug(
@@ -253,15 +265,16 @@ def resolve_application_slug(
     if not position:
         raise ValueError("Tracker data is missing required 'position' field")
 
-    # Try to extract slug from resume_path (priority 1)
+    # Try to extract slug from resume_path (priority 1). Empty/missing values
+    # can never yield a slug, so they go straight to the fallback.
     resume_path_raw = tracker_data.get("resume_path")
-    slug_from_path = extract_slug_from_resume_path(resume_path_raw)
-
-    if slug_from_path is not None:
-        return slug_from_path
+    if resume_path_raw:
+        slug_from_path = extract_slug_from_resume_path(resume_path_raw)
+        if slug_from_path is not None:
+            return sys.intern(slug_from_path)
 
     # Fallback: generate slug from company/position/job_db_id (priority 2)
     # Use item_job_db_id if provided, otherwise use tracker job_db_id
     job_db_id = item_job_db_id if item_job_db_id is not None else tracker_data.get("job_db_id")
 
-    return generate_fallback_slug(company, position, job_db_id)
+    return sys.intern(generate_fallback_slug(company, position, job_db_id))
@@ -5,13 +5,63 @@ This module provides functions to parse tracker markdown files,
 extract frontmatter and body content, and validate required fields.
 """
 
-from typing import Dict, Any, Tuple, Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Tuple, Optional, Union
+import os
 import re
+import stat
+import sys
+import threading
+import time
 import yaml
 
 from models.errors import create_file_not_found_error, create_validation_error
 from utils.path_resolution import resolve_repo_relative_path
 
+# Prefer the libyaml-backed loader; same safe semantics, C-speed parsing
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Frontmatter layout: --- at start, YAML content, --- delimiter, then body.
+# A delimiter line is '---' followed by optional whitespace and a newline.
+_FRONTMATTER_DELIMITER = "---"
+_FRONTMATTER_CLOSE = "\n---"
+_FRONTMATTER_DELIMITER_BYTES = b"---"
+_FRONTMATTER_CLOSE_BYTES = b"\n---"
+_ASCII_WHITESPACE = frozenset(b" \t\n\x0b\x0c\r")
+
+# One scan over the body finds the '## Job Description' heading (case-
+# insensitive, surrounding whitespace allowed) and level 1-2 headings.
+# [^\S\n] is whitespace within a line, matching the per-line semantics.
+_JD_BOUNDARY_RE = re.compile(
+    r"^(?:(?P<jd>[^\S\n]*##[^\S\n]+Job[^\S\n]+Description[^\S\n]*$)|#{1,2}[^\S\n]+)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+# Parsed trackers keyed by resolved path; entries are valid while the file's
+# (mtime_ns, size, inode) signature is unchanged. Bounded LRU.
+_TRACKER_CACHE_MAXSIZE = 256
+_TRACKER_CACHE: "OrderedDict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]]" = OrderedDict()
+_TRACKER_CACHE_LOCK = threading.Lock()
+
+# Files modified within this window are not cached: filesystem timestamp
+# granularity could hide a same-size rewrite behind an identical mtime.
+_TRACKER_CACHE_RACY_NS = 2_000_000_000
+
+# Read size for data appended after a tracker's fstat
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Frontmatter-only lookups first read just this many leading bytes
+_FRONTMATTER_PREFIX_BYTES = 4096
+
+# Frontmatter string values shorter than this are interned
+_INTERN_MAX_LEN = 64
+
 
 class TrackerParseError(Exception):
     """Exception raised when tracker parsing fails."""
@@ -19,6 +69,18 @@ class TrackerParseError(Exception):
     pass
 
 
+def clear_tracker_cache() -> None:
+    """Drop all cached tracker parses."""
+    with _TRACKER_CACHE_LOCK:
+        _TRACKER_CACHE.clear()
+
+
+def _copy_parsed(parsed: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached parse so callers cannot mutate the cached dicts."""
+    frontmatter = dict(parsed["frontmatter"])
+    return {"frontmatter": frontmatter, "body": parsed["body"], "status": parsed["status"]}
+
+
 def parse_tracker_file(tracker_path: str) -> Dict[str, Any]:
     """
     Parse tracker markdown file and extract frontmatter and body.
@@ -56,32 +118,206 @@ def parse_tracker_file(tracker_path: str) -> Dict[str, Any]:
         >>> "body" in result
         True
     """
-    # Verify file exists and is readable (Requirement 2.1)
+    path, stat_result = _stat_tracker(tracker_path)
+
+    # Reuse an earlier parse while the file is unchanged
+    cache_key = str(path)
+    signature = (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+    cached = _cache_lookup(cache_key, signature)
+    if cached is not None:
+        return _copy_parsed(cached)
+
+    raw, stat_result = _read_tracker_bytes(path, tracker_path)
+    frontmatter, body = _parse_tracker_bytes(raw)
+
+    # Return parsed data with convenience status field. The cache signature
+    # comes from the descriptor that was read, so it always matches the bytes.
+    parsed = {"frontmatter": frontmatter, "body": body, "status": frontmatter["status"]}
+    signature = (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+    if time.time_ns() - stat_result.st_mtime_ns < _TRACKER_CACHE_RACY_NS:
+        return parsed
+    with _TRACKER_CACHE_LOCK:
+        _TRACKER_CACHE[cache_key] = (signature, parsed)
+        _TRACKER_CACHE.move_to_end(cache_key)
+        if len(_TRACKER_CACHE) > _TRACKER_CACHE_MAXSIZE:
+            _TRACKER_CACHE.popitem(last=False)
+    return _copy_parsed(parsed)
+
+
+def _parse_frontmatter_only(tracker_path: str) -> Dict[str, Any]:
+    """
+    Parse only a tracker's frontmatter, skipping the body.
+
+    Same validation and errors as parse_tracker_file, but the body is never
+    decoded. Served from the tracker cache when a full parse is cached.
+
+    Args:
+        tracker_path: Path to the tracker markdown file
+
+    Returns:
+        Frontmatter dictionary (always containing 'status')
+    """
+    path, stat_result = _stat_tracker(tracker_path)
+    signature = (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+    cached = _cache_lookup(str(path), signature)
+    if cached is not None:
+        return dict(cached["frontmatter"])
+
+    # Frontmatter sits at the top: read a prefix and stop there when it
+    # already holds the complete, unambiguous frontmatter block
+    raw, _ = _read_tracker_bytes(path, tracker_path, limit=_FRONTMATTER_PREFIX_BYTES)
+    if len(raw) == _FRONTMATTER_PREFIX_BYTES:
+        yaml_content = _frontmatter_from_prefix(raw)
+        if yaml_content is not None:
+            return _frontmatter_from_yaml(yaml_content)
+        raw, _ = _read_tracker_bytes(path, tracker_path)
+
+    frontmatter, _ = _parse_tracker_bytes(raw, include_body=False)
+    return frontmatter
+
+
+def _frontmatter_from_prefix(prefix: bytes) -> Optional[bytes]:
+    """
+    Return the frontmatter YAML bytes if a file prefix fully determines them.
+
+    The split must succeed on bytes, and the closing delimiter's whitespace
+    run must end inside the prefix (otherwise more whitespace in the unread
+    remainder could move the body start). Returns None when the whole file
+    is needed.
+    """
+    if b"\r" in prefix:
+        return None
+    split = _split_frontmatter_bytes(prefix)
+    if split is None:
+        return None
+    yaml_content, body_start = split
+    if not prefix[body_start:].strip():
+        return None
+    return yaml_content
+
+
+def _stat_tracker(tracker_path: str) -> Tuple[Path, os.stat_result]:
+    """
+    Resolve a tracker path and stat it, requiring a regular file.
+
+    One stat serves the existence/type checks (Requirement 2.1) and the
+    cache signature.
+
+    Raises:
+        FileNotFoundError: If the path is missing or not a regular file
+    """
     path = resolve_repo_relative_path(tracker_path)
-    if not path.exists():
+    try:
+        stat_result = os.stat(path)
+    except OSError:
         raise FileNotFoundError(f"Tracker file not found: {tracker_path}")
 
-    if not path.is_file():
+    if not stat.S_ISREG(stat_result.st_mode):
         raise FileNotFoundError(f"Tracker path is not a file: {tracker_path}")
 
+    return path, stat_result
+
+
+def _cache_lookup(cache_key: str, signature: Tuple[int, int, int]) -> Optional[Dict[str, Any]]:
+    """Return the cached parse for cache_key if its signature still matches."""
+    with _TRACKER_CACHE_LOCK:
+        cached = _TRACKER_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            _TRACKER_CACHE.move_to_end(cache_key)
+            return cached[1]
+    return None
+
+
+def _read_tracker_bytes(
+    path: Path, tracker_path: str, limit: Optional[int] = None
+) -> Tuple[bytes, os.stat_result]:
+    """
+    Read a tracker's raw bytes with open + fstat + read on one descriptor.
+
+    Returns the bytes and the descriptor's stat result. The file type is
+    re-checked on the open descriptor, so a path swapped for a directory
+    after the initial stat is still rejected. With limit, at most that many
+    leading bytes are read.
+
+    Raises:
+        FileNotFoundError: If the file cannot be opened/read or is not regular
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    except OSError as e:
+        raise FileNotFoundError(f"Tracker file not readable: {tracker_path}") from e
     try:
-        content = path.read_text(encoding="utf-8")
-    except (IOError, OSError) as e:
+        stat_result = os.fstat(fd)
+        raw = None
+        if stat.S_ISREG(stat_result.st_mode) and limit is not None:
+            raw = os.read(fd, limit)
+            while len(raw) < limit:
+                more = os.read(fd, limit - len(raw))
+                if not more:
+                    break
+                raw += more
+        elif stat.S_ISREG(stat_result.st_mode):
+            raw = os.read(fd, stat_result.st_size)
+            # Pick up anything appended since the fstat
+            while True:
+                more = os.read(fd, _READ_CHUNK_SIZE)
+                if not more:
+                    break
+                raw += more
+    except OSError as e:
         raise FileNotFoundError(f"Tracker file not readable: {tracker_path}") from e
+    finally:
+        os.close(fd)
+
+    if raw is None:
+        raise FileNotFoundError(f"Tracker path is not a file: {tracker_path}")
+    return raw, stat_result
+
+
+def _parse_tracker_bytes(
+    raw: bytes, include_body: bool = True
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Parse raw tracker bytes into (frontmatter, body).
 
-    # Parse frontmatter and body
+    Plain-LF files are split on bytes and the frontmatter slice goes to the
+    YAML loader undecoded; anything else takes the text path with
+    read_text()'s universal-newline translation. With include_body=False the
+    body is not decoded on the byte path and None is returned for it.
+
+    Raises:
+        TrackerParseError: If frontmatter is malformed or missing 'status'
+    """
+    split = None if b"\r" in raw else _split_frontmatter_bytes(raw)
+    if split is not None:
+        yaml_content, body_start = split
+        body = raw[body_start:].decode("utf-8") if include_body else None
+        return _frontmatter_from_yaml(yaml_content), body
+
+    content = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
     try:
         frontmatter, body = _extract_frontmatter_and_body(content)
     except Exception as e:
         raise TrackerParseError(f"Failed to parse tracker frontmatter: {str(e)}") from e
+    _require_status(frontmatter)
+    return frontmatter, body
+
+
+def _frontmatter_from_yaml(yaml_content: bytes) -> Dict[str, Any]:
+    """Load split-out frontmatter bytes and require the 'status' field."""
+    try:
+        frontmatter = _load_frontmatter(yaml_content)
+    except Exception as e:
+        raise TrackerParseError(f"Failed to parse tracker frontmatter: {str(e)}") from e
+    _require_status(frontmatter)
+    return frontmatter
+
 
-    # Validate that status field is present (Requirement 2.3, 2.4)
+def _require_status(frontmatter: Dict[str, Any]) -> None:
+    """Validate that status field is present (Requirement 2.3, 2.4)."""
     if "status" not in frontmatter:
         raise TrackerParseError("Tracker frontmatter is missing required 'status' field")
 
-    # Return parsed data with convenience status field
-    return {"frontmatter": frontmatter, "body": body, "status": frontmatter["status"]}
-
 
 def _extract_frontmatter_and_body(content: str) -> Tuple[Dict[str, Any], str]:
     """
@@ -113,26 +349,26 @@ def _extract_frontmatter_and_body(content: str) -> Tuple[Dict[str, Any], str]:
         >>> "## Job Description" in body
         True
     """
-    # Match frontmatter pattern: --- at start, YAML content, --- delimiter
-    # Pattern explanation:
-    # ^---\s*\n  : Start with ---, optional whitespace, newline
-    # (.*?)      : Capture YAML content (non-greedy)
-    # \n---\s*\n : End with newline, ---, optional whitespace, newline
-    # (.*)$      : Capture remaining content as body
-    pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-    match = re.match(pattern, content, re.DOTALL)
-
-    if not match:
+    # Split on the --- delimiters with plain string scans
+    split = _split_frontmatter(content)
+    if split is None:
         raise TrackerParseError(
             "Tracker file does not contain valid YAML frontmatter delimited by '---'"
         )
 
-    yaml_content = match.group(1)
-    body = match.group(2)
+    yaml_content, body = split
+    return _load_frontmatter(yaml_content), body
+
+
+def _load_frontmatter(yaml_content: Union[str, bytes]) -> Dict[str, Any]:
+    """
+    Parse a frontmatter block (text or UTF-8 bytes) into a dictionary.
 
-    # Parse YAML frontmatter
+    Raises:
+        TrackerParseError: If the YAML is invalid or not a mapping
+    """
     try:
-        frontmatter = yaml.safe_load(yaml_content)
+        frontmatter = yaml.load(yaml_content, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise TrackerParseError(f"Invalid YAML in frontmatter: {str(e)}") from e
 
@@ -140,7 +376,108 @@ def _extract_frontmatter_and_body(content: str) -> Tuple[Dict[str, Any], str]:
     if not isinstance(frontmatter, dict):
         raise TrackerParseError("Frontmatter must be a YAML dictionary")
 
-    return frontmatter, body
+    # Short values (status, company, position) recur across trackers; intern
+    # them so repeated comparisons and dict keys share one object
+    for key, value in frontmatter.items():
+        if type(value) is str and len(value) < _INTERN_MAX_LEN:
+            frontmatter[key] = sys.intern(value)
+
+    return frontmatter
+
+
+def _delimiter_line_end(content: str, pos: int) -> int:
+    """
+    Return the index just past a delimiter line's newline, or -1.
+
+    pos points right after '---'. The delimiter may be followed by any
+    whitespace; like the original ``---\\s*\\n`` pattern, the line ends at
+    the last newline within that whitespace run.
+    """
+    end = pos
+    length = len(content)
+    while end < length and content[end].isspace():
+        end += 1
+    newline = content.rfind("\n", pos, end)
+    return newline + 1 if newline >= 0 else -1
+
+
+def _split_frontmatter(content: str) -> Optional[Tuple[str, str]]:
+    """
+    Split content into (yaml_content, body), or None without valid delimiters.
+
+    Equivalent to matching ``^---\\s*\\n(.*?)\\n---\\s*\\n(.*)$`` with DOTALL,
+    using startswith/find instead of the regex engine.
+    """
+    if not content.startswith(_FRONTMATTER_DELIMITER):
+        return None
+
+    yaml_start = _delimiter_line_end(content, len(_FRONTMATTER_DELIMITER))
+    if yaml_start < 0:
+        return None
+
+    # First closing delimiter line after the YAML block
+    close = content.find(_FRONTMATTER_CLOSE, yaml_start)
+    while close >= 0:
+        body_start = _delimiter_line_end(content, close + len(_FRONTMATTER_CLOSE))
+        if body_start >= 0:
+            return content[yaml_start:close], content[body_start:]
+        close = content.find(_FRONTMATTER_CLOSE, close + 1)
+
+    # Empty frontmatter closed right after blank lines ("---\\n\\n---\\n"): the
+    # pattern backtracks the opening line to an earlier newline so the last
+    # blank line can start the closing delimiter.
+    if content.startswith(_FRONTMATTER_DELIMITER, yaml_start):
+        previous = content.rfind("\n", len(_FRONTMATTER_DELIMITER), yaml_start - 1)
+        if previous >= 0:
+            body_start = _delimiter_line_end(content, yaml_start + len(_FRONTMATTER_DELIMITER))
+            if body_start >= 0:
+                return content[previous + 1 : yaml_start - 1], content[body_start:]
+
+    return None
+
+
+def _bytes_delimiter_line_end(raw: bytes, pos: int) -> int:
+    """
+    Byte-level _delimiter_line_end; returns -2 when the result is ambiguous.
+
+    Only ASCII whitespace is recognised here. If the whitespace run stops at
+    a byte that may begin wider str whitespace (\\x1c-\\x1f or non-ASCII),
+    the caller must fall back to the text splitter.
+    """
+    end = pos
+    length = len(raw)
+    while end < length and raw[end] in _ASCII_WHITESPACE:
+        end += 1
+    if end < length and (raw[end] >= 0x80 or 0x1C <= raw[end] <= 0x1F):
+        return -2
+    newline = raw.rfind(b"\n", pos, end)
+    return newline + 1 if newline >= 0 else -1
+
+
+def _split_frontmatter_bytes(raw: bytes) -> Optional[Tuple[bytes, int]]:
+    """
+    Split raw file bytes into (yaml_bytes, body_offset).
+
+    Returns None when there is no match or the split is ambiguous at byte
+    level; _split_frontmatter on the decoded text is then authoritative.
+    """
+    if not raw.startswith(_FRONTMATTER_DELIMITER_BYTES):
+        return None
+
+    yaml_start = _bytes_delimiter_line_end(raw, len(_FRONTMATTER_DELIMITER_BYTES))
+    if yaml_start < 0:
+        return None
+
+    close = raw.find(_FRONTMATTER_CLOSE_BYTES, yaml_start)
+    while close >= 0:
+        body_start = _bytes_delimiter_line_end(raw, close + len(_FRONTMATTER_CLOSE_BYTES))
+        if body_start == -2:
+            return None
+        if body_start >= 0:
+            return raw[yaml_start:close], body_start
+        close = raw.find(_FRONTMATTER_CLOSE_BYTES, close + 1)
+
+    return None
 
 
 def get_tracker_status(tracker_path: str) -> str:
@@ -164,8 +501,7 @@ def get_tracker_status(tracker_path: str) -> str:
         >>> status
         'Reviewed'
     """
-    parsed = parse_tracker_file(tracker_path)
-    return parsed["status"]
+    return _parse_frontmatter_only(tracker_path)["status"]
 
 
 def get_frontmatter_field(tracker_path: str, field_name: str) -> Any:
@@ -191,8 +527,7 @@ def get_frontmatter_field(tracker_path: str, field_name: str) -> Any:
         >>> "resume.pdf" in resume_path
         True
     """
-    parsed = parse_tracker_file(tracker_path)
-    return parsed["frontmatter"].get(field_name)
+    return _parse_frontmatter_only(tracker_path).get(field_name)
 
 
 def parse_tracker_with_error_mapping(tracker_path: str) -> Dict[str, Any]:
@@ -256,7 +591,9 @@ def parse_tracker_with_error_mapping(tracker_path: str) -> Dict[str, Any]:
 
 
 def resolve_resume_pdf_path_from_tracker(
-    tracker_path: str, item_resume_pdf_path: Optional[str] = None
+    tracker_path: str,
+    item_resume_pdf_path: Optional[str] = None,
+    parsed_tracker: Optional[Dict[str, Any]] = None,
 ) -> str:
     """
     Resolve resume_pdf_path from tracker frontmatter when not provided by item.
@@ -273,6 +610,8 @@ def resolve_resume_pdf_path_from_tracker(
     Args:
         tracker_path: Path to the tracker markdown file
         item_resume_pdf_path: Optional resume_pdf_path override from finalize item
+        parsed_tracker: Optional result of parse_tracker_file for tracker_path;
+            when given, the tracker is not parsed again
 
     Returns:
         Resolved resume_pdf_path string
@@ -311,8 +650,8 @@ def resolve_resume_pdf_path_from_tracker(
     if item_resume_pdf_path is not None:
         return item_resume_pdf_path
 
-    # Parse tracker to get frontmatter
-    parsed = parse_tracker_file(tracker_path)
+    # Parse tracker to get frontmatter, unless the caller already has it
+    parsed = parsed_tracker if parsed_tracker is not None else parse_tracker_file(tracker_path)
     frontmatter = parsed["frontmatter"]
 
     # Get resume_path from frontmatter
@@ -370,30 +709,23 @@ def extract_job_description(body: str) -> str:
         ...
         TrackerParseError: Tracker is missing required '## Job Description' heading
     """
-    # Search for ## Job Description heading (case-insensitive)
-    jd_pattern = r"^##\s+Job\s+Description\s*$"
-    lines = body.split("\n")
-
-    jd_start_idx = None
-    for i, line in enumerate(lines):
-        if re.match(jd_pattern, line.strip(), re.IGNORECASE):
-            jd_start_idx = i
+    # Single regex scan: the first JD heading starts the section, the next
+    # level 1-2 heading (a line starting with '#') ends it
+    jd_start = None
+    jd_end = len(body)
+    for match in _JD_BOUNDARY_RE.finditer(body):
+        if jd_start is None:
+            if match.group("jd") is not None:
+                jd_start = match.end() + 1
+        elif body[match.start()] == "#":
+            jd_end = match.start()
             break
 
-    if jd_start_idx is None:
+    if jd_start is None:
         raise TrackerParseError("Tracker is missing required '## Job Description' heading")
 
-    # Extract content until next heading of same or higher level (## or #)
-    jd_content_lines = []
-    for i in range(jd_start_idx + 1, len(lines)):
-        line = lines[i]
-        # Check if this is a heading of level 1 or 2
-        if re.match(r"^#{1,2}\s+", line):
-            break
-        jd_content_lines.append(line)
-
-    # Join lines and strip leading/trailing whitespace
-    jd_content = "\n".join(jd_content_lines).strip()
+    # Strip leading/trailing whitespace
+    jd_content = body[jd_start:jd_end].strip()
 
     return jd_content
 
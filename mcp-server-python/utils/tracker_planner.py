@@ -5,15 +5,30 @@ This module provides functions to compute deterministic application slugs,
 tracker filenames, and paths for the initialize_shortlist_trackers tool.
 """
 
-import re
+import os
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import AbstractSet, Any, Dict, Optional, Set
+
+from utils.slug_normalizer import normalize_slug_text
+
+# Wiki-link templates for workspace artifacts: prefix + slug + suffix
+_WIKI_APPLICATIONS_PREFIX = "[[data/applications/"
+_RESUME_LINK_SUFFIX = "/resume/resume.pdf]]"
+_COVER_LETTER_LINK_SUFFIX = "/cover/cover-letter.pdf]]"
+
+# Batches repeat the same companies; slug helpers are pure and memoized
+_SLUG_CACHE_MAXSIZE = 1024
 
 
 def normalize_company_name(company: str) -> str:
     """
     Normalize company name to a slug-safe format.
 
+    Uses the shared normalize_slug_text, so tracker slugs and career_tailor
+    fallback slugs normalize company names identically.
+
     Normalization rules:
     - Convert to lowercase
     - Replace non-alphanumeric characters with underscores
@@ -34,21 +49,10 @@ def normalize_company_name(company: str) -> str:
         >>> normalize_company_name("AT&T Inc.")
         'at_t_inc'
     """
-    # Convert to lowercase
-    normalized = company.lower()
-
-    # Replace non-alphanumeric characters with underscores
-    normalized = re.sub(r"[^a-z0-9]+", "_", normalized)
-
-    # Collapse consecutive underscores
-    normalized = re.sub(r"_+", "_", normalized)
-
-    # Strip leading/trailing underscores
-    normalized = normalized.strip("_")
-
-    return normalized
+    return normalize_slug_text(company)
 
 
+@lru_cache(maxsize=_SLUG_CACHE_MAXSIZE)
 def generate_application_slug(company: str, job_db_id: int) -> str:
     """
     Generate deterministic application slug for workspace directory naming.
@@ -73,6 +77,44 @@ def generate_application_slug(company: str, job_db_id: int) -> str:
     return f"{company_slug}-{job_db_id}"
 
 
+def extract_captured_date(captured_at: str) -> str:
+    """
+    Extract the date part of a captured_at timestamp.
+
+    Equivalent to splitting on the first 'T' (or on the first space when there
+    is no 'T') and keeping the head. Well-formed ISO timestamps take a fixed
+    [:10] slice without building a list.
+
+    Args:
+        captured_at: Timestamp string (e.g., "2026-02-04T15:30:00" or "2026-02-04 15:30:00")
+
+    Returns:
+        Date component, normally YYYY-MM-DD
+
+    Examples:
+        >>> extract_captured_date("2026-02-04T15:30:00")
+        '2026-02-04'
+        >>> extract_captured_date("2026-02-04 15:30:00")
+        '2026-02-04'
+    """
+    if (
+        len(captured_at) >= 10
+        and captured_at[4] == "-"
+        and captured_at[7] == "-"
+        and captured_at[:4].isdigit()
+        and captured_at[5:7].isdigit()
+        and captured_at[8:10].isdigit()
+    ):
+        separator = captured_at[10:11]
+        if separator in ("T", "") or (separator == " " and "T" not in captured_at):
+            return captured_at[:10]
+
+    # Handle both ISO format with T separator and space separator
+    if "T" in captured_at:
+        return captured_at.split("T")[0]
+    return captured_at.split(" ")[0]
+
+
 def generate_tracker_filename(company: str, job_db_id: int, captured_at: str) -> str:
     """
     Generate deterministic tracker filename.
@@ -94,11 +136,7 @@ def generate_tracker_filename(company: str, job_db_id: int, captured_at: str) ->
         '2026-02-04-general_motors-3711.md'
     """
     # Extract date from captured_at timestamp
-    # Handle both ISO format with T separator and space separator
-    if "T" in captured_at:
-        date_str = captured_at.split("T")[0]
-    else:
-        date_str = captured_at.split(" ")[0]
+    date_str = extract_captured_date(captured_at)
 
     # Normalize company name
     company_slug = normalize_company_name(company)
@@ -146,7 +184,7 @@ def compute_resume_path(application_slug: str) -> str:
         >>> compute_resume_path("amazon-3629")
         '[[data/applications/amazon-3629/resume/resume.pdf]]'
     """
-    return f"[[data/applications/{application_slug}/resume/resume.pdf]]"
+    return _WIKI_APPLICATIONS_PREFIX + application_slug + _RESUME_LINK_SUFFIX
 
 
 def compute_cover_letter_path(application_slug: str) -> str:
@@ -163,21 +201,59 @@ def compute_cover_letter_path(application_slug: str) -> str:
         >>> compute_cover_letter_path("amazon-3629")
         '[[data/applications/amazon-3629/cover/cover-letter.pdf]]'
     """
-    return f"[[data/applications/{application_slug}/cover/cover-letter.pdf]]"
+    return _WIKI_APPLICATIONS_PREFIX + application_slug + _COVER_LETTER_LINK_SUFFIX
+
+
+class _WorkspaceDirectories(Mapping):
+    """Read-only workspace directory mapping that builds each Path on first access."""
+
+    __slots__ = ("_base_dir", "_application_slug", "_paths")
+
+    _SUBDIRS = {"resume_dir": "resume", "cover_dir": "cover"}
+    _KEYS = ("workspace_root", "resume_dir", "cover_dir")
+
+    def __init__(self, application_slug: str, base_dir: str):
+        self._base_dir = base_dir
+        self._application_slug = application_slug
+        self._paths: Dict[str, Path] = {}
+
+    def __getitem__(self, key: str) -> Path:
+        path = self._paths.get(key)
+        if path is None:
+            if key == "workspace_root":
+                path = Path(self._base_dir) / self._application_slug
+            elif key in self._SUBDIRS:
+                path = self["workspace_root"] / self._SUBDIRS[key]
+            else:
+                raise KeyError(key)
+            self._paths[key] = path
+        return path
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
 
 
 def compute_workspace_directories(
     application_slug: str, base_dir: str = "data/applications"
-) -> Dict[str, Path]:
+) -> Mapping[str, Path]:
     """
     Compute required workspace directories for a job application.
 
+    Paths are built on first access, so callers that read one entry do not
+    pay for the others.
+
     Args:
         application_slug: Application workspace slug
         base_dir: Base directory for applications (default: "data/applications")
 
     Returns:
-        Dictionary with directory paths:
+        Read-only mapping with directory paths:
         - workspace_root: Root directory for this application
         - resume_dir: Directory for resume files
         - cover_dir: Directory for cover letter files
@@ -189,14 +265,30 @@ def compute_workspace_directories(
         >>> dirs["cover_dir"]
         Path('data/applications/amazon-3629/cover')
     """
-    workspace_root = Path(base_dir) / application_slug
-    resume_dir = workspace_root / "resume"
-    cover_dir = workspace_root / "cover"
+    return _WorkspaceDirectories(application_slug, base_dir)
+
 
-    return {"workspace_root": workspace_root, "resume_dir": resume_dir, "cover_dir": cover_dir}
+def list_tracker_filenames(trackers_dir: str = "trackers") -> Set[str]:
+    """
+    List entry names in the trackers directory with one directory read.
 
+    Args:
+        trackers_dir: Base directory for tracker files (default: "trackers")
 
-def plan_tracker(job: Dict[str, Any], trackers_dir: str = "trackers") -> Dict[str, Any]:
+    Returns:
+        Set of names in trackers_dir; empty if the directory does not exist
+    """
+    try:
+        return set(os.listdir(trackers_dir))
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def plan_tracker(
+    job: Dict[str, Any],
+    trackers_dir: str = "trackers",
+    existing_filenames: Optional[AbstractSet[str]] = None,
+) -> Dict[str, Any]:
     """
     Plan all tracker-related paths and metadata for a job.
 
@@ -206,6 +298,9 @@ def plan_tracker(job: Dict[str, Any], trackers_dir: str = "trackers") -> Dict[st
     Args:
         job: Job record dictionary with keys: id, company, captured_at
         trackers_dir: Base directory for tracker files (default: "trackers")
+        existing_filenames: Optional snapshot of names in trackers_dir (see
+            list_tracker_filenames); when given, existence is a set lookup
+            instead of a stat call
 
     Returns:
         Dictionary with planning results:
@@ -215,7 +310,7 @@ def plan_tracker(job: Dict[str, Any], trackers_dir: str = "trackers") -> Dict[st
         - exists: Boolean indicating if tracker file already exists
         - resume_path: Wiki-link path for resume PDF
         - cover_letter_path: Wiki-link path for cover letter PDF
-        - workspace_dirs: Dictionary of workspace directory paths
+        - workspace_dirs: Mapping of workspace directory paths
 
     Examples:
         >>> job = {"id": 3629, "company": "Amazon", "captured_at": "2026-02-04T15:30:00"}
@@ -231,10 +326,12 @@ def plan_tracker(job: Dict[str, Any], trackers_dir: str = "trackers") -> Dict[st
     company = job["company"]
     captured_at = job["captured_at"]
 
-    # Generate all planning components
-    application_slug = generate_application_slug(company, job_db_id)
-    tracker_filename = generate_tracker_filename(company, job_db_id, captured_at)
-    tracker_path = compute_tracker_path(company, job_db_id, captured_at, trackers_dir)
+    # Generate all planning components from one normalized company slug;
+    # same results as generate_application_slug / generate_tracker_filename /
+    # compute_tracker_path
+    application_slug = f"{normalize_company_name(company)}-{job_db_id}"
+    tracker_filename = f"{extract_captured_date(captured_at)}-{application_slug}.md"
+    tracker_path = Path(trackers_dir) / tracker_filename
 
     # Compute workspace paths
     resume_path = compute_resume_path(application_slug)
@@ -242,7 +339,10 @@ def plan_tracker(job: Dict[str, Any], trackers_dir: str = "trackers") -> Dict[st
     workspace_dirs = compute_workspace_directories(application_slug)
 
     # Check if tracker file already exists
-    exists = tracker_path.exists()
+    if existing_filenames is not None:
+        exists = tracker_filename in existing_filenames
+    else:
+        exists = tracker_path.exists()
 
     return {
         "application_slug": application_slug,
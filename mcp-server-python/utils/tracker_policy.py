@@ -8,24 +8,54 @@ This module enforces tracker status transition rules:
 - Force bypass with warning for policy violations
 """
 
+import sys
 from typing import Any, Dict, List, Optional
 
 from models.errors import create_validation_error
 from models.status import JobTrackerStatus
 
+# Interned plain status strings; statuses parsed from tracker frontmatter are
+# interned too, so set/dict lookups usually match on identity
+_REVIEWED = sys.intern(JobTrackerStatus.REVIEWED.value)
+_RESUME_WRITTEN = sys.intern(JobTrackerStatus.RESUME_WRITTEN.value)
+_APPLIED = sys.intern(JobTrackerStatus.APPLIED.value)
+_REJECTED = sys.intern(JobTrackerStatus.REJECTED.value)
+_GHOSTED = sys.intern(JobTrackerStatus.GHOSTED.value)
+
 # Terminal statuses that can be reached from any current status
-TERMINAL_STATUSES = {JobTrackerStatus.REJECTED, JobTrackerStatus.GHOSTED}
+TERMINAL_STATUSES = frozenset({_REJECTED, _GHOSTED})
 
 # Core forward transitions: current_status -> allowed_next_status
 CORE_TRANSITIONS = {
-    JobTrackerStatus.REVIEWED: JobTrackerStatus.RESUME_WRITTEN,
-    JobTrackerStatus.RESUME_WRITTEN: JobTrackerStatus.APPLIED,
+    _REVIEWED: _RESUME_WRITTEN,
+    _RESUME_WRITTEN: _APPLIED,
+}
+
+
+def _status_str(s):
+    """Get the plain string value from an Enum member or a raw string."""
+    return s.value if hasattr(s, "value") else s
+
+
+def _format_allowed(statuses) -> str:
+    """Format statuses as a sorted, quoted, comma-separated list."""
+    return ", ".join(f"'{_status_str(s)}'" for s in sorted(statuses, key=_status_str))
+
+
+# Formatted allowed-transition lists for policy violation messages
+_TERMINAL_ONLY_TEXT = _format_allowed(TERMINAL_STATUSES)
+_ALLOWED_TRANSITIONS_TEXT = {
+    current: _format_allowed([core_next, *TERMINAL_STATUSES])
+    for current, core_next in CORE_TRANSITIONS.items()
 }
 
 
 class TransitionResult:
     """Result of a transition policy check."""
 
+    # No per-instance __dict__; one result is allocated per validated transition
+    __slots__ = ("allowed", "is_noop", "error_message", "warnings")
+
     def __init__(
         self,
         allowed: bool,
@@ -128,18 +158,14 @@ def validate_transition(
         return TransitionResult(allowed=True, is_noop=True)
 
     # Rule 2: Core forward transitions (Requirement 4.2)
-    if current_status in CORE_TRANSITIONS:
-        if CORE_TRANSITIONS[current_status] == target_status:
-            return TransitionResult(allowed=True, is_noop=False)
+    core_next = CORE_TRANSITIONS.get(current_status)
+    if core_next is not None and core_next == target_status:
+        return TransitionResult(allowed=True, is_noop=False)
 
     # Rule 3: Terminal outcomes allowed from any status (Requirement 4.3)
     if target_status in TERMINAL_STATUSES:
         return TransitionResult(allowed=True, is_noop=False)
 
-    # Helper to get the plain string value from an Enum member or a raw string.
-    def _status_str(s):
-        return s.value if hasattr(s, "value") else s
-
     current_str = _status_str(current_status)
     target_str = _status_str(target_status)
 
@@ -149,15 +175,8 @@ def validate_transition(
         f"violates policy. Allowed transitions from '{current_str}': "
     )
 
-    # Build list of allowed transitions for this status
-    allowed_transitions = []
-    if current_status in CORE_TRANSITIONS:
-        allowed_transitions.append(CORE_TRANSITIONS[current_status])
-    allowed_transitions.extend(TERMINAL_STATUSES)
-
-    error_msg += ", ".join(
-        f"'{_status_str(s)}'" for s in sorted(allowed_transitions, key=_status_str)
-    )
+    # Allowed transitions for this status (precomputed at import)
+    error_msg += _ALLOWED_TRANSITIONS_TEXT.get(current_status, _TERMINAL_ONLY_TEXT)
 
     if force:
         # Allow with warning (Requirement 4.5)
@@ -9,6 +9,34 @@ from typing import Any, Dict
 
 import yaml
 from models.status import JobTrackerStatus
+from utils.tracker_planner import extract_captured_date
+
+
+def render_frontmatter_block(frontmatter: Dict[str, Any]) -> str:
+    """
+    Render frontmatter as a '---' delimited YAML block.
+
+    Shared by tracker creation and tracker status updates so both emit the
+    same key order and scalar formatting.
+
+    Args:
+        frontmatter: Dictionary of frontmatter fields (insertion order kept)
+
+    Returns:
+        YAML block including both delimiter lines and a trailing newline
+
+    Examples:
+        >>> render_frontmatter_block({"status": "Reviewed"})
+        '---\\nstatus: Reviewed\\n---\\n'
+    """
+    yaml_content = yaml.dump(
+        frontmatter,
+        Dumper=yaml.SafeDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+    )
+    return f"---\n{yaml_content.rstrip()}\n---\n"
 
 
 def render_tracker_markdown(job: Dict[str, Any], plan: Dict[str, Any]) -> str:
@@ -89,29 +117,15 @@ def render_tracker_markdown(job: Dict[str, Any], plan: Dict[str, Any]) -> str:
         "website": "",
     }
 
-    # Render YAML frontmatter
-    yaml_content = yaml.dump(
-        frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False
-    )
-
     # Build job description section content
     description_content = _render_job_description(job.get("description"))
 
     # Assemble complete markdown document
-    markdown_parts = [
-        "---",
-        yaml_content.rstrip(),
-        "---",
-        "",
-        "## Job Description",
-        "",
-        description_content,
-        "",
-        "## Notes",
-        "",
-    ]
-
-    return "\n".join(markdown_parts)
+    return (
+        f"{render_frontmatter_block(frontmatter)}\n"
+        f"## Job Description\n\n{description_content}\n\n"
+        "## Notes\n"
+    )
 
 
 def _extract_date(captured_at: str) -> str:
@@ -135,11 +149,8 @@ def _extract_date(captured_at: str) -> str:
         >>> _extract_date("2026-02-04 15:30:00")
         '2026-02-04'
     """
-    # Handle both T and space separators
-    if "T" in captured_at:
-        return captured_at.split("T")[0]
-    else:
-        return captured_at.split(" ")[0]
+    # Handles both T and space separators
+    return extract_captured_date(captured_at)
 
 
 def _render_job_description(description: Any) -> str:
@@ -6,12 +6,32 @@ while preserving all other frontmatter fields and body content.
 """
 
 import os
+import re
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Union
 
 import yaml
 from utils.path_resolution import resolve_repo_relative_path
+from utils.tracker_renderer import render_frontmatter_block
+
+# fdatasync skips the timestamp-only metadata flush but still persists the
+# data and the file size needed to read it back; fsync where unavailable
+_sync = getattr(os, "fdatasync", os.fsync)
+
+# Status-line fast path: frontmatter region, a top-level 'status: <words>'
+# line, and '---'-prefixed lines that would need the full parser
+_FRONTMATTER_BYTES_RE = re.compile(rb"---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+_STATUS_LINE_RE = re.compile(rb"^status:[ ]+[A-Za-z]+(?: [A-Za-z]+)*$", re.MULTILINE)
+_DASH_LINE_RE = re.compile(rb"^---", re.MULTILINE)
+_PLAIN_STATUS_RE = re.compile(r"[A-Za-z]+(?: [A-Za-z]+)*")
+
+# Prefer the libyaml-backed loader; same safe semantics, C speed
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
 
 def update_tracker_status(tracker_path: str, new_status: str) -> None:
@@ -23,7 +43,8 @@ def update_tracker_status(tracker_path: str, new_status: str) -> None:
     2. Updates only the 'status' field in frontmatter
     3. Preserves all other frontmatter fields exactly
     4. Preserves body content byte-for-byte
-    5. Writes atomically using temp file + fsync + os.replace
+    5. Writes atomically using temp file + fsync + os.replace, skipping the
+       write entirely when the status is already set
 
     Args:
         tracker_path: Path to the tracker markdown file
@@ -55,14 +76,29 @@ def update_tracker_status(tracker_path: str, new_status: str) -> None:
     if not path.exists():
         raise FileNotFoundError(f"Tracker file not found: {tracker_path}")
 
+    # Convert Enum members to plain strings so PyYAML serializes them
+    # as scalars rather than tagged Python objects.
+    status_value = new_status.value if hasattr(new_status, "value") else new_status
+
+    # Fast path: rewrite just the status line when it is unambiguous
+    # (Requirement 7.1, 7.4), skipping the YAML parse/emit round trip
+    data = path.read_bytes()
+    updated_bytes = _replace_status_line(data, status_value)
+    if updated_bytes is not None:
+        if updated_bytes != data:
+            _atomic_write(path, updated_bytes)
+        return
+
     # Read and parse current tracker content
-    content = path.read_text(encoding="utf-8")
+    content = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
     frontmatter, body = _extract_frontmatter_and_body(content)
 
+    # Re-applying the current status leaves the file untouched
+    if frontmatter.get("status") == status_value:
+        return
+
     # Update only the status field (Requirement 7.1, 7.4)
-    # Convert Enum members to plain strings so PyYAML serializes them
-    # as scalars rather than tagged Python objects.
-    frontmatter["status"] = new_status.value if hasattr(new_status, "value") else new_status
+    frontmatter["status"] = status_value
 
     # Render updated tracker content
     updated_content = _render_tracker_content(frontmatter, body)
@@ -71,6 +107,70 @@ def update_tracker_status(tracker_path: str, new_status: str) -> None:
     _atomic_write(path, updated_content)
 
 
+def _replace_status_line(data: bytes, status_value: Any) -> Optional[bytes]:
+    """
+    Replace the frontmatter status value in raw tracker bytes.
+
+    Only handles the unambiguous layout: LF line endings, valid YAML
+    frontmatter with a single top-level 'status: <plain words>' line that is
+    the only mention of 'status' and has no indented continuation, and a new
+    value that YAML emits unquoted. Everything else in the file is kept
+    byte-for-byte.
+
+    Args:
+        data: Raw tracker file content
+        status_value: New status as a plain value
+
+    Returns:
+        Updated content, or None when the full YAML path must be used
+    """
+    if b"\r" in data or not isinstance(status_value, str):
+        return None
+    new_line = _plain_status_line(status_value)
+    if new_line is None:
+        return None
+
+    match = _FRONTMATTER_BYTES_RE.match(data)
+    if match is None:
+        return None
+    start, end = match.span(1)
+    region = data[start:end]
+    # A '---' line inside the region could close the frontmatter earlier
+    # under str whitespace rules; 'status' must occur exactly once
+    if _DASH_LINE_RE.search(region) or region.count(b"status") != 1:
+        return None
+
+    status = _STATUS_LINE_RE.search(region)
+    if status is None:
+        return None
+    rest = region[status.end() :].lstrip(b"\n")
+    if rest[:1] in (b" ", b"\t"):
+        return None
+
+    # The frontmatter must still be valid YAML, as on the full path
+    try:
+        if not isinstance(yaml.load(region, Loader=_YamlLoader), dict):
+            return None
+    except yaml.YAMLError:
+        return None
+
+    line_start = start + status.start()
+    line_end = start + status.end()
+    return data[:line_start] + new_line + data[line_end:]
+
+
+@lru_cache(maxsize=16)
+def _plain_status_line(status_value: str) -> Optional[bytes]:
+    """Return b'status: <value>' if YAML emits the value as a plain scalar."""
+    line = f"status: {status_value}"
+    if not _PLAIN_STATUS_RE.fullmatch(status_value):
+        return None
+    # Must match what the full path emits for the same value
+    if render_frontmatter_block({"status": status_value}) != f"---\n{line}\n---\n":
+        return None
+    return line.encode("utf-8")
+
+
 def _extract_frontmatter_and_body(content: str) -> tuple[Dict[str, Any], str]:
     """
     Extract YAML frontmatter and body content from markdown.
@@ -86,8 +186,6 @@ def _extract_frontmatter_and_body(content: str) -> tuple[Dict[str, Any], str]:
     Raises:
         ValueError: If frontmatter is missing or malformed
     """
-    import re
-
     # Match frontmatter pattern: --- at start, YAML content, --- delimiter
     pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
     match = re.match(pattern, content, re.DOTALL)
@@ -126,30 +224,23 @@ def _render_tracker_content(frontmatter: Dict[str, Any], body: str) -> str:
         - 7.3: Preserve original body content exactly
         - 7.4: Preserve original frontmatter keys/values except status
     """
-    # Render YAML frontmatter with consistent formatting
-    yaml_content = yaml.dump(
-        frontmatter, default_flow_style=False, allow_unicode=True, sort_keys=False
-    )
-
-    # Assemble complete markdown document
+    # Same frontmatter rendering as tracker creation
     # Note: Body is preserved exactly as-is (Requirement 7.3)
-    markdown_parts = ["---", yaml_content.rstrip(), "---", "", body]
-
-    return "\n".join(markdown_parts)
+    return f"{render_frontmatter_block(frontmatter)}\n{body}"
 
 
-def _atomic_write(path: Path, content: str) -> None:
+def _atomic_write(path: Path, content: Union[str, bytes]) -> None:
     """
     Write content to file atomically using temp file + fsync + os.replace.
 
     This ensures that:
     1. The original file is never corrupted if write fails
-    2. The write is durable (fsync ensures data is on disk)
+    2. The write is durable (fdatasync/fsync ensures data is on disk)
     3. The replacement is atomic (os.replace is atomic on all platforms)
 
     Args:
         path: Target file path
-        content: Content to write
+        content: Content to write (str is UTF-8 encoded)
 
     Raises:
         IOError: If write operations fail
@@ -167,10 +258,10 @@ def _atomic_write(path: Path, content: str) -> None:
             dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
         )
 
-        # Write to temp file and fsync for durability.
-        content_bytes = content.encode("utf-8")
+        # Write to temp file and sync it for durability.
+        content_bytes = content.encode("utf-8") if isinstance(content, str) else content
         os.write(temp_fd, content_bytes)
-        os.fsync(temp_fd)
+        _sync(temp_fd)
         os.close(temp_fd)
         temp_fd = None
 
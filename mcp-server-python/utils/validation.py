@@ -4,11 +4,14 @@ Input validation utilities for bulk_read_new_jobs MCP tool.
 Validates limit, db_path, and cursor parameters according to requirements.
 """
 
+import string
+import sys
+import time
 from datetime import datetime, timezone
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 from config import config
-from models.errors import create_validation_error
+from models.errors import ToolError, create_validation_error
 from models.status import JobDbStatus, JobTrackerStatus
 
 # Constants for validation
@@ -21,6 +24,71 @@ INITIALIZE_DEFAULT_LIMIT = 50
 INITIALIZE_MIN_LIMIT = 1
 INITIALIZE_MAX_LIMIT = 200
 
+# Cursor format: base64 alphabet (alphanumeric, +, /, =); translate() deletes
+# these, so any remaining character is outside the alphabet
+_CURSOR_DELETE_TABLE = str.maketrans("", "", string.ascii_letters + string.digits + "+/=")
+
+# Allowed status values mapped to their interned canonical strings: one hash
+# lookup validates, and validated statuses share identity downstream (e.g.
+# with the interned transition-policy keys)
+_JOB_DB_STATUS_CANONICAL = {s.value: sys.intern(s.value) for s in JobDbStatus}
+_TRACKER_STATUS_CANONICAL = {s.value: sys.intern(s.value) for s in JobTrackerStatus}
+
+# Allowed-value lists for status error messages (enum members are fixed)
+_JOB_DB_STATUS_ALLOWED_TEXT = ", ".join(sorted(s.value for s in JobDbStatus))
+_TRACKER_STATUS_ALLOWED_TEXT = ", ".join(
+    f"'{s.value}'" for s in sorted(JobTrackerStatus, key=lambda s: s.value)
+)
+
+
+# Shared "Invalid <name> type: expected <kind>, got <type>" message template
+_TYPE_ERROR_MESSAGE = "Invalid {} type: expected {}, got {}".format
+
+
+def _type_error(name: str, expected: str, value: object) -> ToolError:
+    """Build the VALIDATION_ERROR for a parameter of the wrong type."""
+    return create_validation_error(_TYPE_ERROR_MESSAGE(name, expected, type(value).__name__))
+
+
+# Sentinel for "key not present" in single-lookup dict probes
+_MISSING = object()
+
+
+def _has_edge_whitespace(value: str) -> bool:
+    """
+    Check a non-empty string for leading or trailing whitespace.
+
+    Same result as value != value.strip(), but only inspects the two ends.
+    """
+    return value[0].isspace() or value[-1].isspace()
+
+
+def _validate_nonempty_str(value: Any, name: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Validate an optional string parameter that must not be blank.
+
+    Args:
+        value: The provided value (None for default)
+        name: Parameter name used in error messages
+        default: Value returned when value is None
+
+    Returns:
+        The default or the validated string
+
+    Raises:
+        ToolError: If value is not a string or is empty/whitespace-only
+    """
+    if value is None:
+        return default
+
+    if not isinstance(value, str):
+        raise _type_error(name, "string", value)
+
+    if not value or value.isspace():
+        raise create_validation_error(f"Invalid {name}: cannot be empty")
+
+    return value
+
 
 def validate_limit(limit: Optional[int]) -> int:
     """
@@ -35,24 +103,9 @@ def validate_limit(limit: Optional[int]) -> int:
     Raises:
         ToolError: If limit is invalid
     """
-    # Use default if not provided
-    if limit is None:
-        return DEFAULT_LIMIT
-
-    # Check type (bool is a subclass of int in Python, reject explicitly)
-    if isinstance(limit, bool) or not isinstance(limit, int):
-        raise create_validation_error(
-            f"Invalid limit type: expected integer, got {type(limit).__name__}"
-        )
-
-    # Check range
-    if limit < MIN_LIMIT:
-        raise create_validation_error(f"Invalid limit: {limit} is below minimum of {MIN_LIMIT}")
-
-    if limit > MAX_LIMIT:
-        raise create_validation_error(f"Invalid limit: {limit} exceeds maximum of {MAX_LIMIT}")
-
-    return limit
+    return _validate_number_range(
+        limit, "limit", DEFAULT_LIMIT, "integer", (int,), MIN_LIMIT, MAX_LIMIT
+    )
 
 
 def validate_db_path(db_path: Optional[str]) -> Optional[str]:
@@ -74,12 +127,10 @@ def validate_db_path(db_path: Optional[str]) -> Optional[str]:
 
     # Check type
     if not isinstance(db_path, str):
-        raise create_validation_error(
-            f"Invalid db_path type: expected string, got {type(db_path).__name__}"
-        )
+        raise _type_error("db_path", "string", db_path)
 
     # Check not empty
-    if not db_path.strip():
+    if not db_path or db_path.isspace():
         raise create_validation_error("Invalid db_path: cannot be empty")
 
     return db_path
@@ -106,19 +157,14 @@ def validate_cursor(cursor: Optional[str]) -> Optional[str]:
 
     # Check type
     if not isinstance(cursor, str):
-        raise create_validation_error(
-            f"Invalid cursor type: expected string, got {type(cursor).__name__}"
-        )
+        raise _type_error("cursor", "string", cursor)
 
     # Check not empty
-    if not cursor.strip():
+    if not cursor or cursor.isspace():
         raise create_validation_error("Invalid cursor: cannot be empty")
 
     # Basic format check - cursor should be base64-like
-    # (alphanumeric, +, /, =)
-    import re
-
-    if not re.match(r"^[A-Za-z0-9+/=]+$", cursor):
+    if cursor.translate(_CURSOR_DELETE_TABLE):
         raise create_validation_error("Invalid cursor format: must be a valid base64 string")
 
     return cursor
@@ -167,30 +213,26 @@ def validate_status(status) -> str:
 
     # Check type
     if not isinstance(status, str):
-        raise create_validation_error(
-            f"Invalid status type: expected string, got {type(status).__name__}"
-        )
+        raise _type_error("status", "string", status)
 
     # Check for empty string
     if not status:
         raise create_validation_error("Invalid status: cannot be empty")
 
     # Check for leading/trailing whitespace
-    if status != status.strip():
+    if _has_edge_whitespace(status):
         raise create_validation_error(
             f"Invalid status: '{status}' contains leading or trailing whitespace"
         )
 
     # Check against allowed statuses (case-sensitive)
-    try:
-        JobDbStatus(status)
-    except ValueError:
-        allowed = ", ".join(sorted(s.value for s in JobDbStatus))
+    canonical_status = _JOB_DB_STATUS_CANONICAL.get(status)
+    if canonical_status is None:
         raise create_validation_error(
-            f"Invalid status value: '{status}'. Allowed values are: {allowed}"
+            f"Invalid status value: '{status}'. Allowed values are: {_JOB_DB_STATUS_ALLOWED_TEXT}"
         )
 
-    return status
+    return canonical_status
 
 
 def validate_job_id(job_id) -> int:
@@ -210,11 +252,10 @@ def validate_job_id(job_id) -> int:
     if job_id is None:
         raise create_validation_error("Invalid job ID: cannot be null")
 
-    # Check type (bool is a subclass of int in Python, reject explicitly)
-    if isinstance(job_id, bool) or not isinstance(job_id, int):
-        raise create_validation_error(
-            f"Invalid job ID type: expected integer, got {type(job_id).__name__}"
-        )
+    # Check type (bool is a subclass of int in Python, reject explicitly);
+    # plain ints skip both isinstance checks
+    if type(job_id) is not int and (isinstance(job_id, bool) or not isinstance(job_id, int)):
+        raise _type_error("job ID", "integer", job_id)
 
     # Check for positive integer (>= 1)
     if job_id < 1:
@@ -264,21 +305,21 @@ def validate_unique_job_ids(updates: list) -> None:
     if not updates or len(updates) == 0:
         return
 
-    # Collect all job IDs
-    job_ids = []
+    # Find duplicates in one pass over job IDs that are present (the ID
+    # itself may be missing or invalid); the duplicates set is only
+    # allocated once a collision is seen
+    seen = set()
+    mark_seen = seen.add
+    duplicates = None
     for update in updates:
-        # Extract job ID if present (may be missing or invalid)
         if isinstance(update, dict) and "id" in update:
-            job_ids.append(update["id"])
-
-    # Find duplicates
-    seen = set()
-    duplicates = set()
-    for job_id in job_ids:
-        if job_id in seen:
-            duplicates.add(job_id)
-        else:
-            seen.add(job_id)
+            job_id = update["id"]
+            if job_id not in seen:
+                mark_seen(job_id)
+            elif duplicates is None:
+                duplicates = {job_id}
+            else:
+                duplicates.add(job_id)
 
     # Raise error if duplicates found
     if duplicates:
@@ -286,6 +327,10 @@ def validate_unique_job_ids(updates: list) -> None:
         raise create_validation_error(f"Duplicate job IDs found in batch: {duplicate_list}")
 
 
+# Last formatted timestamp as (epoch milliseconds, string)
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+
 def get_current_utc_timestamp() -> str:
     """
     Generate a UTC timestamp in ISO 8601 format with millisecond precision.
@@ -301,9 +346,23 @@ def get_current_utc_timestamp() -> str:
 
     Requirements: 6.1, 6.3
     """
-    now = datetime.now(timezone.utc)
-    # Format with millisecond precision and replace +00:00 with Z
-    return now.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    global _timestamp_cache
+
+    # Repeat calls within the same millisecond reuse the formatted string
+    epoch_ms = time.time_ns() // 1_000_000
+    cached_ms, cached_timestamp = _timestamp_cache
+    if epoch_ms == cached_ms:
+        return cached_timestamp
+
+    now = datetime.fromtimestamp(epoch_ms / 1000, timezone.utc)
+    # Format with millisecond precision and Z suffix in one pass
+    timestamp = (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d}T"
+        f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}.{now.microsecond // 1000:03d}Z"
+    )
+    # Rebinding one tuple keeps the (ms, string) pair consistent across threads
+    _timestamp_cache = (epoch_ms, timestamp)
+    return timestamp
 
 
 # ============================================================================
@@ -326,28 +385,15 @@ def validate_initialize_limit(limit: Optional[int]) -> int:
 
     Requirements: 1.3, 1.4, 1.5
     """
-    # Use default if not provided
-    if limit is None:
-        return INITIALIZE_DEFAULT_LIMIT
-
-    # Check type (bool is a subclass of int in Python, reject explicitly)
-    if isinstance(limit, bool) or not isinstance(limit, int):
-        raise create_validation_error(
-            f"Invalid limit type: expected integer, got {type(limit).__name__}"
-        )
-
-    # Check range
-    if limit < INITIALIZE_MIN_LIMIT:
-        raise create_validation_error(
-            f"Invalid limit: {limit} is below minimum of {INITIALIZE_MIN_LIMIT}"
-        )
-
-    if limit > INITIALIZE_MAX_LIMIT:
-        raise create_validation_error(
-            f"Invalid limit: {limit} exceeds maximum of {INITIALIZE_MAX_LIMIT}"
-        )
-
-    return limit
+    return _validate_number_range(
+        limit,
+        "limit",
+        INITIALIZE_DEFAULT_LIMIT,
+        "integer",
+        (int,),
+        INITIALIZE_MIN_LIMIT,
+        INITIALIZE_MAX_LIMIT,
+    )
 
 
 def validate_trackers_dir(trackers_dir: Optional[str]) -> Optional[str]:
@@ -371,12 +417,10 @@ def validate_trackers_dir(trackers_dir: Optional[str]) -> Optional[str]:
 
     # Check type
     if not isinstance(trackers_dir, str):
-        raise create_validation_error(
-            f"Invalid trackers_dir type: expected string, got {type(trackers_dir).__name__}"
-        )
+        raise _type_error("trackers_dir", "string", trackers_dir)
 
     # Check not empty
-    if not trackers_dir.strip():
+    if not trackers_dir or trackers_dir.isspace():
         raise create_validation_error("Invalid trackers_dir: cannot be empty")
 
     return trackers_dir
@@ -403,9 +447,7 @@ def validate_force(force: Optional[bool]) -> bool:
 
     # Check type
     if not isinstance(force, bool):
-        raise create_validation_error(
-            f"Invalid force type: expected boolean, got {type(force).__name__}"
-        )
+        raise _type_error("force", "boolean", force)
 
     return force
 
@@ -431,9 +473,7 @@ def validate_dry_run(dry_run: Optional[bool]) -> bool:
 
     # Check type
     if not isinstance(dry_run, bool):
-        raise create_validation_error(
-            f"Invalid dry_run type: expected boolean, got {type(dry_run).__name__}"
-        )
+        raise _type_error("dry_run", "boolean", dry_run)
 
     return dry_run
 
@@ -505,16 +545,14 @@ def validate_tracker_path(tracker_path) -> str:
 
     # Check type
     if not isinstance(tracker_path, str):
-        raise create_validation_error(
-            f"Invalid tracker_path type: expected string, got {type(tracker_path).__name__}"
-        )
+        raise _type_error("tracker_path", "string", tracker_path)
 
     # Check for empty string
     if not tracker_path:
         raise create_validation_error("Invalid tracker_path: cannot be empty")
 
     # Check for leading/trailing whitespace
-    if tracker_path != tracker_path.strip():
+    if _has_edge_whitespace(tracker_path):
         raise create_validation_error(
             "Invalid tracker_path: contains leading or trailing whitespace"
         )
@@ -545,32 +583,27 @@ def validate_tracker_status(target_status) -> str:
 
     # Check type
     if not isinstance(target_status, str):
-        raise create_validation_error(
-            f"Invalid target_status type: expected string, got {type(target_status).__name__}"
-        )
+        raise _type_error("target_status", "string", target_status)
 
     # Check for empty string
     if not target_status:
         raise create_validation_error("Invalid target_status: cannot be empty")
 
     # Check for leading/trailing whitespace (Requirement 3.4)
-    if target_status != target_status.strip():
+    if _has_edge_whitespace(target_status):
         raise create_validation_error(
             f"Invalid target_status: '{target_status}' contains leading or trailing whitespace"
         )
 
     # Check against allowed tracker statuses (case-sensitive, Requirement 3.3)
-    try:
-        JobTrackerStatus(target_status)
-    except ValueError:
-        allowed_list = ", ".join(
-            f"'{s.value}'" for s in sorted(JobTrackerStatus, key=lambda s: s.value)
-        )
+    canonical_status = _TRACKER_STATUS_CANONICAL.get(target_status)
+    if canonical_status is None:
         raise create_validation_error(
-            f"Invalid target_status value: '{target_status}'. Allowed values are: {allowed_list}"
+            f"Invalid target_status value: '{target_status}'. "
+            f"Allowed values are: {_TRACKER_STATUS_ALLOWED_TEXT}"
         )
 
-    return target_status
+    return canonical_status
 
 
 def validate_update_tracker_status_parameters(
@@ -644,12 +677,10 @@ def validate_run_id(run_id: Optional[str]) -> Optional[str]:
 
     # Check type
     if not isinstance(run_id, str):
-        raise create_validation_error(
-            f"Invalid run_id type: expected string, got {type(run_id).__name__}"
-        )
+        raise _type_error("run_id", "string", run_id)
 
     # Check not empty
-    if not run_id.strip():
+    if not run_id or run_id.isspace():
         raise create_validation_error("Invalid run_id: cannot be empty")
 
     return run_id
@@ -679,9 +710,7 @@ def validate_finalize_items(items) -> list:
 
     # Check type
     if not isinstance(items, list):
-        raise create_validation_error(
-            f"Invalid items type: expected array, got {type(items).__name__}"
-        )
+        raise _type_error("items", "array", items)
 
     # Empty batch is valid (Requirement 1.2) - return early
     if len(items) == 0:
@@ -715,21 +744,21 @@ def validate_finalize_duplicate_ids(items: list) -> None:
     if not items or len(items) == 0:
         return
 
-    # Collect all item IDs
-    item_ids = []
+    # Find duplicates in one pass over item IDs that are present (the ID
+    # itself may be missing or invalid); the duplicates set is only
+    # allocated once a collision is seen
+    seen = set()
+    mark_seen = seen.add
+    duplicates = None
     for item in items:
-        # Extract item ID if present (may be missing or invalid)
         if isinstance(item, dict) and "id" in item:
-            item_ids.append(item["id"])
-
-    # Find duplicates
-    seen = set()
-    duplicates = set()
-    for item_id in item_ids:
-        if item_id in seen:
-            duplicates.add(item_id)
-        else:
-            seen.add(item_id)
+            item_id = item["id"]
+            if item_id not in seen:
+                mark_seen(item_id)
+            elif duplicates is None:
+                duplicates = {item_id}
+            else:
+                duplicates.add(item_id)
 
     # Raise error if duplicates found
     if duplicates:
@@ -737,6 +766,13 @@ def validate_finalize_duplicate_ids(items: list) -> None:
         raise create_validation_error(f"Duplicate item IDs found in batch: {duplicate_list}")
 
 
+# Fixed validate_finalize_item results (immutable, shared across calls)
+_FINALIZE_ITEM_VALID: Tuple[bool, Optional[str]] = (True, None)
+_FINALIZE_ITEM_MISSING_ID = (False, "Item missing required field 'id'")
+_FINALIZE_ITEM_MISSING_TRACKER_PATH = (False, "Item missing required field 'tracker_path'")
+_FINALIZE_ITEM_EMPTY_TRACKER_PATH = (False, "Item 'tracker_path' cannot be empty")
+
+
 def validate_finalize_item(item) -> Tuple[bool, Optional[str]]:
     """
     Validate a single finalization item's structure and required fields.
@@ -760,13 +796,13 @@ def validate_finalize_item(item) -> Tuple[bool, Optional[str]]:
         return False, f"Item must be an object, got {type(item).__name__}"
 
     # Validate required 'id' field (Requirement 2.1, 2.3)
-    if "id" not in item:
-        return False, "Item missing required field 'id'"
-
-    item_id = item["id"]
+    item_id = item.get("id", _MISSING)
+    if item_id is _MISSING:
+        return _FINALIZE_ITEM_MISSING_ID
 
-    # Check id type (bool is a subclass of int in Python, reject explicitly)
-    if isinstance(item_id, bool) or not isinstance(item_id, int):
+    # Check id type (bool is a subclass of int in Python, reject explicitly);
+    # plain ints skip both isinstance checks
+    if type(item_id) is not int and (isinstance(item_id, bool) or not isinstance(item_id, int)):
         return False, f"Item 'id' must be an integer, got {type(item_id).__name__}"
 
     # Check id is positive integer (Requirement 2.3)
@@ -774,23 +810,21 @@ def validate_finalize_item(item) -> Tuple[bool, Optional[str]]:
         return False, f"Item 'id' must be a positive integer, got {item_id}"
 
     # Validate required 'tracker_path' field (Requirement 2.1, 2.4)
-    if "tracker_path" not in item:
-        return False, "Item missing required field 'tracker_path'"
-
-    tracker_path = item["tracker_path"]
+    tracker_path = item.get("tracker_path", _MISSING)
+    if tracker_path is _MISSING:
+        return _FINALIZE_ITEM_MISSING_TRACKER_PATH
 
     # Check tracker_path type
     if not isinstance(tracker_path, str):
         return False, f"Item 'tracker_path' must be a string, got {type(tracker_path).__name__}"
 
     # Check tracker_path is not empty (Requirement 2.4)
-    if not tracker_path or not tracker_path.strip():
-        return False, "Item 'tracker_path' cannot be empty"
+    if not tracker_path or tracker_path.isspace():
+        return _FINALIZE_ITEM_EMPTY_TRACKER_PATH
 
     # Validate optional 'resume_pdf_path' field if present (Requirement 2.2)
-    if "resume_pdf_path" in item:
-        resume_pdf_path = item["resume_pdf_path"]
-
+    resume_pdf_path = item.get("resume_pdf_path", _MISSING)
+    if resume_pdf_path is not _MISSING:
         # Check resume_pdf_path type
         if not isinstance(resume_pdf_path, str):
             return (
@@ -799,7 +833,7 @@ def validate_finalize_item(item) -> Tuple[bool, Optional[str]]:
             )
 
     # Item is valid
-    return True, None
+    return _FINALIZE_ITEM_VALID
 
 
 def validate_finalize_resume_batch_parameters(
@@ -860,6 +894,54 @@ MIN_RETRY_BACKOFF = 1
 MAX_RETRY_BACKOFF = 10
 
 
+# Accepted runtime types for numeric scrape parameters (bool excluded separately)
+_INTEGER_TYPES = (int,)
+_NUMBER_TYPES = (int, float)
+
+
+def _validate_number_range(
+    value: Any,
+    name: str,
+    default: Any,
+    kind: str,
+    types: Tuple[type, ...],
+    min_value: Any,
+    max_value: Any,
+) -> Any:
+    """
+    Validate an optional numeric parameter against its type and inclusive range.
+
+    Args:
+        value: The provided value (None for default)
+        name: Parameter name used in error messages
+        default: Value returned when value is None
+        kind: Expected type label for the type error ("integer" or "number")
+        types: Accepted runtime types
+        min_value: Smallest accepted value
+        max_value: Largest accepted value
+
+    Returns:
+        The default or the validated value
+
+    Raises:
+        ToolError: If value has the wrong type or is out of range
+    """
+    if value is None:
+        return default
+
+    # bool is a subclass of int in Python, reject explicitly
+    if isinstance(value, bool) or not isinstance(value, types):
+        raise _type_error(name, kind, value)
+
+    if value < min_value:
+        raise create_validation_error(f"Invalid {name}: {value} is below minimum of {min_value}")
+
+    if value > max_value:
+        raise create_validation_error(f"Invalid {name}: {value} exceeds maximum of {max_value}")
+
+    return value
+
+
 def validate_scrape_terms(terms: Optional[list]) -> list:
     """
     Validate the terms parameter for scrape_jobs.
@@ -881,9 +963,7 @@ def validate_scrape_terms(terms: Optional[list]) -> list:
 
     # Check type
     if not isinstance(terms, list):
-        raise create_validation_error(
-            f"Invalid terms type: expected array, got {type(terms).__name__}"
-        )
+        raise _type_error("terms", "array", terms)
 
     # Check not empty
     if len(terms) == 0:
@@ -892,10 +972,8 @@ def validate_scrape_terms(terms: Optional[list]) -> list:
     # Validate each term is a string
     for i, term in enumerate(terms):
         if not isinstance(term, str):
-            raise create_validation_error(
-                f"Invalid terms[{i}] type: expected string, got {type(term).__name__}"
-            )
-        if not term.strip():
+            raise _type_error(f"terms[{i}]", "string", term)
+        if not term or term.isspace():
             raise create_validation_error(f"Invalid terms[{i}]: cannot be empty string")
 
     return terms
@@ -917,20 +995,7 @@ def validate_scrape_location(location: Optional[str]) -> str:
     Requirements: 1.1, 1.2
     """
     # Use default from config if not provided
-    if location is None:
-        return config.scrape_location
-
-    # Check type
-    if not isinstance(location, str):
-        raise create_validation_error(
-            f"Invalid location type: expected string, got {type(location).__name__}"
-        )
-
-    # Check not empty
-    if not location.strip():
-        raise create_validation_error("Invalid location: cannot be empty")
-
-    return location
+    return _validate_nonempty_str(location, "location", config.scrape_location)
 
 
 def validate_scrape_sites(sites: Optional[list]) -> list:
@@ -954,9 +1019,7 @@ def validate_scrape_sites(sites: Optional[list]) -> list:
 
     # Check type
     if not isinstance(sites, list):
-        raise create_validation_error(
-            f"Invalid sites type: expected array, got {type(sites).__name__}"
-        )
+        raise _type_error("sites", "array", sites)
 
     # Check not empty
     if len(sites) == 0:
@@ -965,10 +1028,8 @@ def validate_scrape_sites(sites: Optional[list]) -> list:
     # Validate each site is a string
     for i, site in enumerate(sites):
         if not isinstance(site, str):
-            raise create_validation_error(
-                f"Invalid sites[{i}] type: expected string, got {type(site).__name__}"
-            )
-        if not site.strip():
+            raise _type_error(f"sites[{i}]", "string", site)
+        if not site or site.isspace():
             raise create_validation_error(f"Invalid sites[{i}]: cannot be empty string")
 
     return sites
@@ -989,28 +1050,16 @@ def validate_results_wanted(results_wanted: Optional[int]) -> int:
 
     Requirements: 1.1, 1.4, 12.2
     """
-    # Use default from config if not provided
-    if results_wanted is None:
-        return config.scrape_results_wanted
-
-    # Check type (bool is a subclass of int in Python, reject explicitly)
-    if isinstance(results_wanted, bool) or not isinstance(results_wanted, int):
-        raise create_validation_error(
-            f"Invalid results_wanted type: expected integer, got {type(results_wanted).__name__}"
-        )
-
-    # Check range
-    if results_wanted < MIN_RESULTS_WANTED:
-        raise create_validation_error(
-            f"Invalid results_wanted: {results_wanted} is below minimum of {MIN_RESULTS_WANTED}"
-        )
-
-    if results_wanted > MAX_RESULTS_WANTED:
-        raise create_validation_error(
-            f"Invalid results_wanted: {results_wanted} exceeds maximum of {MAX_RESULTS_WANTED}"
-        )
-
-    return results_wanted
+    # Default from config when not provided
+    return _validate_number_range(
+        results_wanted,
+        "results_wanted",
+        config.scrape_results_wanted,
+        "integer",
+        _INTEGER_TYPES,
+        MIN_RESULTS_WANTED,
+        MAX_RESULTS_WANTED,
+    )
 
 
 def validate_hours_old(hours_old: Optional[int]) -> int:
@@ -1028,28 +1077,16 @@ def validate_hours_old(hours_old: Optional[int]) -> int:
 
     Requirements: 1.1, 1.4, 12.2
     """
-    # Use default from config if not provided
-    if hours_old is None:
-        return config.scrape_hours_old
-
-    # Check type (bool is a subclass of int in Python, reject explicitly)
-    if isinstance(hours_old, bool) or not isinstance(hours_old, int):
-        raise create_validation_error(
-            f"Invalid hours_old type: expected integer, got {type(hours_old).__name__}"
-        )
-
-    # Check range
-    if hours_old < MIN_HOURS_OLD:
-        raise create_validation_error(
-            f"Invalid hours_old: {hours_old} is below minimum of {MIN_HOURS_OLD}"
-        )
-
-    if hours_old > MAX_HOURS_OLD:
-        raise create_validation_error(
-            f"Invalid hours_old: {hours_old} exceeds maximum of {MAX_HOURS_OLD}"
-        )
-
-    return hours_old
+    # Default from config when not provided
+    return _validate_number_range(
+        hours_old,
+        "hours_old",
+        config.scrape_hours_old,
+        "integer",
+        _INTEGER_TYPES,
+        MIN_HOURS_OLD,
+        MAX_HOURS_OLD,
+    )
 
 
 def validate_require_description(require_description: Optional[bool]) -> bool:
@@ -1073,9 +1110,7 @@ def validate_require_description(require_description: Optional[bool]) -> bool:
 
     # Check type
     if not isinstance(require_description, bool):
-        raise create_validation_error(
-            f"Invalid require_description type: expected boolean, got {type(require_description).__name__}"
-        )
+        raise _type_error("require_description", "boolean", require_description)
 
     return require_description
 
@@ -1096,20 +1131,7 @@ def validate_preflight_host(preflight_host: Optional[str]) -> str:
     Requirements: 2.1, 12.2
     """
     # Use default from config if not provided
-    if preflight_host is None:
-        return config.scrape_preflight_host
-
-    # Check type
-    if not isinstance(preflight_host, str):
-        raise create_validation_error(
-            f"Invalid preflight_host type: expected string, got {type(preflight_host).__name__}"
-        )
-
-    # Check not empty
-    if not preflight_host.strip():
-        raise create_validation_error("Invalid preflight_host: cannot be empty")
-
-    return preflight_host
+    return _validate_nonempty_str(preflight_host, "preflight_host", config.scrape_preflight_host)
 
 
 def validate_retry_count(retry_count: Optional[int]) -> int:
@@ -1127,28 +1149,16 @@ def validate_retry_count(retry_count: Optional[int]) -> int:
 
     Requirements: 2.2, 12.2
     """
-    # Use default from config if not provided
-    if retry_count is None:
-        return config.scrape_retry_count
-
-    # Check type (bool is a subclass of int in Python, reject explicitly)
-    if isinstance(retry_count, bool) or not isinstance(retry_count, int):
-        raise create_validation_error(
-            f"Invalid retry_count type: expected integer, got {type(retry_count).__name__}"
-        )
-
-    # Check range
-    if retry_count < MIN_RETRY_COUNT:
-        raise create_validation_error(
-            f"Invalid retry_count: {retry_count} is below minimum of {MIN_RETRY_COUNT}"
-        )
-
-    if retry_count > MAX_RETRY_COUNT:
-        raise create_validation_error(
-            f"Invalid retry_count: {retry_count} exceeds maximum of {MAX_RETRY_COUNT}"
-        )
-
-    return retry_count
+    # Default from config when not provided
+    return _validate_number_range(
+        retry_count,
+        "retry_count",
+        config.scrape_retry_count,
+        "integer",
+        _INTEGER_TYPES,
+        MIN_RETRY_COUNT,
+        MAX_RETRY_COUNT,
+    )
 
 
 def validate_retry_sleep_seconds(retry_sleep_seconds: Optional[float]) -> float:
@@ -1166,29 +1176,16 @@ def validate_retry_sleep_seconds(retry_sleep_seconds: Optional[float]) -> float:
 
     Requirements: 2.2, 12.2
     """
-    # Use default from config if not provided
-    if retry_sleep_seconds is None:
-        return config.scrape_retry_sleep_seconds
-
-    # Check type (bool is a subclass of int in Python, reject explicitly)
-    # Accept both int and float
-    if isinstance(retry_sleep_seconds, bool) or not isinstance(retry_sleep_seconds, (int, float)):
-        raise create_validation_error(
-            f"Invalid retry_sleep_seconds type: expected number, got {type(retry_sleep_seconds).__name__}"
-        )
-
-    # Check range
-    if retry_sleep_seconds < MIN_RETRY_SLEEP_SECONDS:
-        raise create_validation_error(
-            f"Invalid retry_sleep_seconds: {retry_sleep_seconds} is below minimum of {MIN_RETRY_SLEEP_SECONDS}"
-        )
-
-    if retry_sleep_seconds > MAX_RETRY_SLEEP_SECONDS:
-        raise create_validation_error(
-            f"Invalid retry_sleep_seconds: {retry_sleep_seconds} exceeds maximum of {MAX_RETRY_SLEEP_SECONDS}"
-        )
-
-    return retry_sleep_seconds
+    # Default from config when not provided
+    return _validate_number_range(
+        retry_sleep_seconds,
+        "retry_sleep_seconds",
+        config.scrape_retry_sleep_seconds,
+        "number",
+        _NUMBER_TYPES,
+        MIN_RETRY_SLEEP_SECONDS,
+        MAX_RETRY_SLEEP_SECONDS,
+    )
 
 
 def validate_retry_backoff(retry_backoff: Optional[float]) -> float:
@@ -1206,29 +1203,16 @@ def validate_retry_backoff(retry_backoff: Optional[float]) -> float:
 
     Requirements: 2.2, 12.2
     """
-    # Use default from config if not provided
-    if retry_backoff is None:
-        return config.scrape_retry_backoff
-
-    # Check type (bool is a subclass of int in Python, reject explicitly)
-    # Accept both int and float
-    if isinstance(retry_backoff, bool) or not isinstance(retry_backoff, (int, float)):
-        raise create_validation_error(
-            f"Invalid retry_backoff type: expected number, got {type(retry_backoff).__name__}"
-        )
-
-    # Check range
-    if retry_backoff < MIN_RETRY_BACKOFF:
-        raise create_validation_error(
-            f"Invalid retry_backoff: {retry_backoff} is below minimum of {MIN_RETRY_BACKOFF}"
-        )
-
-    if retry_backoff > MAX_RETRY_BACKOFF:
-        raise create_validation_error(
-            f"Invalid retry_backoff: {retry_backoff} exceeds maximum of {MAX_RETRY_BACKOFF}"
-        )
-
-    return retry_backoff
+    # Default from config when not provided
+    return _validate_number_range(
+        retry_backoff,
+        "retry_backoff",
+        config.scrape_retry_backoff,
+        "number",
+        _NUMBER_TYPES,
+        MIN_RETRY_BACKOFF,
+        MAX_RETRY_BACKOFF,
+    )
 
 
 def validate_save_capture_json(save_capture_json: Optional[bool]) -> bool:
@@ -1252,9 +1236,7 @@ def validate_save_capture_json(save_capture_json: Optional[bool]) -> bool:
 
     # Check type
     if not isinstance(save_capture_json, bool):
-        raise create_validation_error(
-            f"Invalid save_capture_json type: expected boolean, got {type(save_capture_json).__name__}"
-        )
+        raise _type_error("save_capture_json", "boolean", save_capture_json)
 
     return save_capture_json
 
@@ -1275,20 +1257,7 @@ def validate_capture_dir(capture_dir: Optional[str]) -> str:
     Requirements: 9.1
     """
     # Use default from config if not provided
-    if capture_dir is None:
-        return config.scrape_capture_dir
-
-    # Check type
-    if not isinstance(capture_dir, str):
-        raise create_validation_error(
-            f"Invalid capture_dir type: expected string, got {type(capture_dir).__name__}"
-        )
-
-    # Check not empty
-    if not capture_dir.strip():
-        raise create_validation_error("Invalid capture_dir: cannot be empty")
-
-    return capture_dir
+    return _validate_nonempty_str(capture_dir, "capture_dir", config.scrape_capture_dir)
 
 
 def validate_scrape_status(status: Optional[str]) -> str:
@@ -1312,30 +1281,26 @@ def validate_scrape_status(status: Optional[str]) -> str:
 
     # Check type
     if not isinstance(status, str):
-        raise create_validation_error(
-            f"Invalid status type: expected string, got {type(status).__name__}"
-        )
+        raise _type_error("status", "string", status)
 
     # Check for empty string
     if not status:
         raise create_validation_error("Invalid status: cannot be empty")
 
     # Check for leading/trailing whitespace
-    if status != status.strip():
+    if _has_edge_whitespace(status):
         raise create_validation_error(
             f"Invalid status: '{status}' contains leading or trailing whitespace"
         )
 
     # Check against allowed statuses (case-sensitive)
-    try:
-        JobDbStatus(status)
-    except ValueError:
-        allowed = ", ".join(sorted(s.value for s in JobDbStatus))
+    canonical_status = _JOB_DB_STATUS_CANONICAL.get(status)
+    if canonical_status is None:
         raise create_validation_error(
-            f"Invalid status value: '{status}'. Allowed values are: {allowed}"
+            f"Invalid status value: '{status}'. Allowed values are: {_JOB_DB_STATUS_ALLOWED_TEXT}"
         )
 
-    return status
+    return canonical_status
 
 
 def validate_scrape_jobs_parameters(
@@ -1462,9 +1427,7 @@ def validate_career_tailor_items(items) -> list:
 
     # Check type
     if not isinstance(items, list):
-        raise create_validation_error(
-            f"Invalid items type: expected array, got {type(items).__name__}"
-        )
+        raise _type_error("items", "array", items)
 
     # Check non-empty (Requirement 1.1)
     if len(items) == 0:
@@ -1511,7 +1474,7 @@ def validate_career_tailor_item(item) -> tuple:
         return False, f"Item 'tracker_path' must be a string, got {type(tracker_path).__name__}"
 
     # Check tracker_path is not empty
-    if not tracker_path or not tracker_path.strip():
+    if not tracker_path or tracker_path.isspace():
         return False, "Item 'tracker_path' cannot be empty"
 
     # Validate optional 'job_db_id' field if present (Requirement 1.3)
@@ -1583,40 +1546,16 @@ def validate_career_tailor_batch_parameters(
     validated_force = validate_force(force)
 
     # Validate optional full_resume_path (Requirement 1.4)
-    if full_resume_path is not None:
-        if not isinstance(full_resume_path, str):
-            raise create_validation_error(
-                f"Invalid full_resume_path type: expected string, got {type(full_resume_path).__name__}"
-            )
-        if not full_resume_path.strip():
-            raise create_validation_error("Invalid full_resume_path: cannot be empty")
+    _validate_nonempty_str(full_resume_path, "full_resume_path")
 
     # Validate optional resume_template_path (Requirement 1.4)
-    if resume_template_path is not None:
-        if not isinstance(resume_template_path, str):
-            raise create_validation_error(
-                f"Invalid resume_template_path type: expected string, got {type(resume_template_path).__name__}"
-            )
-        if not resume_template_path.strip():
-            raise create_validation_error("Invalid resume_template_path: cannot be empty")
+    _validate_nonempty_str(resume_template_path, "resume_template_path")
 
     # Validate optional applications_dir (Requirement 1.4)
-    if applications_dir is not None:
-        if not isinstance(applications_dir, str):
-            raise create_validation_error(
-                f"Invalid applications_dir type: expected string, got {type(applications_dir).__name__}"
-            )
-        if not applications_dir.strip():
-            raise create_validation_error("Invalid applications_dir: cannot be empty")
+    _validate_nonempty_str(applications_dir, "applications_dir")
 
     # Validate optional pdflatex_cmd (Requirement 1.4)
-    if pdflatex_cmd is not None:
-        if not isinstance(pdflatex_cmd, str):
-            raise create_validation_error(
-                f"Invalid pdflatex_cmd type: expected string, got {type(pdflatex_cmd).__name__}"
-            )
-        if not pdflatex_cmd.strip():
-            raise create_validation_error("Invalid pdflatex_cmd: cannot be empty")
+    _validate_nonempty_str(pdflatex_cmd, "pdflatex_cmd")
 
     return (
         validated_items,